@@ -386,41 +386,39 @@ class SimpleGoBoard(object):
         return nb_list
 
     def score(self, komi):
-        """ Score """
-        black_score = 0
-        white_score = komi
-        counted = []
-        for x in range(1, self.size+1):
-            for y in range(1, self.size+1):
-                point = coord_to_point(x,y, self.size)
-                if point in counted:
-                    continue
-                color = self.get_color(point)
-                assert color != BORDER
-                if color == BLACK:
-                    black_score += 1
-                    continue
-                if color == WHITE:
-                    white_score += 1
-                    continue
-                empty_block = where1d(self.connected_component(point))
-                black_flag = False
-                white_flag = False
-                for p in empty_block:
-                    counted.append(p)
-                    p_neighbors = self._neighbors(p)
-                    found_black = self.board[p_neighbors]==BLACK
-                    found_white = self.board[p_neighbors]==WHITE
-                    if found_black.any():
-                        black_flag = True
-                    if found_white.any():
-                        white_flag = True
-                    if black_flag and white_flag:
-                        break
-                if black_flag and not white_flag:
-                    black_score += len(empty_block)
-                if white_flag and not black_flag:
-                    white_score += len(empty_block)
+        """
+        Area score: stones, plus empty regions that touch
+        stones of only one color.
+        Each empty region is found once by a flood fill over the
+        neighbor lists, so the cost is linear in the board size.
+        Returns (winner, margin), winner is None for a tie.
+        """
+        colors = self.board.tolist()
+        neighbors = self.neighbors
+        black_score = colors.count(BLACK)
+        white_score = komi + colors.count(WHITE)
+        visited = bytearray(self.maxpoint)
+        for point in where1d(self.board == EMPTY).tolist():
+            if visited[point]:
+                continue
+            visited[point] = 1
+            region = [point]
+            border = EMPTY # BLACK | WHITE once both colors are reached
+            i = 0
+            while i < len(region):
+                for nb in neighbors[region[i]]:
+                    color = colors[nb]
+                    if color == EMPTY:
+                        if not visited[nb]:
+                            visited[nb] = 1
+                            region.append(nb)
+                    else:
+                        border |= color
+                i += 1
+            if border == BLACK:
+                black_score += len(region)
+            elif border == WHITE:
+                white_score += len(region)
 
         if black_score > white_score:
             return BLACK, black_score-white_score
@@ -428,5 +426,4 @@ class SimpleGoBoard(object):
         if white_score > black_score:
             return WHITE, white_score-black_score
 
-        if black_score == white_score:
-            return None, 0
+        return None, 0
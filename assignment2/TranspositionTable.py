@@ -1,14 +1,126 @@
-class TT(object):
-    def __init__(self):
-        self.table = {}
-
-    def __repr__(self):
-        return self.table.__repr__()
-
-    def store(self, code, score):
-        self.table[code] = score
-        
-
-    def lookup(self, code):
-        return self.table.get(code)
-
+"""
+TranspositionTable.py
+
+Fixed size transposition table, stored in numpy arrays.
+The table has 2 slots per bucket, and a hash code goes to
+bucket code % num_buckets:
+- slot 0 keeps the entry with the largest depth (depth-preferred),
+- slot 1 takes any new entry which does not go into slot 0
+  (always-replace).
+So the table never grows past its size in MB, old entries of small
+subtrees are replaced first, and recent entries are always stored.
+
+Values are booleans (minimax) or (phi, delta) pairs of non-negative
+ints below 2**31 (df-pn), packed into one int64.
+The depth is an estimate of the work to recompute the value,
+such as the number of legal moves.
+"""
+
+import numpy as np
+
+"""
+Bytes per entry: key, value, depth and flags
+"""
+ENTRY_BYTES = 8 + 8 + 4
+
+"""
+Flags in the low 8 bits of the info array, the depth is above them
+"""
+USED = 1
+PAIR = 2
+MAX_DEPTH = 2 ** 24 - 1
+
+class TT(object):
+    def __init__(self, size_mb = 64):
+        self.size_mb = size_mb
+        self.num_buckets = max(1, size_mb * 2 ** 20 // (2 * ENTRY_BYTES))
+        self.capacity = 2 * self.num_buckets
+        self.keys = np.zeros(self.capacity, dtype = np.uint64)
+        self.values = np.zeros(self.capacity, dtype = np.int64)
+        self.info = np.zeros(self.capacity, dtype = np.uint32)
+        self.clear_stats()
+
+    def __repr__(self):
+        return "size {}MB capacity {} occupied {} ({:.1%}) " \
+               "lookups {} hits {} stores {} collisions {} " \
+               "replaced {}".format(self.size_mb, self.capacity,
+                                    self.occupied,
+                                    self.occupied / self.capacity,
+                                    self.lookups, self.hits, self.stores,
+                                    self.collisions, self.replaced)
+
+    def clear_stats(self):
+        self.occupied = int(np.count_nonzero(self.info & USED))
+        self.lookups = 0
+        self.hits = 0
+        self.stores = 0
+        self.collisions = 0
+        self.replaced = 0
+
+    def clear(self):
+        """
+        Remove all entries and reset the statistics.
+        """
+        self.info.fill(0)
+        self.clear_stats()
+
+    def store(self, code, score, depth = 0):
+        self.stores += 1
+        depth = min(depth, MAX_DEPTH)
+        if isinstance(score, tuple):
+            value = (score[0] << 32) | score[1]
+            flags = USED | PAIR
+        else:
+            value = int(score)
+            flags = USED
+        slot = 2 * (code % self.num_buckets)
+        other = slot + 1
+        info = int(self.info[slot])
+        other_info = int(self.info[other])
+        other_same = other_info & USED and int(self.keys[other]) == code
+        if info & USED and int(self.keys[slot]) != code:
+            # another position is in the depth-preferred slot
+            self.collisions += 1
+            if not other_info & USED:
+                self.occupied += 1
+            elif not other_same:
+                self.replaced += 1
+            if depth < info >> 8:
+                slot = other
+            else:
+                # it moves down to the always-replace slot
+                self.keys[other] = self.keys[slot]
+                self.values[other] = self.values[slot]
+                self.info[other] = info
+        elif not info & USED:
+            if other_same:
+                # the entry moves up to the depth-preferred slot
+                self.info[other] = 0
+            else:
+                self.occupied += 1
+        self.keys[slot] = code
+        self.values[slot] = value
+        self.info[slot] = (depth << 8) | flags
+
+    def lookup(self, code):
+        self.lookups += 1
+        slot = 2 * (code % self.num_buckets)
+        for i in (slot, slot + 1):
+            info = int(self.info[i])
+            if info & USED and int(self.keys[i]) == code:
+                self.hits += 1
+                value = int(self.values[i])
+                if info & PAIR:
+                    return (value >> 32, value & 0xFFFFFFFF)
+                return value == 1
+        return None
+
+    def results(self, min_depth = 0, max_depth = MAX_DEPTH):
+        """
+        The boolean entries with a depth from min_depth to max_depth,
+        as arrays (keys, values).
+        """
+        depth = self.info >> 8
+        used = (self.info & (USED | PAIR)) == USED
+        used &= (depth >= min_depth) & (depth <= max_depth)
+        return self.keys[used], self.values[used] == 1
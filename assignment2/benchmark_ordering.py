@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+#/usr/local/bin/python3
+# Set the path to your python3 above
+
+"""
+Node counts of the minimax solver with each move ordering, on the
+solve positions of assignment2-public-tests.gtp.
+A node is a call of getLegalMoves. The transposition table is
+cleared and the solved positions store is not used, so every position
+is searched.
+
+Usage: python3 benchmark_ordering.py [test numbers separated by commas]
+"""
+
+import sys
+import time
+import tempfile
+import os
+from gtp_connection import GtpConnection
+from simple_board import SimpleGoBoard
+from solved_store import SolvedStore
+from Nogo import Nogo
+
+ORDERINGS = ['none', 'history', 'pattern', 'all']
+
+def solve_counting(con):
+    """ Solve the current position, returns (result, nodes, seconds) """
+    nodes = [0]
+    getLegalMoves = con.getLegalMoves
+    def counting(gameState):
+        nodes[0] += 1
+        return getLegalMoves(gameState)
+    con.getLegalMoves = counting
+    start = time.time()
+    # the TT is kept between solve calls, start from an empty one
+    con.tt.clear()
+    with tempfile.TemporaryDirectory() as tmp:
+        con.solved_store = SolvedStore(os.path.join(tmp, 'solved.dat'))
+        result = con.solve_cmd([])
+    con.getLegalMoves = getLegalMoves
+    return result, nodes[0], time.time() - start
+
+def benchmark(fileName, tests, time_limit = 100):
+    con = GtpConnection(Nogo(), SimpleGoBoard(7))
+    # no GTP responses
+    con.respond = lambda response = "": None
+    con.time_limit = time_limit
+    totals = {ordering: [0, 0.0] for ordering in ORDERINGS}
+    for line in open(fileName):
+        words = line.split()
+        if not words or words[0].startswith('#') or words[0] == 'timelimit':
+            continue
+        if not words[0].isdigit():
+            con.get_cmd(line.strip())
+            continue
+        if words[1] != 'solve' or (tests and words[0] not in tests):
+            continue
+        for ordering in ORDERINGS:
+            con.get_cmd('ordering ' + ordering)
+            result, nodes, seconds = solve_counting(con)
+            totals[ordering][0] += nodes
+            totals[ordering][1] += seconds
+            print("test {} ordering {}: {} nodes {} {:.2f}s".format(
+                  words[0], ordering, result, nodes, seconds), flush = True)
+    for ordering in ORDERINGS:
+        nodes, seconds = totals[ordering]
+        print("total ordering {}: nodes {} {:.1f}s".format(ordering, nodes,
+                                                          seconds))
+
+def main():
+    tests = sys.argv[1].split(',') if len(sys.argv) > 1 else None
+    benchmark('assignment2-public-tests.gtp', tests)
+
+if __name__ == '__main__':
+    main()
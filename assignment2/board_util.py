@@ -4,6 +4,7 @@ Utility functions for Go board.
 """
 
 import numpy as np
+import random
 
 """
 Encoding of colors on and off a Go board.
@@ -42,6 +43,84 @@ The [0] indexing is needed toextract the result from the singleton tuple.
 def where1d(condition):
     return np.where(condition)[0]
 
+"""
+Seed for the Zobrist keys of get_zobrist_keys
+"""
+ZOBRIST_SEED = 455
+
+_zobrist_keys = {}
+
+def get_zobrist_keys(size):
+    """
+    Zobrist keys for a board of given size, shared by all boards
+    of that size.
+    Returns (zobrist, to_move):
+    zobrist maps each point of the padded 1-d encoding to
+    (0, black key, white key), to_move is the key for white to play.
+    The random 64 bit keys come from a fixed seed per size,
+    so hash codes are the same in every run.
+    """
+    keys = _zobrist_keys.get(size)
+    if keys is None:
+        maxpoint = size * size + 3 * (size + 1)
+        rng = random.Random(ZOBRIST_SEED + size)
+        zobrist = tuple((0, rng.getrandbits(64), rng.getrandbits(64))
+                        for _ in range(maxpoint))
+        keys = (zobrist, rng.getrandbits(64))
+        _zobrist_keys[size] = keys
+    return keys
+
+"""
+Number of symmetries of a square board: 4 rotations, each with
+and without a reflection
+"""
+NUM_SYMMETRIES = 8
+
+_symmetric_zobrist_keys = {}
+
+def get_symmetries(size):
+    """
+    The 8 symmetries of the board as point maps: symmetries[s][point]
+    is the image of an on-board point under symmetry s.
+    Symmetry 0 is the identity. Other points map to 0.
+    """
+    NS = size + 1
+    maxpoint = size * size + 3 * (size + 1)
+    symmetries = []
+    for s in range(NUM_SYMMETRIES):
+        image = [0] * maxpoint
+        for row in range(1, size + 1):
+            for col in range(1, size + 1):
+                r, c = row, col
+                if s & 1:
+                    r, c = c, r
+                if s & 2:
+                    r = size + 1 - r
+                if s & 4:
+                    c = size + 1 - c
+                image[NS * row + col] = NS * r + c
+        symmetries.append(image)
+    return symmetries
+
+def get_symmetric_zobrist_keys(size):
+    """
+    Zobrist keys of a stone seen through each symmetry, for
+    hash codes which are the same for symmetric positions.
+    Returns keys with keys[point][color][s] equal to
+    zobrist[symmetries[s][point]][color], so the hash code of the
+    board transformed by symmetry s can be updated like the normal one.
+    """
+    keys = _symmetric_zobrist_keys.get(size)
+    if keys is None:
+        zobrist, _ = get_zobrist_keys(size)
+        symmetries = get_symmetries(size)
+        keys = tuple(tuple(tuple(zobrist[image[point]][color]
+                                 for image in symmetries)
+                           for color in range(3))
+                     for point in range(len(zobrist)))
+        _symmetric_zobrist_keys[size] = keys
+    return keys
+
 def coord_to_point(row, col, boardsize):
     """
     Transform two dimensional (row, col) representation to array index.
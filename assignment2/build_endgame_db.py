@@ -0,0 +1,91 @@
+#!/usr/bin/python3
+#/usr/local/bin/python3
+# Set the path to your python3 above
+
+"""
+Builds the endgame database of a board size, see endgame_db.py.
+
+All NoGo positions with at most max_moves legal moves are far too many
+to enumerate on 5x5 to 7x7 boards, so the database holds the endgames
+of random games instead. Each game is played to the end with random
+legal moves, then solved backwards from its last position: every
+position with at most max_moves legal moves is solved by the minimax
+solver, whose transposition table already holds the later positions
+of the game. All solved positions in the table with at most max_moves
+legal moves go into the database, not only those of the game.
+
+An existing database of the same size is extended, and is probed
+during the search like in the solve command.
+
+Usage: python3 build_endgame_db.py size max_moves games [seconds]
+seconds is the time limit to solve one position, positions which
+are not solved in time are left out.
+"""
+
+import sys
+import random
+import time
+from gtp_connection import GtpConnection, ENDGAME_DB_DIR
+from simple_board import SimpleGoBoard
+from endgame_db import database_path, write_endgame_db
+from deadline import Deadline, TimeException
+from Nogo import Nogo
+
+def solve_position(con, board, seconds):
+    """ Whether the player to move on board wins, None on timeout """
+    con.originalPlayer = board.current_player
+    con.deadline = Deadline(seconds)
+    con.regions.deadline = con.deadline
+    con.ply = 0
+    try:
+        return con.minmax_bool_or(board)
+    except TimeException:
+        return None
+
+def random_game(con, board):
+    """ Play random legal moves to the end, returns the moves """
+    moves = []
+    while True:
+        legalMoves = con.getLegalMoves(board)
+        if not legalMoves:
+            return moves
+        move = random.choice(legalMoves)
+        board.play_unchecked(move, board.current_player)
+        moves.append(move)
+
+def build(size, max_moves, games, seconds):
+    con = GtpConnection(Nogo(), SimpleGoBoard(size))
+    results = {}
+    db = con.endgame_db
+    if db is not None:
+        if db.max_moves != max_moves:
+            sys.exit("{} has max_moves {}".format(db.path, db.max_moves))
+        wins = (db.entries & 1).astype(bool)
+        results.update(zip(db.entries.tolist(), wins.tolist()))
+    start = time.time()
+    for game in range(games):
+        board = SimpleGoBoard(size)
+        moves = random_game(con, board)
+        unsolved = 0
+        for move in reversed(moves):
+            board.undo_unchecked(move)
+            if len(con.getLegalMoves(board)) <= max_moves:
+                if solve_position(con, board, seconds) is None:
+                    unsolved += 1
+        keys, wins = con.tt.results(1, max_moves)
+        results.update(zip(keys.tolist(), wins.tolist()))
+        print("game {}: {} moves, {} not solved, {} positions {:.1f}s"
+              .format(game + 1, len(moves), unsolved, len(results),
+                      time.time() - start), flush = True)
+    path = database_path(ENDGAME_DB_DIR, size)
+    # entries and keys of the database differ in the lowest bit only,
+    # write_endgame_db keeps one per key
+    write_endgame_db(path, size, max_moves, list(results.keys()),
+                     list(results.values()))
+    print("wrote {} positions to {}".format(len(results), path))
+
+if __name__ == '__main__':
+    if len(sys.argv) < 4:
+        sys.exit(__doc__)
+    seconds = float(sys.argv[4]) if len(sys.argv) > 4 else 10
+    build(int(sys.argv[1]), int(sys.argv[2]), int(sys.argv[3]), seconds)
@@ -0,0 +1,114 @@
+"""
+cgt.py
+
+Values of short partizan games in canonical form, for adding up the
+values of independent regions of a NoGo position.
+NoGo is a normal play game: the player who cannot move loses.
+BLACK is Left and WHITE is Right.
+
+A game is an int id into GameTable, which interns canonical forms,
+so two games are equal if and only if their ids are equal.
+Canonical forms are computed as in Winning Ways: dominated options
+are removed and reversible options are bypassed.
+"""
+
+class GameTable(object):
+
+    def __init__(self):
+        # options[g] = (Left options, Right options), as sorted tuples
+        self.options = []
+        self.index = {}
+        self.le_table = {}
+        self.sum_table = {}
+        self.zero = self._intern((), ())
+
+    def __len__(self):
+        return len(self.options)
+
+    def _intern(self, left, right):
+        key = (tuple(sorted(set(left))), tuple(sorted(set(right))))
+        g = self.index.get(key)
+        if g is None:
+            g = len(self.options)
+            self.options.append(key)
+            self.index[key] = g
+        return g
+
+    def le(self, g, h):
+        """
+        g <= h: Right wins g - h when Left moves first, that is,
+        no Left option of g is >= h and no Right option of h is <= g.
+        """
+        if g == h:
+            return True
+        key = (g, h)
+        result = self.le_table.get(key)
+        if result is None:
+            gl, _ = self.options[g]
+            _, hr = self.options[h]
+            result = not any(self.le(h, x) for x in gl) \
+                     and not any(self.le(x, g) for x in hr)
+            self.le_table[key] = result
+        return result
+
+    def game(self, left, right):
+        """
+        The canonical game {left | right}, for canonical options.
+        """
+        left = set(left)
+        right = set(right)
+        while True:
+            # remove dominated options
+            left = {x for x in left
+                    if not any(y != x and self.le(x, y) for y in left)}
+            right = {x for x in right
+                     if not any(y != x and self.le(y, x) for y in right)}
+            g = self._intern(left, right)
+            # bypass reversible options
+            changed = False
+            for x in list(left):
+                for xr in self.options[x][1]:
+                    if self.le(xr, g):
+                        left.remove(x)
+                        left.update(self.options[xr][0])
+                        changed = True
+                        break
+                if changed:
+                    break
+            if not changed:
+                for x in list(right):
+                    for xl in self.options[x][0]:
+                        if self.le(g, xl):
+                            right.remove(x)
+                            right.update(self.options[xl][1])
+                            changed = True
+                            break
+                    if changed:
+                        break
+            if not changed:
+                return g
+
+    def add(self, g, h):
+        """
+        The sum g + h.
+        """
+        if g == self.zero:
+            return h
+        if h == self.zero:
+            return g
+        key = (g, h) if g < h else (h, g)
+        result = self.sum_table.get(key)
+        if result is None:
+            gl, gr = self.options[g]
+            hl, hr = self.options[h]
+            left = [self.add(x, h) for x in gl] + [self.add(g, x) for x in hl]
+            right = [self.add(x, h) for x in gr] + [self.add(g, x) for x in hr]
+            result = self.game(left, right)
+            self.sum_table[key] = result
+        return result
+
+    def left_wins_moving_first(self, g):
+        return not self.le(g, self.zero)
+
+    def right_wins_moving_first(self, g):
+        return not self.le(self.zero, g)
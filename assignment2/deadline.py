@@ -0,0 +1,39 @@
+"""
+deadline.py
+
+Cooperative time limit for the solvers. The search calls check()
+once per node, and check() looks at the clock every CHECK_INTERVAL
+calls. After the deadline it raises TimeException, which the search
+lets through after undoing its moves, so the board is restored and
+the transposition table keeps what was proven.
+"""
+
+import time
+
+"""
+Number of nodes between two looks at the clock
+"""
+CHECK_INTERVAL = 256
+
+class TimeException(Exception):
+    pass
+
+class Deadline(object):
+
+    def __init__(self, seconds, interval = CHECK_INTERVAL):
+        self.end = time.time() + seconds
+        self.interval = interval
+        self.count = 0
+
+    def remaining(self):
+        """
+        Seconds left, 0 after the deadline.
+        """
+        return max(0.0, self.end - time.time())
+
+    def check(self):
+        self.count += 1
+        if self.count >= self.interval:
+            self.count = 0
+            if time.time() >= self.end:
+                raise TimeException
@@ -0,0 +1,191 @@
+"""
+dfpn.py
+
+Depth-first proof-number search (df-pn) for NoGo.
+
+Proof and disproof numbers are kept from the point of view of the
+player to move in each position (the phi/delta formulation):
+    phi   = proof number: how hard it is to prove a win for the player
+            to move, 0 if proven, INFINITY if disproven
+    delta = disproof number: how hard it is to prove a loss
+The player to move wins if some move leads to a loss for the opponent:
+    phi(n)   = min over children c of delta(c)
+    delta(n) = max over children c of phi(c), plus 1 for each other
+               child that is not proven yet (weak proof numbers)
+The weak form of delta does not count the same position twice when
+it is reached by different move orders, which the plain sum of the
+children does a lot in NoGo.
+In NoGo the player to move loses if there is no legal move.
+
+Results are stored in a TT keyed by the canonical hash code of the
+board (see SimpleGoBoard.canonical_hash), as (phi, delta) pairs, so
+symmetric positions share their entry. NoGo positions cannot repeat, so the search
+graph has no cycles.
+"""
+
+INFINITY = 10 ** 9
+
+"""
+1 + epsilon trick: stay in a child until its delta is EPSILON times
+the second best, to avoid switching back and forth between children
+with similar numbers.
+"""
+EPSILON = 2.0
+
+class DfpnSolver(object):
+
+    def __init__(self, legal_moves, tt, deadline = None, stats = None,
+                 ply = 0):
+        """
+        legal_moves(board): list of the legal moves of the player to move
+        tt: transposition table for the (phi, delta) pairs
+        deadline: checked at each node (see deadline.py), or None
+        stats: SolveStats counting the nodes below the position to solve
+            and the legal move generation, or None (see solve_stats.py)
+        ply: ply of the position to solve, for stats
+        """
+        self.legal_moves = legal_moves
+        self.tt = tt
+        self.deadline = deadline
+        self.stats = stats
+        self.ply = ply
+        self.nodes = 0
+
+    def solve(self, board):
+        """
+        Solve the position for the player to move.
+        The board is changed during the search, and restored at the end,
+        also when the deadline raises TimeException.
+        Returns (win, move): whether the player to move wins, and
+        a winning move if there is one.
+        """
+        phi, delta = self._mid(board, INFINITY, INFINITY)
+        if phi != 0:
+            return False, None
+        moves = self.legal_moves(board)
+        values = self._children(self._child_codes(board, moves), len(moves))
+        for move, (_, child_delta) in zip(moves, values):
+            if child_delta == 0:
+                return True, move
+        # the proof of the winning child was replaced in a full TT:
+        # search the children again
+        color = board.current_player
+        for move in moves:
+            self._play(board, move, color)
+            try:
+                _, child_delta = self._mid(board, INFINITY, INFINITY)
+            finally:
+                self._undo(board, move)
+            if child_delta == 0:
+                return True, move
+        assert False, "proven node without a winning move"
+
+    def root_status(self, board):
+        """
+        What is known about the moves of the player to move, after a
+        search which did not finish. Returns a dict from each move to
+        True (proven win), False (proven loss) or None (unknown),
+        in order of the delta of the child, most promising first.
+        """
+        moves = self.legal_moves(board)
+        values = self._children(self._child_codes(board, moves), len(moves))
+        status = {}
+        for i in sorted(range(len(moves)), key = lambda i: values[i][1]):
+            child_phi, child_delta = values[i]
+            if child_delta == 0:
+                status[moves[i]] = True
+            elif child_phi == 0:
+                status[moves[i]] = False
+            else:
+                status[moves[i]] = None
+        return status
+
+    def _child_codes(self, board, moves):
+        """
+        Canonical hash codes of the positions after each move,
+        computed without playing the moves.
+        """
+        color = board.current_player
+        return [board.canonical_hash_after(move, color) for move in moves]
+
+    def _children(self, codes, num_moves, known = None):
+        """
+        (phi, delta) of each child, from the TT if it is there, else
+        from known, the values found before, if given.
+        New children start with phi 1 and delta num_moves - 1, the
+        number of moves the opponent will have, approximately.
+        """
+        new = (1, max(1, num_moves - 1))
+        values = []
+        for i, code in enumerate(codes):
+            value = self.tt.lookup(code)
+            if value is None:
+                value = known[i] if known is not None else new
+            values.append(value)
+        return values
+
+    def _mid(self, board, th_phi, th_delta):
+        """
+        Multiple iterative deepening: search the position until its
+        phi reaches th_phi or its delta reaches th_delta.
+        Returns (phi, delta), which are also stored in the TT.
+        """
+        self.nodes += 1
+        if self.deadline is not None:
+            self.deadline.check()
+        moves = self.legal_moves(board)
+        if self.stats is not None:
+            self.stats.generated(self.ply, len(moves))
+        if not moves:
+            self.tt.store(board.canonical_hash(), (INFINITY, 0), 0)
+            return INFINITY, 0
+        color = board.current_player
+        codes = self._child_codes(board, moves)
+        # the values of the children are kept here too: when the TT is
+        # full, a child searched before can be replaced by its subtree,
+        # and starting it over would never end
+        values = None
+        while True:
+            values = self._children(codes, len(moves), values)
+            phi = min(delta for _, delta in values)
+            open_phis = [phi for phi, _ in values if phi != 0]
+            delta = 0
+            if open_phis:
+                max_phi = max(open_phis)
+                delta = min(INFINITY, max_phi + len(open_phis) - 1)
+            if phi >= th_phi or delta >= th_delta:
+                self.tt.store(board.canonical_hash(), (phi, delta),
+                              len(moves))
+                return phi, delta
+            # most proving child: the smallest delta, and the second
+            # smallest delta for the threshold
+            best = 0
+            delta_2 = INFINITY
+            for i in range(1, len(values)):
+                if values[i][1] < values[best][1]:
+                    delta_2 = values[best][1]
+                    best = i
+                elif values[i][1] < delta_2:
+                    delta_2 = values[i][1]
+            # the child may grow its phi until the delta of this node
+            # reaches th_delta
+            child_th_phi = th_delta - delta + max_phi
+            child_th_delta = min(th_phi, int(delta_2 * EPSILON) + 1)
+            self._play(board, moves[best], color)
+            try:
+                values[best] = self._mid(board, child_th_phi, child_th_delta)
+            finally:
+                self._undo(board, moves[best])
+
+    def _play(self, board, move, color):
+        """
+        Play move to search the position after it, which is a node
+        """
+        board.play_unchecked(move, color)
+        self.ply += 1
+        if self.stats is not None:
+            self.stats.node(self.ply)
+
+    def _undo(self, board, move):
+        board.undo_unchecked(move)
+        self.ply -= 1
@@ -15,20 +15,38 @@ import numpy as np
 import re
 import time
 import random
-import signal
+import os
+import multiprocessing
 from TranspositionTable import TT
+from dfpn import DfpnSolver
+from solved_store import SolvedStore, store_path
+from move_ordering import MoveOrdering, load_weights
+from deadline import Deadline, TimeException
+from regions import RegionSolver
+from endgame_db import load_endgame_db, database_path
+from solve_stats import SolveStats
 
-class TimeException(Exception):
-    pass
+"""
+Directory of the files of the positions solved by earlier solve commands,
+one per board size, see solved_store.py
+"""
+SOLVED_STORE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-def handler(signum, frame):
-    raise TimeException
+"""
+3x3 pattern weights for the move ordering prior, see move_ordering.py
+"""
+WEIGHTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            'weights')
 
-signal.signal(signal.SIGALRM, handler)
+"""
+Directory of the endgame databases, one per board size, see endgame_db.py
+and build_endgame_db.py
+"""
+ENDGAME_DB_DIR = os.path.dirname(os.path.abspath(__file__))
 
 class GtpConnection():
 
-    def __init__(self, go_engine, board, debug_mode = False):
+    def __init__(self, go_engine, board, debug_mode = False, settings = None):
         """
         Manage a GTP connection for a Go-playing engine
 
@@ -38,11 +56,33 @@ class GtpConnection():
             a program that can reply to a set of GTP commandsbelow
         board: 
             Represents the current board state.
+        settings:
+            Settings of the solver of another connection, see solverSettings.
+            Only for a connection which solves root moves in a worker
+            process of call_parallel, it has no solved positions store.
         """
         self._debug_mode = debug_mode
         self.go_engine = go_engine
         self.board = board
         self.time_limit = 1
+        self.solver = 'minmax'
+        self.workers = 1
+        self.ply = 0
+        if settings == None:
+            #regions are off by default: they only pay off in positions
+            #which split into regions. Counters are off too
+            settings = (64, MoveOrdering(), False,
+                        database_path(ENDGAME_DB_DIR, board.size), False)
+            self.solved_store = SolvedStore(store_path(SOLVED_STORE_DIR, board.size))
+        else:
+            self.solved_store = None
+        self.tt_size, self.ordering, self.useRegions, endgamePath, countStats = settings
+        self.tt = TT(self.tt_size)
+        self.regions = RegionSolver(lambda gameState, m, cp:
+                           self.checkMoveLegality(m, gameState, cp, BLACK + WHITE - cp))
+        self.endgame_db = load_endgame_db(endgamePath) if endgamePath != None else None
+        #<---Counters of the solver, None when they are off--->
+        self.stats = SolveStats() if countStats else None
         self.commands = {
             "protocol_version": self.protocol_version_cmd,
             "quit": self.quit_cmd,
@@ -58,6 +98,13 @@ class GtpConnection():
             "play": self.play_cmd,
             "solve": self.solve_cmd,
             "timelimit": self.time_limit_cmd,
+            "solver": self.solver_cmd,
+            "tt_size": self.tt_size_cmd,
+            "tt_stats": self.tt_stats_cmd,
+            "solve_stats": self.solve_stats_cmd,
+            "workers": self.workers_cmd,
+            "ordering": self.ordering_cmd,
+            "regions": self.regions_cmd,
             "legal_moves": self.legal_moves_cmd,
             "gogui-rules_game_id": self.gogui_rules_game_id_cmd,
             "gogui-rules_board_size": self.gogui_rules_board_size_cmd,
@@ -79,6 +126,11 @@ class GtpConnection():
             "known_command": (1, 'Usage: known_command CMD_NAME'),
             "genmove": (1, 'Usage: genmove {w,b}'),
             "timelimit":(1, 'Usage: timelimit INT'),
+            "solver": (1, 'Usage: solver {minmax,dfpn}'),
+            "tt_size": (1, 'Usage: tt_size MB'),
+            "workers": (1, 'Usage: workers INT'),
+            "ordering": (1, 'Usage: ordering {none,history,pattern,all}'),
+            "regions": (1, 'Usage: regions {on,off}'),
             "play": (2, 'Usage: play {b,w} MOVE'),
             "legal_moves": (1, 'Usage: legal_moves {w,b}')
             
@@ -162,6 +214,12 @@ class GtpConnection():
         Reset the board to empty board of given size
         """
         self.board.reset(size)
+        #<---The TT is kept between solve calls of one game only--->
+        self.tt.clear()
+        self.regions.clear()
+        #<---Hash codes do not include the board size--->
+        self.solved_store = SolvedStore(store_path(SOLVED_STORE_DIR, size))
+        self.endgame_db = load_endgame_db(database_path(ENDGAME_DB_DIR, size))
 
     def board2d(self):
         return str(GoBoardUtil.get_twoD_board(self.board))
@@ -284,7 +342,12 @@ class GtpConnection():
                 else:
                     self.respond("resign")
             else: #generate random move
-                move = self.go_engine.get_move(self.board, color)
+                promising = self.promisingMove()
+                if output == "unknown" and promising is not None:
+                    #<---The solver did not finish: play its most promising move--->
+                    move = promising
+                else:
+                    move = self.go_engine.get_move(self.board, color)
                 move_coord = point_to_coord(move, self.board.size)
                 move_as_string = format_point(move_coord).lower()
                 if self.board.is_legal(move, color):
@@ -376,16 +439,15 @@ class GtpConnection():
                      )
 
     def undo(self, move, gameState):
-        #This method undoes a previously played move for a given gameState. Resets the current player as well
-        gameState.board[move] = EMPTY
-        cp = gameState.current_player
-        gameState.current_player = WHITE + BLACK - cp
+        #This method undoes a previously played move for a given gameState. Resets the current player and the hash as well
+        gameState.undo_unchecked(move)
+        self.ply -= 1
 
     def skip_checks_play(self, move, color, gameState):
         #This method plays a move on the board without checking if it is legal
         #Only pass this method legal moves. Changes the current player to the opponent.
-        gameState.board[move] = color
-        gameState.current_player = WHITE + BLACK - color
+        gameState.play_unchecked(move, color)
+        self.ply += 1
 
     def time_limit_cmd(self, args):
         #This method sets the timelimit. 
@@ -393,173 +455,359 @@ class GtpConnection():
         self.time_limit = int(args[0])
         self.respond()
 
+    def solver_cmd(self, args):
+        #This method selects the search used by solve and genmove:
+        #boolean minimax or depth-first proof-number search
+        assert args[0] == 'minmax' or args[0] == 'dfpn'
+        if args[0] != self.solver:
+            #<---The solvers store different values in the TT--->
+            self.tt.clear()
+        self.solver = args[0]
+        self.respond()
+
+    def tt_size_cmd(self, args):
+        #This method sets the memory of the transposition table in MB.
+        #The new table starts empty
+        assert 1 <= int(args[0]) <= 4096
+        self.tt_size = int(args[0])
+        self.tt = TT(self.tt_size)
+        self.respond()
+
+    def workers_cmd(self, args):
+        #This method sets the number of processes used by solve and genmove.
+        #With more than 1, the root moves are split between the processes
+        assert 1 <= int(args[0]) <= 64
+        self.workers = int(args[0])
+        self.respond()
+
+    def ordering_cmd(self, args):
+        #This method selects the move ordering of the minimax solver:
+        #board order, killers and history, pattern weights, or all of them
+        assert args[0] in ('none', 'history', 'pattern', 'all')
+        useHistory = args[0] in ('history', 'all')
+        weights = None
+        if args[0] in ('pattern', 'all'):
+            weights = load_weights(WEIGHTS_PATH)
+        self.ordering = MoveOrdering(useHistory, useHistory, weights)
+        self.respond()
+
+    def regions_cmd(self, args):
+        #This method turns the region analysis of the minimax solver on or off
+        assert args[0] == 'on' or args[0] == 'off'
+        self.useRegions = args[0] == 'on'
+        self.respond()
+
+    def tt_stats_cmd(self, args):
+        #This method shows occupancy of the transposition table, and
+        #lookup and collision counts of the last solve
+        self.respond(str(self.tt))
+
+    def solve_stats_cmd(self, args):
+        #This method shows the counters of the last solve, see solve_stats.py.
+        #solve_stats on [SECONDS] turns them on, with a progress line on
+        #stderr every SECONDS, solve_stats off turns them off
+        if len(args) == 0:
+            if self.stats == None:
+                self.error('solve stats are off, use solve_stats on')
+            else:
+                self.respond('\n' + self.stats.report(self.tt))
+            return
+        if args[0] == 'on' and len(args) <= 2:
+            self.stats = SolveStats(float(args[1]) if len(args) == 2 else 0)
+        elif args[0] == 'off' and len(args) == 1:
+            self.stats = None
+        else:
+            self.error('Usage: solve_stats [on [SECONDS]|off]')
+            return
+        self.respond()
+
     def solve_cmd(self, args):
         
         response = True
         if args == 'genmove':
             response = False
 
-        signal.alarm(self.time_limit)
+        #<---The search checks the deadline, and stops with TimeException--->
+        self.deadline = Deadline(self.time_limit)
+        self.rootStatus = {}
         foundResult = False
         self.originalPlayer = self.board.current_player
         rootState = self.board.copy()
-        self.pValues = {}
-        for move in range(len(rootState.board)):
-            if rootState.board[move] != BORDER:
-                self.pValues[move] = self.getP(move)
         
         try:
-            #<---init for transposition table--->
-            self.maxSize = self.board.size * self.board.size
-            self.zobrist_init(rootState) #<---self.hash is created in here
-            self.tt = TT()
+            #<---The transposition table is keyed by the canonical board hash,
+            #so symmetric positions share their entry. It keeps the positions
+            #solved by earlier calls in this game--->
+            self.tt.clear_stats()
+            self.ordering.clear()
+            self.regions.deadline = self.deadline
+            self.ply = 0
+            if self.stats != None:
+                self.stats.clear()
+                self.stats.node(self.ply)
 
             remainingMoves = self.getLegalMoves(rootState)
             remainingCount = len(remainingMoves)
 
+            rootHash = rootState.hash
+            #<---Positions solved before, by this or an earlier run--->
+            stored = self.solved_store.lookup(rootHash)
+
             if self.isTerminal(remainingCount):
                 #<---If a move is terminal right away, we assume we are in P-Position--->
-                result = 'b' if self.originalPlayer == WHITE else 'w'
-                foundResult = True
+                move = None
+
+            elif stored is not None:
+                isWin, move = stored
 
             else:
-                result = self.call_minMax(rootState, remainingMoves)
-                if result != False :
-                    foundResult = True
-            
+                if self.workers > 1:
+                    move = self.call_parallel(rootState, remainingMoves)
+                elif self.solver == 'dfpn':
+                    move = self.call_dfpn(rootState)
+                else:
+                    move = self.call_minMax(rootState, remainingMoves)
+                self.solved_store.store(rootHash, move is not None, move)
+
+            if move is not None:
+                foundResult = True
+                winningColor = 'b' if self.originalPlayer == BLACK else 'w'
+                winningMove = format_point(point_to_coord(move, self.board.size))
+                result = '{} {}'.format(winningColor, winningMove.lower())
+
             if not foundResult: 
                 result = 'b' if self.originalPlayer == WHITE else 'w'
             
-        except:
+        except TimeException:
+            #<---What was proven is kept in the TT and in self.rootStatus--->
             result = 'unknown'
+
+        if self.stats != None:
+            self.stats.finish()
         
         if response:
             self.respond(result)    
         
-        signal.alarm(0)
         return result
+
+    def promisingMove(self):
+        #Best move found by the last solve, also if it did not finish:
+        #a winning move, or else the first unresolved root move in search
+        #order. None if all root moves lose
+        for move, isWin in self.rootStatus.items():
+            if isWin:
+                return move
+        for move, isWin in self.rootStatus.items():
+            if isWin is None:
+                return move
+        return None
         
 
+    def call_dfpn(self, gameState):
+        #Same result as call_minMax, found by proof-number search.
+        #The TT holds (proof, disproof) numbers instead of booleans
+        solver = DfpnSolver(self.legalMoves, self.tt, self.deadline,
+                            self.stats, self.ply)
+        try:
+            isWin, move = solver.solve(gameState)
+        except TimeException:
+            self.rootStatus = solver.root_status(gameState)
+            raise
+        self.rootStatus = {move: True} if isWin else {}
+        return move
+
+    def solverSettings(self):
+        #Settings of the solver, to build the solver of a worker process of
+        #call_parallel: (tt_size, ordering, useRegions, path of the endgame
+        #database or None, whether to count stats)
+        endgamePath = self.endgame_db.path if self.endgame_db != None else None
+        return (self.tt_size, self.ordering, self.useRegions, endgamePath,
+                self.stats != None)
+
+    def call_parallel(self, gameState, remainingMoves):
+        #Root split: each root move is solved in a worker process with the
+        #selected solver. The pool is terminated, stopping the other
+        #workers, as soon as one move is proven to win, or on timeout
+        tasks = [(gameState, move, self.originalPlayer, self.solver,
+                  self.deadline) for move in remainingMoves]
+        self.rootStatus = {move: None for move in remainingMoves}
+        with multiprocessing.Pool(self.workers, init_root_worker,
+                                  (gameState, self.solverSettings())) as pool:
+            results = pool.imap_unordered(solve_root_move, tasks)
+            for _ in tasks:
+                try:
+                    move, isWin, stats = results.next(self.deadline.remaining())
+                except multiprocessing.TimeoutError:
+                    raise TimeException
+                if self.stats != None:
+                    self.stats.add(stats)
+                self.rootStatus[move] = isWin
+                if isWin:
+                    return move
+        return None
+
     def call_minMax(self, gameState, remainingMoves):
+        remainingMoves = self.ordering.order(gameState, remainingMoves,
+                                             self.originalPlayer, self.ply)
+        #<---Result of each root move, None until it is solved--->
+        self.rootStatus = {move: None for move in remainingMoves}
         for move in remainingMoves:
 
-            oldHash = self.playMove(move, self.originalPlayer, gameState)
-
-            isWin = self.minmax_bool_and(gameState)
+            self.playMove(move, self.originalPlayer, gameState)
+            try:
+                isWin = self.minmax_bool_and(gameState)
+            finally:
+                self.undo(move, gameState)
+            self.rootStatus[move] = isWin
 
             if isWin:
+                #<---Returns the winning move, or None if there is none--->
+                return move
 
-                winningColor = 'b' if self.originalPlayer == BLACK else 'w'
-                winningMove = format_point(point_to_coord(move, self.board.size))
-                response = '{} {}'.format(winningColor, winningMove.lower())
-                
-                return response
-
-            self.undo(move, gameState)
-            self.hash = oldHash
-
-        return False
+        return None
 
 
     #<---Trying to implement an and or version here --->
     def minmax_bool_or(self, gameState):
         #<---Check the transposition table if this node has been found --->
-        result = self.tt.lookup(self.hash)
+        code = gameState.canonical_hash()
+        currentPlayer = gameState.current_player
+        if self.stats != None:
+            self.stats.node(self.ply)
+        result = self.lookupResult(code, currentPlayer)
         if result != None:
             return result
+        self.deadline.check()
 
-        currentPlayer = gameState.current_player
 
         remainingMoves = self.getLegalMoves(gameState)
         remainingCount = len(remainingMoves)
         terminalState = self.isTerminal(remainingCount)
 
         if terminalState:
-            return self.storeResult(self.hash, self.evaluation(currentPlayer, remainingCount))
-        
+            return self.storeResult(code, self.evaluation(currentPlayer, remainingCount), remainingCount, currentPlayer)
+
+        result = self.endgameResult(code, currentPlayer, remainingCount)
+        if result != None:
+            return self.storeResult(code, result, remainingCount, currentPlayer)
+
+        if self.useRegions:
+            result, remainingMoves = self.regionResult(gameState, currentPlayer, remainingMoves)
+            if result != None:
+                return self.storeResult(code, result, remainingCount, currentPlayer)
+
+        remainingMoves = self.ordering.order(gameState, remainingMoves,
+                                             currentPlayer, self.ply)
         for move in remainingMoves:
-            oldHash = self.playMove(move, currentPlayer, gameState)
-            #<---call minmax AND node--->
-            isWin = self.minmax_bool_and(gameState)
-        
-            #<---Revert the hash and gameState back to the previous value--->
-            self.undo(move, gameState)
-            self.hash = oldHash
+            self.playMove(move, currentPlayer, gameState)
+            try:
+                #<---call minmax AND node--->
+                isWin = self.minmax_bool_and(gameState)
+            finally:
+                #<---Revert the gameState (and its hash) back to the previous value,
+                #also on timeout--->
+                self.undo(move, gameState)
 
             if isWin:
-                return self.storeResult(self.hash, True)
+                self.ordering.cutoff(move, currentPlayer, self.ply, remainingCount)
+                if self.stats != None:
+                    self.stats.cutoff()
+                return self.storeResult(code, True, remainingCount, currentPlayer)
 
-        return self.storeResult(self.hash, False)
+        return self.storeResult(code, False, remainingCount, currentPlayer)
 
 
     def minmax_bool_and(self, gameState):
         #<---Check the transposition table if this node has been found--->
-        result = self.tt.lookup(self.hash)
+        code = gameState.canonical_hash()
+        currentPlayer = gameState.current_player
+        if self.stats != None:
+            self.stats.node(self.ply)
+        result = self.lookupResult(code, currentPlayer)
         if result != None:
             return result
+        self.deadline.check()
             
-        currentPlayer = gameState.current_player
         remainingMoves = self.getLegalMoves(gameState)
         remainingCount = len(remainingMoves)
         terminalState = self.isTerminal(remainingCount)
 
         if terminalState:
-            return self.storeResult(self.hash, self.evaluation(currentPlayer, remainingCount))
-        
+            return self.storeResult(code, self.evaluation(currentPlayer, remainingCount), remainingCount, currentPlayer)
+
+        result = self.endgameResult(code, currentPlayer, remainingCount)
+        if result != None:
+            return self.storeResult(code, result, remainingCount, currentPlayer)
+
+        if self.useRegions:
+            result, remainingMoves = self.regionResult(gameState, currentPlayer, remainingMoves)
+            if result != None:
+                return self.storeResult(code, result, remainingCount, currentPlayer)
+
+        remainingMoves = self.ordering.order(gameState, remainingMoves,
+                                             currentPlayer, self.ply)
         for move in remainingMoves:
-            oldHash = self.playMove(move, currentPlayer, gameState)
-            #<---Call minmax OR node--->
-            isWin = self.minmax_bool_or(gameState)
-        
-            #<---Revert the hash and gameState back to the previous value--->
-            self.undo(move, gameState)
-            self.hash = oldHash
+            self.playMove(move, currentPlayer, gameState)
+            try:
+                #<---Call minmax OR node--->
+                isWin = self.minmax_bool_or(gameState)
+            finally:
+                #<---Revert the gameState (and its hash) back to the previous value,
+                #also on timeout--->
+                self.undo(move, gameState)
 
             if not isWin:
-                return self.storeResult(self.hash, False)
-
-        return self.storeResult(self.hash, True)
+                self.ordering.cutoff(move, currentPlayer, self.ply, remainingCount)
+                if self.stats != None:
+                    self.stats.cutoff()
+                return self.storeResult(code, False, remainingCount, currentPlayer)
+
+        return self.storeResult(code, True, remainingCount, currentPlayer)
+
+    def endgameResult(self, code, currentPlayer, remainingCount):
+        #Whether originalPlayer wins, from the endgame database.
+        #None if there is no database or the position is not in it
+        if self.endgame_db == None or remainingCount > self.endgame_db.max_moves:
+            return None
+        toPlayWins = self.endgame_db.lookup(code)
+        if toPlayWins == None:
+            return None
+        return toPlayWins == (currentPlayer == self.originalPlayer)
+
+    def regionResult(self, gameState, currentPlayer, remainingMoves):
+        #Late endgames made of independent regions, see regions.py.
+        #Returns (result, remainingMoves): result is whether originalPlayer wins
+        #if the sum of the regions decides it, else None. remainingMoves leaves
+        #out the moves in regions which add up to 0
+        toPlayWins, points = self.regions.analyze(gameState)
+        if toPlayWins != None:
+            return toPlayWins == (currentPlayer == self.originalPlayer), remainingMoves
+        if points != None:
+            remainingMoves = [m for m in remainingMoves if m in points]
+            if self.isTerminal(len(remainingMoves)):
+                return self.evaluation(currentPlayer, 0), remainingMoves
+        return None, remainingMoves
 
     def playMove(self, move, currentPlayer, gameState):
-        #This method saves the current hash and returns it.
-        #Does all the necessary steps to simulate playing a move. 
-        oldHash = self.hash
+        #Does all the necessary steps to simulate playing a move.
+        #The board updates its hash code.
         self.skip_checks_play(move, currentPlayer, gameState)
-        p = self.pValues[move]
-        self.updateHash(self.hash, self.zobristArray[p][currentPlayer], self.zobristArray[p][0])
-        return oldHash
 
-    def storeResult(self, newHash, result):
-        self.tt.store(newHash, result)
+    def storeResult(self, newHash, result, numMoves, currentPlayer):
+        #result is whether originalPlayer wins. The TT stores whether the
+        #player to move wins, so entries stay valid in later solve calls.
+        #numMoves is the depth of the entry: entries with more moves
+        #are kept when the table is full
+        self.tt.store(newHash, result == (currentPlayer == self.originalPlayer),
+                      numMoves)
         return result
 
-    def getP(self,move):
-        #<---takes a move and turns it into p without borders--->
-        coord = point_to_coord(move, self.board.size)
-        return (coord[1]-1)+(coord[0]-1)*self.board.size
-
-    def updateHash(self, oldHash, XORin, XORout):
-        self.hash = oldHash ^ XORin ^XORout
-
-    def zobrist_init(self, gameState):
-        # This method creates self.hash and self.zobristArray
-        # prepares them for use
-
-        #<--- populate the zobrist array with 3 random numbers per board space (3 possible states 0, 1, 2)--->
-        self.zobristArray = []
-        for _ in range(self.maxSize):
-            self.zobristArray.append([random.getrandbits(64) for _ in range(3)])
-
-        #<---Calculate the initial hash value of the board (ignores borders)--->
-        self.hash = 0 
-        count = 0 
-        for point in gameState.board:
-            if point != BORDER:
-                if count == 0:
-                    self.hash = self.zobristArray[count][point]
-                else:
-                    self.hash = self.hash ^ self.zobristArray[count][point]
-                count += 1
+    def lookupResult(self, newHash, currentPlayer):
+        #Whether originalPlayer wins, from the TT. None if not found
+        toPlayWins = self.tt.lookup(newHash)
+        if toPlayWins == None:
+            return None
+        return toPlayWins == (currentPlayer == self.originalPlayer)
 
     def evaluation(self ,currentPlayer, remainingMoves):
         if self.originalPlayer == currentPlayer:
@@ -575,6 +823,14 @@ class GtpConnection():
 
     def getLegalMoves(self, gameState):
         #This method returns a list containing all of the legal moves for a game state
+        legalMoves = self.legalMoves(gameState)
+        if self.stats != None:
+            self.stats.generated(self.ply, len(legalMoves))
+        return legalMoves
+
+    def legalMoves(self, gameState):
+        #getLegalMoves without the counters, for the df-pn solver which counts
+        #with its own ply
         moves = gameState.get_empty_points()
         cp = gameState.current_player
         opponent = BLACK + WHITE - cp
@@ -658,6 +914,40 @@ class GtpConnection():
         return False
 
 
+#<---Solver of a worker process of call_parallel, built once by
+#init_root_worker and shared by the root moves it solves--->
+workerCon = None
+
+def init_root_worker(board, settings):
+    #settings: GtpConnection.solverSettings of the main solver
+    global workerCon
+    workerCon = GtpConnection(None, board, settings = settings)
+
+def solve_root_move(task):
+    #Solve one root move in a worker process of call_parallel.
+    #Returns (move, whether the move wins for the player to move at the root,
+    #the counters of the solve or None)
+    gameState, move, color, solver, deadline = task
+    con = workerCon
+    con.deadline = deadline
+    con.regions.deadline = deadline
+    con.originalPlayer = color
+    con.ply = 0
+    if con.stats != None:
+        con.stats.clear()
+    con.playMove(move, color, gameState)
+    if solver == 'dfpn':
+        if con.stats != None:
+            con.stats.node(con.ply)
+        opponentWins, _ = DfpnSolver(con.legalMoves, con.tt, deadline,
+                                     con.stats, con.ply).solve(gameState)
+        isWin = not opponentWins
+    else:
+        isWin = con.minmax_bool_and(gameState)
+    if con.stats != None:
+        con.stats.finish()
+    return move, isWin, con.stats
+
 def point_to_coord(point, boardsize):
     """
     Transform point given as board array index 
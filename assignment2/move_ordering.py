@@ -0,0 +1,109 @@
+"""
+move_ordering.py
+
+Move ordering for the boolean minimax solver. Trying the best moves
+first makes an OR node find its winning move, and an AND node its
+refutation, after fewer children.
+
+Moves are sorted by, in this order:
+- killer moves: the last moves which caused a cutoff at the same ply
+- history score: sum of numMoves ** 2 over all cutoffs of the move
+  by the same color, so cutoffs close to the root count more
+- prior: the weight of the 3x3 pattern around the move, from the
+  pattern weights file also used by the assignment 3 and 4 players
+  (see load_weights)
+Each part can be turned off.
+"""
+
+from board_util import BLACK, WHITE
+
+"""
+Number of killer moves kept per ply
+"""
+NUM_KILLERS = 2
+
+def load_weights(fileName):
+    """
+    Pattern weights, as a dict from pattern code to weight.
+    Each line of the file is a pattern code and its weight.
+    """
+    weights = {}
+    with open(fileName, 'r') as f:
+        for line in f:
+            item = line.split(' ')
+            weights[int(item[0])] = float(item[1])
+    return weights
+
+def pattern_code(board, move, color):
+    """
+    Code of the 3x3 pattern around move, with 2 bits per neighbor
+    color, as seen by color: for WHITE, BLACK and WHITE are exchanged.
+    Same as Nogo.getWeight in assignment 3 and 4.
+    """
+    NS = board.NS
+    pattern = [move+NS-1, move+NS, move+NS+1,
+               move-1,             move+1,
+               move-NS-1, move-NS, move-NS+1]
+    code = 0
+    for i, p in enumerate(pattern):
+        c = int(board.board[p])
+        if color == WHITE and (c == BLACK or c == WHITE):
+            c = BLACK + WHITE - c
+        code += c << (2 * i)
+    return code
+
+class MoveOrdering(object):
+
+    def __init__(self, use_killers = True, use_history = True,
+                 weights = None):
+        """
+        weights: pattern weights for the prior, None for no prior
+        """
+        self.use_killers = use_killers
+        self.use_history = use_history
+        self.weights = weights
+        self.clear()
+
+    def __repr__(self):
+        parts = [name for name, on in (('killers', self.use_killers),
+                                       ('history', self.use_history),
+                                       ('pattern', self.weights is not None))
+                 if on]
+        return ' '.join(parts) if parts else 'none'
+
+    def clear(self):
+        """
+        Forget the killers and history of earlier searches.
+        """
+        self.killers = {}
+        self.history = {}
+
+    def order(self, board, moves, color, ply):
+        """
+        moves sorted from best to worst for color at ply.
+        """
+        if not self.use_killers and not self.use_history \
+           and self.weights is None:
+            return moves
+        killers = self.killers.get(ply, ()) if self.use_killers else ()
+        history = self.history if self.use_history else {}
+        weights = self.weights
+        def score(move):
+            prior = 0.0
+            if weights is not None:
+                prior = weights.get(pattern_code(board, move, color), 0.0)
+            return (move in killers, history.get((color, move), 0), prior)
+        return sorted(moves, key = score, reverse = True)
+
+    def cutoff(self, move, color, ply, numMoves):
+        """
+        Record that move of color caused a cutoff at ply,
+        in a node with numMoves legal moves.
+        """
+        if self.use_killers:
+            killers = self.killers.get(ply, [])
+            if move not in killers:
+                self.killers[ply] = [move] + killers[:NUM_KILLERS - 1]
+        if self.use_history:
+            key = (color, move)
+            self.history[key] = self.history.get(key, 0) + numMoves ** 2
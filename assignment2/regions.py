@@ -0,0 +1,177 @@
+"""
+regions.py
+
+Late NoGo positions as sums of independent regions.
+
+A region is a set of empty points, connected through empty points or
+through blocks of stones next to them. Since stones are never removed
+in NoGo, all liberties of a block stay in one region, and moves in
+one region do not change what can be played in another region.
+So the position is the sum of the games played in its regions, and
+the player to move wins if the sum of their values, computed with
+cgt.GameTable, is a win for the player moving first. Regions with a
+sum of 0 can also be left out of the search.
+
+The value of a region only depends on its empty points and the stones
+next to them, up to translation, so it is cached under a key of
+the relative positions of these points, their colors and which
+stones are in the same block. Values are computed by a search over the
+moves of both players in the region, and the regions left after each
+move are split again.
+"""
+
+from board_util import BLACK, WHITE, EMPTY
+from cgt import GameTable
+
+"""
+Regions are only analyzed in positions with at most MAX_EMPTY empty
+points. Values are only computed for regions with at most
+MAX_REGION_SIZE empty points.
+"""
+MAX_EMPTY = 24
+MAX_REGION_SIZE = 4
+
+def find_regions(board, empties):
+    """
+    The independent regions of the empty points empties on board,
+    as lists of points.
+    A flood fill from an empty point goes on to all its neighbors,
+    and from a stone only to its liberties and the stones of its block,
+    so all liberties of a block end up in the same region.
+    """
+    colors = board.board.tolist()
+    neighbors = board.neighbors
+    seen = set()
+    regions = []
+    for p in empties:
+        if p in seen:
+            continue
+        seen.add(p)
+        stack = [p]
+        points = []
+        while stack:
+            q = stack.pop()
+            color = colors[q]
+            if color == EMPTY:
+                points.append(q)
+            for nb in neighbors[q]:
+                if nb in seen:
+                    continue
+                c = colors[nb]
+                if color == EMPTY or c == EMPTY or c == color:
+                    seen.add(nb)
+                    stack.append(nb)
+        regions.append(points)
+    return regions
+
+def region_key(board, points):
+    """
+    Key for the value of the region with empty points points,
+    as described above.
+    """
+    colors = board.board.tolist()
+    neighbors = board.neighbors
+    base = min(points)
+    stones = sorted({nb for p in points for nb in neighbors[p]
+                     if colors[nb] == BLACK or colors[nb] == WHITE})
+    # label each block by its smallest stone next to the region
+    label = {}
+    for s in stones:
+        if s in label:
+            continue
+        block = [s]
+        seen = {s}
+        for b in block:
+            for nb in neighbors[b]:
+                if colors[nb] == colors[s] and nb not in seen:
+                    seen.add(nb)
+                    block.append(nb)
+        for b in block:
+            label[b] = s
+    return (board.NS, tuple(sorted(p - base for p in points)),
+            tuple((s - base, colors[s], label[s] - base) for s in stones))
+
+class RegionSolver(object):
+
+    def __init__(self, is_legal):
+        """
+        is_legal(board, point, color): whether color may play on point
+        """
+        self.is_legal = is_legal
+        self.games = GameTable()
+        self.values = {}
+        self.deadline = None
+
+    def clear(self):
+        self.games = GameTable()
+        self.values = {}
+
+    def analyze(self, board):
+        """
+        Use the regions of the position on board, if it has more than one.
+        Returns (toPlayWins, points):
+        - toPlayWins: whether the player to move wins, if all regions
+          are small enough to compute their values, else None
+        - points: if the small regions add up to 0, the empty points of
+          the other regions, else None. Then the position has the same
+          value as the other regions alone, and only moves on points
+          need to be searched.
+        The board is restored at the end.
+        """
+        empties = board.get_empty_points().tolist()
+        if len(empties) > MAX_EMPTY:
+            return None, None
+        regions = find_regions(board, empties)
+        if len(regions) < 2:
+            return None, None
+        player = board.current_player
+        total = self.games.zero
+        large = []
+        try:
+            for points in regions:
+                if len(points) > MAX_REGION_SIZE:
+                    large.extend(points)
+                    continue
+                total = self.games.add(total, self._value(board, points))
+        finally:
+            board.current_player = player
+        if large:
+            if total == self.games.zero:
+                return None, set(large)
+            return None, None
+        if player == BLACK:
+            return self.games.left_wins_moving_first(total), None
+        return self.games.right_wins_moving_first(total), None
+
+    def _value(self, board, points):
+        key = region_key(board, points)
+        value = self.values.get(key)
+        if value is None:
+            value = self._region_value(board, points)
+            self.values[key] = value
+        return value
+
+    def _sum(self, board, empties):
+        """
+        Sum of the values of the regions of empties
+        """
+        total = self.games.zero
+        for points in find_regions(board, empties):
+            total = self.games.add(total, self._value(board, points))
+        return total
+
+    def _region_value(self, board, points):
+        if self.deadline is not None:
+            self.deadline.check()
+        options = {BLACK: [], WHITE: []}
+        for color in (BLACK, WHITE):
+            for p in points:
+                if not self.is_legal(board, p, color):
+                    continue
+                board.play_unchecked(p, color)
+                try:
+                    rest = [q for q in points if q != p]
+                    options[color].append(self._sum(board, rest))
+                finally:
+                    board.undo_unchecked(p)
+        return self.games.game(options[BLACK], options[WHITE])
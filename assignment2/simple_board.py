@@ -12,7 +12,8 @@ The board uses a 1-dimensional representation with padding
 import numpy as np
 from board_util import GoBoardUtil, BLACK, WHITE, EMPTY, BORDER, \
                        PASS, is_black_white, coord_to_point, where1d, \
-                       MAXSIZE, NULLPOINT
+                       MAXSIZE, NULLPOINT, get_zobrist_keys, \
+                       get_symmetric_zobrist_keys
 
 class SimpleGoBoard(object):
 
@@ -69,7 +70,15 @@ class SimpleGoBoard(object):
         self.NS = size + 1
         self.WE = 1
         self.ko_recapture = None
-        self.current_player = BLACK
+        self.zobrist, self.zobrist_to_move = get_zobrist_keys(size)
+        # Zobrist hash code of the stones and the side to move,
+        # updated with every change
+        self.hash = 0
+        self._current_player = BLACK
+        # hash codes of the stones only, of the board seen through
+        # each of the 8 symmetries, for canonical_hash
+        self.symmetric_zobrist = get_symmetric_zobrist_keys(size)
+        self.symmetric_hashes = [0] * len(self.symmetric_zobrist[0][BLACK])
         self.maxpoint = size * size + 3 * (size + 1)
         self.board = np.full(self.maxpoint, BORDER, dtype = np.int32)
         self.liberty_of = np.full(self.maxpoint, NULLPOINT, dtype = np.int32)
@@ -84,8 +93,63 @@ class SimpleGoBoard(object):
         b.current_player = self.current_player
         assert b.maxpoint == self.maxpoint
         b.board = np.copy(self.board)
+        b.hash = self.hash
+        b.symmetric_hashes = list(self.symmetric_hashes)
         return b
 
+    @property
+    def current_player(self):
+        return self._current_player
+
+    @current_player.setter
+    def current_player(self, color):
+        """
+        Changing the side to move updates the hash code
+        """
+        if color != self._current_player:
+            self.hash ^= self.zobrist_to_move
+            self._current_player = color
+
+    def _compute_hash(self):
+        """
+        Compute the hash code from scratch. self.hash must be equal to it.
+        """
+        code = 0
+        for point in where1d(self.board == BLACK):
+            code ^= self.zobrist[point][BLACK]
+        for point in where1d(self.board == WHITE):
+            code ^= self.zobrist[point][WHITE]
+        if self.current_player == WHITE:
+            code ^= self.zobrist_to_move
+        return code
+
+    def canonical_hash(self):
+        """
+        Hash code which is the same for all symmetric positions:
+        the smallest hash code of the stones over the 8 symmetries,
+        with the key for the side to move.
+        """
+        code = min(self.symmetric_hashes)
+        if self._current_player == WHITE:
+            code ^= self.zobrist_to_move
+        return code
+
+    def canonical_hash_after(self, point, color):
+        """
+        canonical_hash of the position after color plays on point,
+        computed without playing the move.
+        """
+        keys = self.symmetric_zobrist[point][color]
+        code = min([h ^ k for h, k in zip(self.symmetric_hashes, keys)])
+        if color == BLACK:
+            code ^= self.zobrist_to_move
+        return code
+
+    def _update_symmetric_hashes(self, point, color):
+        keys = self.symmetric_zobrist[point][color]
+        self.symmetric_hashes = [h ^ k for h, k in
+                                 zip(self.symmetric_hashes, keys)]
+
     def row_start(self, row):
         assert row >= 1
         assert row <= self.size
@@ -253,6 +317,7 @@ class SimpleGoBoard(object):
             if self.board[nb] == opp_color:
                 single_capture = self._detect_and_process_capture(nb)
                 if single_capture == True:
+                    self.board[point] = EMPTY
                     raise ValueError("capture")
         if not self._stone_has_liberty(point):
             # check suicide of whole block
@@ -263,9 +328,33 @@ class SimpleGoBoard(object):
         self.ko_recapture = None
         if in_enemy_eye and len(single_captures) == 1:
             self.ko_recapture = single_captures[0]
+        self.hash ^= self.zobrist[point][color]
+        self._update_symmetric_hashes(point, color)
         self.current_player = GoBoardUtil.opponent(color)
         return True
 
+    def play_unchecked(self, point, color):
+        """
+        Play a move of color on point without checking the rules.
+        Only use for moves known to be legal, such as moves from
+        a list of legal moves. Undo with undo_unchecked.
+        """
+        self.board[point] = color
+        self.hash ^= self.zobrist[point][color]
+        self._update_symmetric_hashes(point, color)
+        self.current_player = GoBoardUtil.opponent(color)
+
+    def undo_unchecked(self, point):
+        """
+        Undo a move played by play_unchecked.
+        The player of that move is to play again.
+        """
+        color = self.board[point]
+        self.hash ^= self.zobrist[point][color]
+        self._update_symmetric_hashes(point, color)
+        self.board[point] = EMPTY
+        self.current_player = color
+
     def neighbors_of_color(self, point, color):
         """ List of neighbors of point of given color """
         nbc = []
@@ -0,0 +1,137 @@
+"""
+solve_stats.py
+
+Counters of a solve, to see where the time of a search goes:
+nodes, legal move generation, cutoffs and depth, per ply and in
+total, reported with the counters of the transposition table.
+
+The solver only counts when GtpConnection.stats is not None, so with
+stats off each node costs one attribute test.
+With stats on, each node also costs one look at the clock: the time
+from one node to the next is charged to the ply of the first one,
+which gives the time spent per ply outside of the subtrees.
+The df-pn solver counts in the same way, with the ply of its own
+search. The workers of a parallel solve count in their own
+SolveStats, which are added to the main one with add.
+"""
+
+import sys
+import time
+
+class SolveStats(object):
+
+    def __init__(self, report_interval = 0):
+        """
+        report_interval: seconds between progress lines on stderr,
+        0 for none
+        """
+        self.report_interval = report_interval
+        self.clear()
+
+    def clear(self):
+        self.start = time.time()
+        self.end = self.start
+        self.next_report = self.start + self.report_interval
+        self.nodes = 0
+        self.legal_move_calls = 0
+        self.legal_moves = 0
+        self.cutoffs = 0
+        self.max_depth = 0
+        self.ply_nodes = []
+        self.ply_expanded = []
+        self.ply_moves = []
+        self.ply_time = []
+        self.last_ply = None
+
+    def node(self, ply):
+        """
+        A node at ply is entered
+        """
+        now = time.time()
+        if self.last_ply is not None:
+            self.ply_time[self.last_ply] += now - self.end
+        self.end = now
+        self.last_ply = ply
+        self.nodes += 1
+        while len(self.ply_nodes) <= ply:
+            self.ply_nodes.append(0)
+            self.ply_expanded.append(0)
+            self.ply_moves.append(0)
+            self.ply_time.append(0.0)
+        self.ply_nodes[ply] += 1
+        if ply > self.max_depth:
+            self.max_depth = ply
+        if self.report_interval and now >= self.next_report:
+            self.next_report = now + self.report_interval
+            sys.stderr.write(self.summary() + '\n')
+            sys.stderr.flush()
+
+    def generated(self, ply, numMoves):
+        """
+        numMoves legal moves were generated at ply
+        """
+        self.legal_move_calls += 1
+        self.legal_moves += numMoves
+        if ply < len(self.ply_nodes):
+            self.ply_expanded[ply] += 1
+            self.ply_moves[ply] += numMoves
+
+    def cutoff(self):
+        self.cutoffs += 1
+
+    def add(self, other):
+        """
+        Add the counters of other, such as those of a worker of a
+        parallel solve. The time of the solve stays the time of self.
+        """
+        self.nodes += other.nodes
+        self.legal_move_calls += other.legal_move_calls
+        self.legal_moves += other.legal_moves
+        self.cutoffs += other.cutoffs
+        self.max_depth = max(self.max_depth, other.max_depth)
+        while len(self.ply_nodes) < len(other.ply_nodes):
+            self.ply_nodes.append(0)
+            self.ply_expanded.append(0)
+            self.ply_moves.append(0)
+            self.ply_time.append(0.0)
+        for ply, nodes in enumerate(other.ply_nodes):
+            self.ply_nodes[ply] += nodes
+            self.ply_expanded[ply] += other.ply_expanded[ply]
+            self.ply_moves[ply] += other.ply_moves[ply]
+            self.ply_time[ply] += other.ply_time[ply]
+
+    def finish(self):
+        """
+        The solve is over: charge the time since the last node
+        """
+        now = time.time()
+        if self.last_ply is not None:
+            self.ply_time[self.last_ply] += now - self.end
+        self.end = now
+        self.last_ply = None
+
+    def summary(self):
+        end = time.time() if self.last_ply is not None else self.end
+        seconds = end - self.start
+        rate = self.nodes / seconds if seconds > 0 else 0.0
+        branching = self.legal_moves / max(1, self.legal_move_calls)
+        return "nodes {} in {:.2f}s ({:.0f}/s) max depth {} " \
+               "legal move calls {} branching {:.2f} cutoffs {}".format(
+                   self.nodes, seconds, rate, self.max_depth,
+                   self.legal_move_calls, branching, self.cutoffs)
+
+    def report(self, tt):
+        """
+        The summary, the transposition table counters and a table
+        of nodes, nodes expanded (not found in the TT), average legal
+        moves and seconds per ply
+        """
+        lines = [self.summary(), "tt " + str(tt),
+                 "ply nodes expanded branching seconds"]
+        for ply, nodes in enumerate(self.ply_nodes):
+            expanded = self.ply_expanded[ply]
+            lines.append("{} {} {} {:.2f} {:.3f}".format(
+                ply, nodes, expanded,
+                self.ply_moves[ply] / expanded if expanded else 0.0,
+                self.ply_time[ply]))
+        return '\n'.join(lines)
@@ -0,0 +1,77 @@
+"""
+solved_store.py
+
+Append-only file of solved positions, kept across solve calls and
+engine restarts. Each record holds the Zobrist hash code of a
+position (SimpleGoBoard.hash, which includes the side to move),
+whether the player to move wins, and a winning move.
+The Zobrist keys come from fixed seeds (see get_zobrist_keys), so
+hash codes are the same in every run. They do not include the board
+size, the empty board hashes to 0 on every size, so there is one file
+per board size, see store_path.
+
+The file is memory-mapped the first time it is needed. Records
+solved by this process are appended to the file right away and
+kept in a dict, since the map only covers the file as it was when
+loaded. A partly written record at the end of the file is ignored.
+"""
+
+import os
+import numpy as np
+
+RECORD = np.dtype([('key', '<u8'), ('move', '<i4'), ('win', '<i4')])
+
+def store_path(directory, size):
+    return os.path.join(directory, 'solved_{0}x{0}.dat'.format(size))
+
+class SolvedStore(object):
+
+    def __init__(self, path):
+        self.path = path
+        self.records = None
+        self.added = {}
+
+    def __len__(self):
+        self._load()
+        return len(self.records) + len(self.added)
+
+    def _load(self):
+        if self.records is not None:
+            return
+        num_records = 0
+        if os.path.exists(self.path):
+            num_records = os.path.getsize(self.path) // RECORD.itemsize
+        if num_records > 0:
+            self.records = np.memmap(self.path, dtype = RECORD, mode = 'r',
+                                     shape = (num_records,))
+        else:
+            self.records = np.zeros(0, dtype = RECORD)
+
+    def lookup(self, code):
+        """
+        (win, move) for the position with hash code, or None if it
+        was not solved before. move is None if win is False.
+        """
+        self._load()
+        result = self.added.get(code)
+        if result is not None:
+            return result
+        found = np.nonzero(self.records['key'] == np.uint64(code))[0]
+        if len(found) == 0:
+            return None
+        record = self.records[found[-1]]
+        if record['win']:
+            return True, int(record['move'])
+        return False, None
+
+    def store(self, code, win, move):
+        self._load()
+        if self.lookup(code) is not None:
+            return
+        record = np.zeros(1, dtype = RECORD)
+        record['key'] = code
+        record['move'] = move if win else 0
+        record['win'] = win
+        with open(self.path, 'ab') as f:
+            f.write(record.tobytes())
+        self.added[code] = (win, move if win else None)
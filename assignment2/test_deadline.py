@@ -0,0 +1,48 @@
+#!/usr/local/bin/python3
+#/usr/bin/python3
+# Set the path to your python3 above
+
+import unittest
+from gtp_connection import GtpConnection
+from simple_board import SimpleGoBoard
+from deadline import Deadline, TimeException
+from Nogo import Nogo
+
+class DeadlineTestCase(unittest.TestCase):
+    """Tests for deadline.py"""
+
+    def test_raises_after_deadline(self):
+        deadline = Deadline(0, 4)
+        self.assertEqual(deadline.remaining(), 0.0)
+        # the clock is only read every interval checks
+        for _ in range(3):
+            deadline.check()
+        with self.assertRaises(TimeException):
+            deadline.check()
+        with self.assertRaises(TimeException):
+            for _ in range(4):
+                deadline.check()
+
+    def test_before_deadline(self):
+        deadline = Deadline(100, 1)
+        for _ in range(1000):
+            deadline.check()
+        self.assertGreater(deadline.remaining(), 0.0)
+
+    def test_minimax_restores_board(self):
+        board = SimpleGoBoard(4)
+        board.play_move(board.pt(2, 2), board.current_player)
+        code = board.hash
+        con = GtpConnection(Nogo(), board)
+        con.originalPlayer = board.current_player
+        con.deadline = Deadline(0, 50)
+        con.regions.deadline = con.deadline
+        with self.assertRaises(TimeException):
+            con.minmax_bool_or(board)
+        self.assertEqual(board.hash, code)
+        self.assertEqual(len(board.get_empty_points()), 15)
+        self.assertEqual(con.ply, 0)
+
+"""Main"""
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/local/bin/python3
+#/usr/bin/python3
+# Set the path to your python3 above
+
+import unittest
+import random
+from gtp_connection import GtpConnection
+from simple_board import SimpleGoBoard
+from TranspositionTable import TT
+from deadline import Deadline, TimeException
+from dfpn import DfpnSolver
+from Nogo import Nogo
+
+def random_position(rng, size, num_empty, legal_moves):
+    """ A position after random legal moves, with num_empty empty points """
+    board = SimpleGoBoard(size)
+    while len(board.get_empty_points()) > num_empty:
+        moves = legal_moves(board)
+        if not moves:
+            break
+        board.play_unchecked(rng.choice(moves), board.current_player)
+    return board
+
+class DfpnTestCase(unittest.TestCase):
+    """Tests for dfpn.py"""
+
+    def setUp(self):
+        self.con = GtpConnection(Nogo(), SimpleGoBoard(4))
+
+    def minimax(self, board):
+        """ Whether the player to move wins, by plain minimax """
+        color = board.current_player
+        for move in self.con.getLegalMoves(board):
+            board.play_unchecked(move, color)
+            try:
+                opponentWins = self.minimax(board)
+            finally:
+                board.undo_unchecked(move)
+            if not opponentWins:
+                return True
+        return False
+
+    def assertSolved(self, board, tt):
+        code = board.hash
+        isWin, move = DfpnSolver(self.con.getLegalMoves, tt).solve(board)
+        self.assertEqual(board.hash, code)
+        self.assertEqual(isWin, self.minimax(board))
+        if isWin:
+            self.assertIn(move, self.con.getLegalMoves(board))
+            board.play_unchecked(move, board.current_player)
+            self.assertFalse(self.minimax(board))
+            board.undo_unchecked(move)
+        else:
+            self.assertIsNone(move)
+
+    def test_small_boards(self):
+        for size in (2, 3):
+            self.assertSolved(SimpleGoBoard(size), TT(1))
+
+    def test_agrees_with_minimax(self):
+        rng = random.Random(7)
+        for _ in range(20):
+            board = random_position(rng, 4, 9, self.con.getLegalMoves)
+            self.assertSolved(board, TT(1))
+
+    def test_full_table(self):
+        # a table of one bucket keeps almost nothing, proofs have to
+        # be searched again
+        rng = random.Random(11)
+        for _ in range(5):
+            board = random_position(rng, 4, 8, self.con.getLegalMoves)
+            self.assertSolved(board, TT(0))
+
+    def test_timeout_restores_board(self):
+        board = SimpleGoBoard(4)
+        code = board.hash
+        solver = DfpnSolver(self.con.getLegalMoves, TT(1), Deadline(0, 1))
+        with self.assertRaises(TimeException):
+            solver.solve(board)
+        self.assertEqual(board.hash, code)
+        self.assertEqual(len(board.get_empty_points()), 16)
+
+"""Main"""
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/local/bin/python3
+#/usr/bin/python3
+# Set the path to your python3 above
+
+import unittest
+import random
+from gtp_connection import GtpConnection
+from simple_board import SimpleGoBoard
+from board_util import BLACK, WHITE
+from TranspositionTable import TT
+from deadline import Deadline
+from regions import find_regions
+from cgt import GameTable
+from Nogo import Nogo
+
+def wall(size):
+    """ A board with black on column b and white on column c """
+    board = SimpleGoBoard(size)
+    for row in range(1, size + 1):
+        board.play_unchecked(board.pt(row, 2), BLACK)
+        board.play_unchecked(board.pt(row, 3), WHITE)
+    return board
+
+def random_position(rng, board, num_empty, legal_moves):
+    """ The position after random legal moves on board, with num_empty
+    empty points """
+    while len(board.get_empty_points()) > num_empty:
+        moves = legal_moves(board)
+        if not moves:
+            break
+        board.play_unchecked(rng.choice(moves), board.current_player)
+    return board
+
+class GameTableTestCase(unittest.TestCase):
+    """Tests for cgt.py"""
+
+    def test_values(self):
+        games = GameTable()
+        zero = games.zero
+        one = games.game([zero], [])
+        minus_one = games.game([], [zero])
+        star = games.game([zero], [zero])
+        up = games.game([zero], [star])
+        self.assertEqual(games.add(one, minus_one), zero)
+        self.assertEqual(games.add(star, star), zero)
+        self.assertEqual(games.add(one, one), games.game([one], []))
+        # {-1 | 1} = 0 and {0, * | } = 1: dominated and reversible options
+        self.assertEqual(games.game([minus_one], [one]), zero)
+        self.assertEqual(games.game([zero, star], []), one)
+        self.assertTrue(games.le(zero, up))
+        self.assertFalse(games.le(up, zero))
+        self.assertFalse(games.le(star, zero) or games.le(zero, star))
+
+    def test_winner(self):
+        games = GameTable()
+        zero = games.zero
+        one = games.game([zero], [])
+        star = games.game([zero], [zero])
+        self.assertFalse(games.left_wins_moving_first(zero))
+        self.assertFalse(games.right_wins_moving_first(zero))
+        self.assertTrue(games.left_wins_moving_first(one))
+        self.assertFalse(games.right_wins_moving_first(one))
+        self.assertTrue(games.left_wins_moving_first(star))
+        self.assertTrue(games.right_wins_moving_first(star))
+
+class RegionsTestCase(unittest.TestCase):
+    """Tests for regions.py"""
+
+    def setUp(self):
+        self.con = GtpConnection(Nogo(), SimpleGoBoard(4))
+
+    def minimax(self, board, useRegions):
+        """ Whether the player to move wins, by the minimax solver """
+        con = self.con
+        con.useRegions = useRegions
+        con.tt = TT(1)
+        con.originalPlayer = board.current_player
+        con.deadline = Deadline(1000)
+        con.regions.deadline = con.deadline
+        con.ply = 0
+        return con.minmax_bool_or(board)
+
+    def test_find_regions(self):
+        board = wall(4)
+        empties = board.get_empty_points().tolist()
+        regions = sorted(sorted(points) for points in
+                         find_regions(board, empties))
+        self.assertEqual(regions, [[board.pt(row, 1) for row in range(1, 5)],
+                                   [board.pt(row, 4) for row in range(1, 5)]])
+
+    def test_liberties_in_one_region(self):
+        board = SimpleGoBoard(4)
+        # a1 and a3 are liberties of the white block a2, b2
+        board.play_unchecked(board.pt(2, 1), WHITE)
+        board.play_unchecked(board.pt(2, 2), WHITE)
+        for point in (board.pt(1, 2), board.pt(3, 2)):
+            board.play_unchecked(point, BLACK)
+        regions = find_regions(board, [board.pt(1, 1), board.pt(3, 1)])
+        self.assertEqual(len(regions), 1)
+
+    def assertAgree(self, board):
+        code = board.hash
+        toPlayWins, _ = self.con.regions.analyze(board)
+        self.assertEqual(board.hash, code)
+        plain = self.minimax(board, False)
+        if toPlayWins is not None:
+            self.assertEqual(toPlayWins, plain)
+        self.assertEqual(self.minimax(board, True), plain)
+        self.assertEqual(board.hash, code)
+        return toPlayWins
+
+    def test_sums_agree_with_search(self):
+        rng = random.Random(3)
+        for num_empty in range(8, 2, -1):
+            for _ in range(5):
+                board = random_position(rng, wall(4), num_empty,
+                                        self.con.getLegalMoves)
+                self.assertIsNotNone(self.assertAgree(board))
+
+    def test_regions_agree_with_search(self):
+        # mostly positions with one region
+        rng = random.Random(5)
+        for _ in range(30):
+            board = random_position(rng, SimpleGoBoard(4), 7,
+                                    self.con.getLegalMoves)
+            self.assertAgree(board)
+
+"""Main"""
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+#!/usr/local/bin/python3
+#/usr/bin/python3
+# Set the path to your python3 above
+
+import unittest
+from board_util import BLACK, WHITE, EMPTY
+from simple_board import SimpleGoBoard
+
+class SimpleBoardTestCase(unittest.TestCase):
+    """Tests for simple_board.py"""
+
+    def assertRejected(self, board, point, color, error):
+        before = board.board.copy()
+        code = board.hash
+        with self.assertRaises(ValueError) as raised:
+            board.play_move(point, color)
+        self.assertEqual(str(raised.exception), error)
+        self.assertEqual(board.get_color(point), EMPTY)
+        self.assertEqual(list(board.board), list(before))
+        self.assertEqual(board.hash, code)
+        self.assertEqual(board.hash, board._compute_hash())
+
+    def test_rejected_capture(self):
+        board = SimpleGoBoard(3)
+        board.play_move(board.pt(1, 1), WHITE)
+        board.play_move(board.pt(1, 2), BLACK)
+        # black a2 would capture white a1
+        self.assertRejected(board, board.pt(2, 1), BLACK, "capture")
+        self.assertFalse(board.is_legal(board.pt(2, 1), BLACK))
+
+    def test_rejected_suicide(self):
+        board = SimpleGoBoard(3)
+        board.play_move(board.pt(1, 2), WHITE)
+        board.play_move(board.pt(2, 1), WHITE)
+        self.assertRejected(board, board.pt(1, 1), BLACK, "suicide")
+
+    def test_play_and_undo_unchecked(self):
+        board = SimpleGoBoard(4)
+        code = board.hash
+        point = board.pt(2, 3)
+        board.play_unchecked(point, BLACK)
+        self.assertEqual(board.current_player, WHITE)
+        self.assertEqual(board.hash, board._compute_hash())
+        board.undo_unchecked(point)
+        self.assertEqual(board.current_player, BLACK)
+        self.assertEqual(board.hash, code)
+
+"""Main"""
+if __name__ == '__main__':
+    unittest.main()
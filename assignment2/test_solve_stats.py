@@ -0,0 +1,102 @@
+#!/usr/local/bin/python3
+#/usr/bin/python3
+# Set the path to your python3 above
+
+import unittest
+import os
+import tempfile
+import gtp_connection
+from gtp_connection import GtpConnection
+from simple_board import SimpleGoBoard
+from solve_stats import SolveStats
+from Nogo import Nogo
+
+class SolveStatsTestCase(unittest.TestCase):
+    """Tests for solve_stats.py"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.saved_dir = gtp_connection.SOLVED_STORE_DIR
+        gtp_connection.SOLVED_STORE_DIR = self.tmp.name
+
+    def tearDown(self):
+        gtp_connection.SOLVED_STORE_DIR = self.saved_dir
+        self.tmp.cleanup()
+
+    def test_counters(self):
+        stats = SolveStats()
+        stats.node(0)
+        stats.generated(0, 5)
+        stats.node(1)
+        stats.node(2)
+        stats.generated(2, 3)
+        stats.node(1)
+        stats.cutoff()
+        stats.finish()
+        self.assertEqual(stats.nodes, 4)
+        self.assertEqual(stats.ply_nodes, [1, 2, 1])
+        self.assertEqual(stats.ply_expanded, [1, 0, 1])
+        self.assertEqual(stats.ply_moves, [5, 0, 3])
+        self.assertEqual(stats.max_depth, 2)
+        self.assertEqual((stats.legal_move_calls, stats.legal_moves), (2, 8))
+        self.assertEqual(stats.cutoffs, 1)
+        other = SolveStats()
+        other.node(3)
+        other.generated(3, 2)
+        other.finish()
+        stats.add(other)
+        self.assertEqual(stats.nodes, 5)
+        self.assertEqual(stats.ply_nodes, [1, 2, 1, 1])
+        self.assertEqual(stats.max_depth, 3)
+        self.assertEqual(stats.legal_moves, 10)
+        stats.clear()
+        self.assertEqual((stats.nodes, stats.ply_nodes), (0, []))
+
+    def solve(self, *commands):
+        """ Counters of a solve of the empty 3x3 board, which is not
+        in the solved positions store """
+        for name in os.listdir(self.tmp.name):
+            os.remove(os.path.join(self.tmp.name, name))
+        con = GtpConnection(Nogo(), SimpleGoBoard(3))
+        con.respond = lambda response = '': None
+        for command in ('solve_stats on',) + commands:
+            con.get_cmd(command)
+        result = con.solve_cmd([])
+        return result, con.stats
+
+    def test_solve(self):
+        result, stats = self.solve()
+        self.assertNotEqual(result, 'unknown')
+        self.assertGreater(stats.nodes, 1)
+        self.assertEqual(stats.nodes, sum(stats.ply_nodes))
+        self.assertEqual(stats.ply_nodes[0], 1)
+        self.assertEqual(stats.max_depth, len(stats.ply_nodes) - 1)
+        lines = stats.report(None).split('\n')
+        self.assertEqual(len(lines), 3 + len(stats.ply_nodes))
+
+    def test_dfpn_solve(self):
+        result, stats = self.solve('solver dfpn')
+        self.assertEqual(result, self.solve()[0])
+        self.assertGreater(stats.nodes, 1)
+        self.assertEqual(stats.nodes, sum(stats.ply_nodes))
+        self.assertEqual(stats.ply_nodes[0], 1)
+        self.assertGreater(stats.max_depth, 1)
+        # legal moves are generated at each ply, not all at ply 0
+        self.assertLessEqual(stats.ply_expanded[0], 2)
+        self.assertGreater(stats.ply_expanded[1], 0)
+
+    def test_parallel_solve(self):
+        # the counters of the workers are added to the main ones
+        for solver in ('minmax', 'dfpn'):
+            result, stats = self.solve('workers 2', 'regions on',
+                                       'solver ' + solver)
+            # the winner, the winning move can be another one
+            self.assertEqual(result[0], self.solve()[0][0])
+            self.assertGreater(stats.nodes, 1)
+            self.assertEqual(stats.nodes, sum(stats.ply_nodes))
+            self.assertEqual(stats.ply_nodes[0], 1)
+            self.assertGreater(stats.ply_nodes[1], 0)
+
+"""Main"""
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+#!/usr/local/bin/python3
+#/usr/bin/python3
+# Set the path to your python3 above
+
+import unittest
+import os
+import tempfile
+import gtp_connection
+from gtp_connection import GtpConnection
+from simple_board import SimpleGoBoard
+from solved_store import SolvedStore, store_path
+from Nogo import Nogo
+
+class SolvedStoreTestCase(unittest.TestCase):
+    """Tests for solved_store.py"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.saved_dir = gtp_connection.SOLVED_STORE_DIR
+        gtp_connection.SOLVED_STORE_DIR = self.tmp.name
+
+    def tearDown(self):
+        gtp_connection.SOLVED_STORE_DIR = self.saved_dir
+        self.tmp.cleanup()
+
+    def test_store_and_lookup_across_instances(self):
+        path = os.path.join(self.tmp.name, 'solved.dat')
+        store = SolvedStore(path)
+        self.assertIsNone(store.lookup(5))
+        store.store(5, True, 17)
+        store.store(2 ** 64 - 1, False, 0)
+        self.assertEqual(store.lookup(5), (True, 17))
+        other = SolvedStore(path)
+        self.assertEqual(len(other), 2)
+        self.assertEqual(other.lookup(5), (True, 17))
+        self.assertEqual(other.lookup(2 ** 64 - 1), (False, None))
+
+    def solve(self, size):
+        """ Result of solve on the empty board, by a new connection """
+        con = GtpConnection(Nogo(), SimpleGoBoard(7))
+        con.respond = lambda response = '': None
+        con.get_cmd('boardsize {}'.format(size))
+        return con.solve_cmd([])
+
+    def test_one_store_per_size(self):
+        self.assertNotEqual(store_path(self.tmp.name, 2),
+                            store_path(self.tmp.name, 3))
+        fresh = {size: self.solve(size) for size in (2, 3, 4)}
+        for name in os.listdir(self.tmp.name):
+            os.remove(os.path.join(self.tmp.name, name))
+        # the empty board has the same hash code on every size,
+        # a result solved on one size must not be found on another
+        for size in (2, 3, 4, 2, 3):
+            self.assertEqual(self.solve(size), fresh[size])
+        self.assertTrue(os.path.exists(store_path(self.tmp.name, 3)))
+
+"""Main"""
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/local/bin/python3
+#/usr/bin/python3
+# Set the path to your python3 above
+
+import unittest
+from TranspositionTable import TT
+
+class TranspositionTableTestCase(unittest.TestCase):
+    """Tests for TranspositionTable.py"""
+
+    def test_store_and_lookup(self):
+        tt = TT(1)
+        self.assertIsNone(tt.lookup(12345))
+        tt.store(12345, True, 3)
+        tt.store(2 ** 64 - 1, False)
+        tt.store(77, (5, 2 ** 31 - 1), 4)
+        tt.store(78, (0, 10 ** 9))
+        self.assertIs(tt.lookup(12345), True)
+        self.assertIs(tt.lookup(2 ** 64 - 1), False)
+        self.assertEqual(tt.lookup(77), (5, 2 ** 31 - 1))
+        self.assertEqual(tt.lookup(78), (0, 10 ** 9))
+        self.assertIsNone(tt.lookup(79))
+        self.assertEqual(tt.occupied, 4)
+        tt.store(12345, False, 3)
+        self.assertIs(tt.lookup(12345), False)
+        self.assertEqual(tt.occupied, 4)
+        tt.clear()
+        self.assertIsNone(tt.lookup(12345))
+        self.assertEqual(tt.occupied, 0)
+
+    def test_replacement(self):
+        # one bucket: every code goes to the same two slots
+        tt = TT(0)
+        self.assertEqual(tt.capacity, 2)
+        tt.store(1, True, 10)
+        tt.store(2, True, 5)
+        self.assertEqual(tt.occupied, 2)
+        self.assertEqual(tt.collisions, 1)
+        # the always-replace slot takes new entries of small depth
+        tt.store(3, False, 1)
+        self.assertIs(tt.lookup(1), True)
+        self.assertIsNone(tt.lookup(2))
+        self.assertIs(tt.lookup(3), False)
+        self.assertEqual(tt.replaced, 1)
+        # a deeper entry takes the depth-preferred slot, and the entry
+        # there moves to the always-replace slot
+        tt.store(4, True, 20)
+        self.assertIs(tt.lookup(4), True)
+        self.assertIs(tt.lookup(1), True)
+        self.assertIsNone(tt.lookup(3))
+        self.assertEqual(tt.occupied, 2)
+
+    def test_results(self):
+        tt = TT(1)
+        tt.store(1, True, 2)
+        tt.store(2, False, 5)
+        tt.store(3, (1, 1), 5)
+        keys, values = tt.results(min_depth = 3)
+        self.assertEqual(keys.tolist(), [2])
+        self.assertEqual(values.tolist(), [False])
+        keys, values = tt.results()
+        self.assertEqual(sorted(zip(keys.tolist(), values.tolist())),
+                         [(1, True), (2, False)])
+
+"""Main"""
+if __name__ == '__main__':
+    unittest.main()
@@ -41,13 +41,10 @@ class Nogo():
             tempState.play_move(move, cp)
 
     def randomMoveGen(self, state, player):
-        moves = state.get_empty_points()
-        np.random.shuffle(moves)
-        for move in moves:
-            legal = state.is_legal(move, player)
-            if legal:
-                return move
-        return None
+        moves = self.generateLegalMoves(state, player)
+        if not moves:
+            return None
+        return random.choice(moves)
 
     def quickPlayMove(self, state, move, player):
         state.board[move] = player
@@ -175,12 +172,7 @@ class Nogo():
         return BLACK + WHITE - cp
 
     def generateLegalMoves(self, gameState, color):
-        ePts = gameState.get_empty_points()
-        moves = []
-        for pt in ePts:
-            if gameState.is_legal(pt, color):
-                moves.append(pt)
-        return moves
+        return getLegalMoves(gameState, color)
 
     def openFile(self, fileName):
         weights = {}
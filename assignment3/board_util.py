@@ -92,6 +92,14 @@ def coord_to_point(row, col, boardsize):
     NS = boardsize + 1
     return NS * row + col
 
+def _neighbors_2d(padded):
+    """
+    The four neighbors (N, S, W, E) of each point of a two dimensional
+    board, as views into the board padded by one point on each side.
+    """
+    return [padded[:-2, 1:-1], padded[2:, 1:-1],
+            padded[1:-1, :-2], padded[1:-1, 2:]]
+
 class GoBoardUtil(object):
     
     @staticmethod
@@ -99,20 +107,74 @@ class GoBoardUtil(object):
         """
         generate a list of all legal moves on the board.
         Does not include the Pass move.
+        The moves are computed for the whole board at once
+        by legal_moves_mask, and are in increasing point order.
 
         Arguments
         ---------
-        board : np.array
-            a SIZExSIZE array representing the board
-        color : {'b','w'}
+        board : SimpleGoBoard
+            the board to generate the moves on
+        color : BLACK, WHITE
             the color to generate the move for.
         """
-        moves = board.get_empty_points()
-        legal_moves = []
-        for move in moves:
-            if board.is_legal(move, color):
-                legal_moves.append(move)
-        return legal_moves
+        board2d = GoBoardUtil.get_twoD_board(board)
+        rows, cols = np.nonzero(GoBoardUtil.legal_moves_mask(board2d, color))
+        NS = board.size + 1
+        return (NS * (rows + 1) + cols + 1).tolist()
+
+    @staticmethod
+    def legal_moves_mask(board2d, color):
+        """
+        Return: boolean numpy array
+        the NoGo legal moves of color on board2d, a two dimensional
+        board as returned by get_twoD_board.
+
+        A move is illegal if it captures, that is if it is the only
+        liberty of an adjacent opponent block, or if it is suicide:
+        it has no empty neighbor and no adjacent block of color
+        with another liberty.
+        All counts are computed with array shifts of the padded board.
+        Blocks are labeled by propagating the largest label through
+        stones of the same color, which takes one step per point
+        of the longest path through a block.
+        """
+        size = board2d.shape[0]
+        padded = np.pad(board2d, 1, mode = 'constant',
+                        constant_values = BORDER)
+        labels = np.zeros(padded.shape, dtype = np.int32)
+        inner = labels[1:-1, 1:-1]
+        is_stone = (board2d == BLACK) | (board2d == WHITE)
+        inner[is_stone] = np.arange(1, size * size + 1).reshape(
+            size, size)[is_stone]
+        same = [is_stone & (nb == board2d) for nb in _neighbors_2d(padded)]
+        while True:
+            new = inner.copy()
+            for i, nb_labels in enumerate(_neighbors_2d(labels)):
+                np.maximum(new, np.where(same[i], nb_labels, 0), out = new)
+            if np.array_equal(new, inner):
+                break
+            inner[:] = new
+
+        # liberties of each block, by label. A liberty next to a block in
+        # several directions is only counted in the first one.
+        empty = board2d == EMPTY
+        nb_labels = _neighbors_2d(labels)
+        libs = np.zeros(size * size + 1, dtype = np.int32)
+        for i in range(4):
+            new = empty & (nb_labels[i] != 0)
+            for j in range(i):
+                new &= nb_labels[i] != nb_labels[j]
+            libs += np.bincount(nb_labels[i][new],
+                                minlength = size * size + 1)
+
+        opp = GoBoardUtil.opponent(color)
+        capture = np.zeros(board2d.shape, dtype = bool)
+        has_liberty = np.zeros(board2d.shape, dtype = bool)
+        for nb, nb_label in zip(_neighbors_2d(padded), nb_labels):
+            nb_libs = libs[nb_label]
+            capture |= (nb == opp) & (nb_libs == 1)
+            has_liberty |= (nb == EMPTY) | ((nb == color) & (nb_libs > 1))
+        return empty & ~capture & has_liberty
 
     @staticmethod       
     def generate_random_move(board, color, use_eye_filter):
@@ -149,8 +211,7 @@ class GoBoardUtil(object):
         Rows 1..size of goboard are copied into rows 0..size - 1 of board2d
         """
         size = goboard.size
-        board2d = np.zeros((size, size), dtype = np.int32)
-        for row in range(size):
-            start = goboard.row_start(row + 1)
-            board2d[row, :] = goboard.board[start : start + size]
-        return board2d
+        NS = size + 1
+        start = goboard.row_start(1)
+        rows = goboard.board[start : start + size * NS].reshape(size, NS)
+        return rows[:, :size].astype(np.int32)
@@ -36,6 +36,26 @@ class SimpleGoBoard(object):
             
         return legal
 
+    def has_legal_move(self, color):
+        """
+        Check whether color has any legal move, stopping at the first one.
+        An empty point with an empty neighbor and no opponent neighbor
+        is always legal, so these points are tried first without playing
+        a move. Only if there is none, the other points are checked
+        with is_legal.
+        """
+        opp_color = GoBoardUtil.opponent(color)
+        others = []
+        for point in self.get_empty_points():
+            nb_colors = [self.board[nb] for nb in self.neighbors[point]]
+            if EMPTY in nb_colors and opp_color not in nb_colors:
+                return True
+            others.append(point)
+        for point in others:
+            if self.is_legal(point, color):
+                return True
+        return False
+
     def _detect_captures(self, point, opp_color):
         """
         Did move on point capture something?
@@ -4,6 +4,7 @@ Utility functions for Go board.
 """
 
 import numpy as np
+import random
 
 """
 Encoding of colors on and off a Go board.
@@ -27,6 +28,13 @@ To support larger boards the coordinate printing needs to be changed.
 """
 MAXSIZE = 25
 
+"""
+Compact types of the board arrays: colors fit into int8,
+the points of boards up to MAXSIZE into int16.
+"""
+COLOR_DTYPE = np.int8
+POINT_DTYPE = np.int16
+
 """
 where1d: Helper function for using np.where with 1-d arrays.
 The result of np.where is a tuple which contains the indices 
@@ -99,12 +107,7 @@ class GoBoardUtil(object):
         color : {'b','w'}
             the color to generate the move for.
         """
-        moves = board.get_empty_points()
-        legal_moves = []
-        for move in moves:
-            if board.is_legal(move, color):
-                legal_moves.append(move)
-        return legal_moves
+        return board.get_legal_moves(color)
 
     @staticmethod       
     def generate_random_move(board, color):
@@ -119,9 +122,13 @@ class GoBoardUtil(object):
         color : BLACK, WHITE
             the color to generate the move for.
         """
-        moves = board.get_empty_points()
-        np.random.shuffle(moves)
-        for move in moves:
+        # Shuffle the board's empty points in place one step at a time,
+        # stopping at the first legal point
+        empty_points = board.empty_points
+        num_empty = board.num_empty
+        for i in range(num_empty):
+            board.swap_empty_points(i, random.randrange(i, num_empty))
+            move = empty_points[i]
             if board.is_legal(move, color):
                 return move
         return None
@@ -144,3 +151,105 @@ class GoBoardUtil(object):
             start = goboard.row_start(row + 1)
             board2d[row, :] = goboard.board[start : start + size]
         return board2d
+
+"""
+Seed for the Zobrist keys of BoardGeometry
+"""
+ZOBRIST_SEED = 455
+
+class BoardGeometry(object):
+    """
+    Tables describing the points of a board of a given size,
+    in the padded 1-d encoding of coord_to_point.
+    They only depend on the size, so they are computed once per size
+    by get_geometry and shared by all boards of that size.
+    The numpy tables are read-only.
+
+    points:          the on-board points, in increasing order
+    point_index:     point -> index 0 .. size*size-1 in points, -1 off board
+    row, col:        point -> row, col in 1 .. size, 0 off board
+    edge_distance:   point -> distance to the closest edge (0 on the
+                     first line), -1 off board
+    neighbor_table:  point -> the four neighbors (W, E, S, N),
+                     including BORDER points
+    diag_table:      point -> the four diagonal neighbors (SW, SE, NW, NE)
+    window_33:       point -> the 3x3 window around point, row by row
+                     from point - NS - 1 to point + NS + 1
+    neighbors:       point -> tuple of the on-board neighbors.
+                     Tuples of ints are faster than numpy rows
+                     to loop over in Python.
+    empty_board:     the empty board, BORDER around EMPTY points
+    zobrist:         point -> (0, black key, white key), random 64 bit
+                     Zobrist keys. They come from a fixed seed per size,
+                     so hash codes are the same in every run.
+    zobrist_to_move: key for white to play
+    """
+    def __init__(self, size):
+        assert 2 <= size <= MAXSIZE
+        self.size = size
+        self.NS = size + 1
+        self.maxpoint = size * size + 3 * (size + 1)
+        NS = self.NS
+        board = np.full(self.maxpoint, BORDER, dtype = COLOR_DTYPE)
+        row = np.zeros(self.maxpoint, dtype = np.int32)
+        col = np.zeros(self.maxpoint, dtype = np.int32)
+        for r in range(1, size + 1):
+            start = coord_to_point(r, 1, size)
+            board[start : start + size] = EMPTY
+            row[start : start + size] = r
+            col[start : start + size] = np.arange(1, size + 1)
+        points = where1d(board == EMPTY).astype(POINT_DTYPE)
+        point_index = np.full(self.maxpoint, -1, dtype = POINT_DTYPE)
+        point_index[points] = np.arange(len(points))
+        edge_distance = np.full(self.maxpoint, -1, dtype = np.int32)
+        edge_distance[points] = np.minimum(
+            np.minimum(row[points], col[points]),
+            np.minimum(size + 1 - row[points], size + 1 - col[points])) - 1
+        # off board points only need valid indices: clip to the array
+        all_points = np.arange(self.maxpoint)[:, None]
+        neighbor_table = np.clip(all_points + np.array([-1, 1, -NS, NS]),
+                                 0, self.maxpoint - 1)
+        diag_table = np.clip(all_points + np.array([-NS - 1, -NS + 1,
+                                                    NS - 1, NS + 1]),
+                             0, self.maxpoint - 1)
+        window_33 = np.clip(all_points + np.array([-NS - 1, -NS, -NS + 1,
+                                                   -1, 0, 1,
+                                                   NS - 1, NS, NS + 1]),
+                            0, self.maxpoint - 1)
+        neighbors = []
+        for point in range(self.maxpoint):
+            if board[point] == BORDER:
+                neighbors.append(())
+            else:
+                neighbors.append(tuple(int(nb) for nb in neighbor_table[point]
+                                       if board[nb] != BORDER))
+        self.neighbors = tuple(neighbors)
+        self.points = points
+        self.point_index = point_index
+        self.row = row
+        self.col = col
+        self.edge_distance = edge_distance
+        self.neighbor_table = neighbor_table.astype(POINT_DTYPE)
+        self.diag_table = diag_table.astype(POINT_DTYPE)
+        self.window_33 = window_33.astype(POINT_DTYPE)
+        self.empty_board = board
+        rng = random.Random(ZOBRIST_SEED + size)
+        self.zobrist = tuple((0, rng.getrandbits(64), rng.getrandbits(64))
+                             for _ in range(self.maxpoint))
+        self.zobrist_to_move = rng.getrandbits(64)
+        for table in (self.points, self.point_index, self.row, self.col,
+                      self.edge_distance, self.neighbor_table,
+                      self.diag_table, self.window_33, self.empty_board):
+            table.flags.writeable = False
+
+_geometries = {}
+
+def get_geometry(size):
+    """
+    Return the shared BoardGeometry for the given board size.
+    """
+    geometry = _geometries.get(size)
+    if geometry is None:
+        geometry = BoardGeometry(size)
+        _geometries[size] = geometry
+    return geometry
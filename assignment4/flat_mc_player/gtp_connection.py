@@ -314,12 +314,8 @@ class GtpConnection():
         self.respond(sorted_moves)
 
     def gogui_rules_legal_moves_cmd(self, args):
-        empties = self.board.get_empty_points()
         color = self.board.current_player
-        legal_moves = []
-        for move in empties:
-            if self.board.is_legal(move, color):
-                legal_moves.append(move)
+        legal_moves = self.board.get_legal_moves(color)
 
         gtp_moves = []
         for move in legal_moves:
@@ -351,13 +347,8 @@ class GtpConnection():
         self.respond(str)
     
     def gogui_rules_final_result_cmd(self, args):
-        empties = self.board.get_empty_points()
         color = self.board.current_player
-        legal_moves = []
-        for move in empties:
-            if self.board.is_legal(move, color):
-                legal_moves.append(move)
-        if not legal_moves:
+        if not self.board.has_legal_move(color):
             result = "black" if self.board.current_player == WHITE else "white"
         else:
             result = "unknown"
@@ -6,15 +6,14 @@ import numpy as np
 import random 
 
 def undo(board, move):
-    board.board[move] = EMPTY
-    board.current_player = GoBoardUtil.opponent(board.current_player)
+    popped = board.pop_move()
+    assert popped == move
 
 def play_move(board, move, color):
-    board.play_move(move, color)
+    board.push_move(move, color)
 
 def game_result(board):    
-    legal_moves = GoBoardUtil.generate_legal_moves(board, board.current_player)
-    if not legal_moves:
+    if not board.has_legal_move(board.current_player):
         result = BLACK if board.current_player == WHITE else WHITE
     else:
         result = None
@@ -0,0 +1,271 @@
+"""
+bit_board.py
+
+NoGo board stored as two Python integers used as bit sets,
+one for the black and one for the white stones.
+Bit i corresponds to point i of the padded 1-dimensional encoding
+of SimpleGoBoard (see GoBoardUtil.coord_to_point), so both boards use
+the same point numbers. The BORDER points between rows are never set,
+which makes shifting by 1 or NS a neighbor operation:
+shifted bits that leave the board land on a BORDER point and are
+removed by masking with on_board.
+
+Implements the same interface as SimpleGoBoard for
+- get_color, pt, get_empty_points
+- is_legal, play_move, push_move, pop_move
+- copy, reset
+and in addition legal_moves_mask, which computes the legal moves of
+a color for the whole board with a few bit operations per block.
+"""
+
+import numpy as np
+from board_util import GoBoardUtil, BLACK, WHITE, EMPTY, BORDER, \
+                       is_black_white, coord_to_point, get_geometry
+
+"""
+Boards up to 9x9 have at most 111 padded points
+"""
+MAX_BITBOARD_SIZE = 9
+
+def bits_to_points(bits):
+    """
+    List of the points set in bits, in increasing order.
+    """
+    points = []
+    while bits:
+        low = bits & -bits
+        points.append(low.bit_length() - 1)
+        bits ^= low
+    return points
+
+class BitBoard(object):
+
+    def __init__(self, size):
+        """
+        Creates a NoGo bitboard of given size
+        """
+        assert 2 <= size <= MAX_BITBOARD_SIZE
+        self.reset(size)
+
+    def reset(self, size):
+        """
+        Creates a start state, an empty board with the given size
+        """
+        geometry = get_geometry(size)
+        self.geometry = geometry
+        self.size = size
+        self.NS = size + 1
+        self.WE = 1
+        self.maxpoint = geometry.maxpoint
+        self.on_board = 0
+        for point in geometry.points:
+            self.on_board |= 1 << int(point)
+        self.black = 0
+        self.white = 0
+        self.current_player = BLACK
+        self.move_stack = []
+
+    @staticmethod
+    def from_board(goboard):
+        """
+        Create a BitBoard with the position of a SimpleGoBoard.
+        """
+        b = BitBoard(goboard.size)
+        for point in np.where(goboard.board == BLACK)[0]:
+            b.black |= 1 << int(point)
+        for point in np.where(goboard.board == WHITE)[0]:
+            b.white |= 1 << int(point)
+        b.current_player = goboard.current_player
+        return b
+
+    def copy(self):
+        """
+        Copy of the board. The move stack is not copied.
+        """
+        b = BitBoard.__new__(BitBoard)
+        b.geometry = self.geometry
+        b.size = self.size
+        b.NS = self.NS
+        b.WE = self.WE
+        b.maxpoint = self.maxpoint
+        b.on_board = self.on_board
+        b.black = self.black
+        b.white = self.white
+        b.current_player = self.current_player
+        b.move_stack = []
+        return b
+
+    @property
+    def board(self):
+        """
+        The position as a 1-d numpy array, in the encoding of SimpleGoBoard.
+        Built on every access, use get_color in loops.
+        """
+        board = np.copy(self.geometry.empty_board)
+        board[bits_to_points(self.black)] = BLACK
+        board[bits_to_points(self.white)] = WHITE
+        return board
+
+    def pt(self, row, col):
+        return coord_to_point(row, col, self.size)
+
+    def row_start(self, row):
+        assert row >= 1
+        assert row <= self.size
+        return row * self.NS + 1
+
+    def get_color(self, point):
+        bit = 1 << int(point)
+        if self.black & bit:
+            return BLACK
+        if self.white & bit:
+            return WHITE
+        if self.on_board & bit:
+            return EMPTY
+        return BORDER
+
+    def _stones(self, color):
+        if color == BLACK:
+            return self.black
+        return self.white
+
+    def _empty(self):
+        return self.on_board & ~(self.black | self.white)
+
+    def get_empty_points(self):
+        """
+        Return:
+            The empty points on the board
+        """
+        return np.array(bits_to_points(self._empty()), dtype = np.int64)
+
+    def _neighbors(self, bits):
+        """
+        All on-board points adjacent to a point in bits.
+        May include points of bits itself.
+        """
+        NS = self.NS
+        return ((bits << 1) | (bits >> 1) | (bits << NS) | (bits >> NS)) \
+               & self.on_board
+
+    def _block(self, seed, stones):
+        """
+        Flood fill: the block of stones connected to the points in seed.
+        """
+        block = seed
+        while True:
+            grown = (block | self._neighbors(block)) & stones
+            if grown == block:
+                return block
+            block = grown
+
+    def _liberties(self, block):
+        return self._neighbors(block) & self._empty()
+
+    def _move_error(self, point, color):
+        """
+        Check the move of color on point against the NoGo rules.
+        Returns None if the move is legal, otherwise the reason
+        ("occupied", "capture" or "suicide").
+        """
+        bit = 1 << int(point)
+        if not self._empty() & bit:
+            return "occupied"
+        own = self._stones(color)
+        opp = self._stones(GoBoardUtil.opponent(color))
+        nbs = self._neighbors(bit)
+        opp_nbs = nbs & opp
+        while opp_nbs:
+            block = self._block(opp_nbs & -opp_nbs, opp)
+            if self._liberties(block) == bit:
+                return "capture"
+            opp_nbs &= ~block
+        if nbs & self._empty():
+            return None
+        own_nbs = nbs & own
+        while own_nbs:
+            block = self._block(own_nbs & -own_nbs, own)
+            if self._liberties(block) & ~bit:
+                return None
+            own_nbs &= ~block
+        return "suicide"
+
+    def is_legal(self, point, color):
+        """
+        Check if the move is legal
+        """
+        assert is_black_white(color)
+        return self._move_error(point, color) == None
+
+    def legal_moves_mask(self, color):
+        """
+        The legal moves of color, as bits.
+        A point is illegal if it takes the last liberty of an opponent
+        block. Otherwise it is legal if it has an empty neighbor, or
+        joins a block of color which has another liberty.
+        """
+        assert is_black_white(color)
+        own = self._stones(color)
+        opp = self._stones(GoBoardUtil.opponent(color))
+        empty = self._empty()
+        captures = 0
+        remaining = opp
+        while remaining:
+            block = self._block(remaining & -remaining, opp)
+            libs = self._neighbors(block) & empty
+            if libs & (libs - 1) == 0: # single liberty
+                captures |= libs
+            remaining &= ~block
+        safe = 0
+        remaining = own
+        while remaining:
+            block = self._block(remaining & -remaining, own)
+            libs = self._neighbors(block) & empty
+            if libs & (libs - 1): # at least two liberties
+                safe |= block
+            remaining &= ~block
+        return empty & ~captures \
+               & (self._neighbors(empty) | self._neighbors(safe))
+
+    def get_legal_moves(self, color):
+        """
+        List of the legal moves of color, in increasing point order.
+        """
+        return bits_to_points(self.legal_moves_mask(color))
+
+    def play_move(self, point, color):
+        """
+        Play a move of color on point
+        Returns boolean: whether move was legal
+        """
+        assert is_black_white(color)
+        error = self._move_error(point, color)
+        if error != None:
+            raise ValueError(error)
+        if color == BLACK:
+            self.black |= 1 << int(point)
+        else:
+            self.white |= 1 << int(point)
+        self.current_player = GoBoardUtil.opponent(color)
+        return True
+
+    def push_move(self, point, color):
+        """
+        Play a move like play_move, so that pop_move can undo it.
+        """
+        self.move_stack.append((point, self.black, self.white,
+                                self.current_player))
+        try:
+            return self.play_move(point, color)
+        except ValueError:
+            self.move_stack.pop()
+            raise
+
+    def pop_move(self):
+        """
+        Undo the last move played by push_move.
+        Returns the point of that move.
+        """
+        point, self.black, self.white, self.current_player = \
+            self.move_stack.pop()
+        return point
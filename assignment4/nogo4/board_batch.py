@@ -0,0 +1,239 @@
+"""
+board_batch.py
+
+A batch of NoGo positions of the same size, played in lockstep.
+The positions are the rows of a 2-d int8 array, each row in the
+padded 1-dimensional encoding of SimpleGoBoard
+(see GoBoardUtil.coord_to_point).
+Each call advances all unfinished games by one move, so one
+random playout of the whole batch costs about one numpy call
+per move instead of one Python loop per playout.
+
+Legal moves are computed for all rows at once:
+- stones are labeled by block, by propagating the largest point
+  number through neighbors of the same color
+- the liberties of each block are counted with np.bincount over
+  the labels of the blocks next to each empty point
+- an empty point is illegal for a color if it is the only liberty
+  of an adjacent opponent block (capture), or if it has no empty
+  neighbor and no adjacent block of color with another liberty
+  (suicide).
+"""
+
+import numpy as np
+from board_util import BLACK, WHITE, EMPTY, BORDER
+from endgame_db import position_keys
+
+"""
+Number of 3x3 patterns, 4 colors on each of the 8 neighbors
+"""
+NUM_PATTERNS = 4 ** 8
+
+"""
+Color table which exchanges BLACK and WHITE, for the patterns of WHITE
+"""
+SWAP_COLORS = np.array([EMPTY, WHITE, BLACK, BORDER], dtype = np.int8)
+
+def weight_table(weights):
+    """
+    numpy array of the pattern weights read from the weights file,
+    indexed by pattern code. Missing patterns have weight 0.
+    """
+    table = np.zeros(NUM_PATTERNS, dtype = np.float64)
+    for code, weight in weights.items():
+        table[code] = weight
+    return table
+
+class BoardBatch(object):
+
+    def __init__(self, goboard, n):
+        """
+        A batch of n copies of the position on goboard.
+        """
+        geometry = goboard.geometry
+        self.geometry = geometry
+        self.size = goboard.size
+        self.NS = goboard.NS
+        self.maxpoint = geometry.maxpoint
+        self.n = n
+        self.board = np.tile(goboard.board.astype(np.int8), (n, 1))
+        self.current_player = np.full(n, goboard.current_player,
+                                      dtype = np.int8)
+        # EMPTY while the game in a row is not over
+        self.winner = np.full(n, EMPTY, dtype = np.int8)
+        # columns of the (n, number of points) arrays below are the
+        # on-board points, in the order of geometry.points
+        self.points = geometry.points
+        self._nbs = geometry.neighbor_table[self.points]
+        # pattern neighbors in the order of Nogo.getWeight:
+        # NW, N, NE, W, E, SW, S, SE as seen from the top of the board
+        self._pattern_nbs = geometry.window_33[self.points][:,
+                                                  [6, 7, 8, 3, 5, 0, 1, 2]]
+        self._rows = np.arange(n)[:, None]
+
+    @staticmethod
+    def for_moves(goboard, moves, color, num_sim):
+        """
+        A batch with num_sim rows for each move in moves.
+        Rows i * num_sim to (i + 1) * num_sim - 1 start with
+        moves[i] played by color on the position of goboard.
+        """
+        batch = BoardBatch(goboard, len(moves) * num_sim)
+        batch.play(np.repeat(np.array(moves, dtype = np.int64), num_sim))
+        return batch
+
+    def play(self, moves, rows = None):
+        """
+        Play moves[i] for the current player of rows[i],
+        for all rows if rows is None.
+        The moves are not checked, they must be legal.
+        """
+        if rows is None:
+            rows = np.arange(self.n)
+        color = self.current_player[rows]
+        self.board[rows, moves] = color
+        self.current_player[rows] = BLACK + WHITE - color
+
+    def _block_labels(self):
+        """
+        (n, maxpoint) array of block labels: for each stone, the
+        largest point of its block. 0 for other points.
+        """
+        board = self.board
+        is_stone = (board == BLACK) | (board == WHITE)
+        labels = np.where(is_stone, np.arange(self.maxpoint), 0)
+        stones = is_stone[:, self.points]
+        colors = board[:, self.points]
+        same = [stones & (board[:, self._nbs[:, i]] == colors)
+                for i in range(4)]
+        while True:
+            old = labels[:, self.points]
+            new = old
+            for i in range(4):
+                new = np.maximum(new, np.where(same[i],
+                                    labels[:, self._nbs[:, i]], 0))
+            # pointer jumping: take over the label of the label
+            new = labels[self._rows, new]
+            new = np.maximum(new, old)
+            if np.array_equal(new, old):
+                return labels
+            labels[:, self.points] = new
+
+    def _liberty_counts(self, labels):
+        """
+        (n, maxpoint) array with the number of liberties of each block,
+        indexed by the block label.
+        """
+        empty = self.board[:, self.points] == EMPTY
+        row_offset = self._rows * self.maxpoint
+        nb_labels = [labels[:, self._nbs[:, i]] for i in range(4)]
+        keys = []
+        counted = []
+        for i in range(4):
+            # count a liberty only once for a block next to it
+            # in several directions
+            new = empty & (nb_labels[i] != 0)
+            for j in range(i):
+                new &= nb_labels[i] != nb_labels[j]
+            keys.append(row_offset + nb_labels[i])
+            counted.append(new)
+        counts = np.bincount(np.concatenate(keys, axis = None),
+                             weights = np.concatenate(counted, axis = None),
+                             minlength = self.n * self.maxpoint)
+        return counts.reshape(self.n, self.maxpoint)
+
+    def legal_moves_mask(self):
+        """
+        Boolean (n, number of points) array of the legal moves of the
+        current player of each row. Column j is geometry.points[j].
+        """
+        board = self.board
+        labels = self._block_labels()
+        libs = self._liberty_counts(labels)
+        colors = self.current_player[:, None]
+        opp = BLACK + WHITE - colors
+        empty = board[:, self.points] == EMPTY
+        capture = np.zeros(empty.shape, dtype = bool)
+        has_liberty = np.zeros(empty.shape, dtype = bool)
+        for i in range(4):
+            nb_colors = board[:, self._nbs[:, i]]
+            nb_libs = libs[self._rows, labels[:, self._nbs[:, i]]]
+            capture |= (nb_colors == opp) & (nb_libs == 1)
+            has_liberty |= (nb_colors == EMPTY) \
+                           | ((nb_colors == colors) & (nb_libs > 1))
+        return empty & ~capture & has_liberty
+
+    def pattern_codes(self):
+        """
+        (n, number of points) array of the 3x3 pattern code of each
+        point, as computed by Nogo.getWeight for the current player.
+        """
+        white = (self.current_player == WHITE)[:, None]
+        board = np.where(white, SWAP_COLORS[self.board], self.board)
+        codes = np.zeros((self.n, len(self.points)), dtype = np.int32)
+        for i in range(8):
+            codes += board[:, self._pattern_nbs[:, i]].astype(np.int32) \
+                     << (2 * i)
+        return codes
+
+    def select_moves(self, legal, weights = None):
+        """
+        Choose a legal move for each row, as a column index.
+        With a weight table, moves are chosen with probability
+        proportional to the weight of their pattern, otherwise
+        uniformly. Rows without legal moves get an arbitrary column.
+        """
+        if weights is None:
+            probs = legal.astype(np.float64)
+        else:
+            probs = np.where(legal, weights[self.pattern_codes()], 0.0)
+            # uniform choice when no legal move has a weight
+            no_weight = probs.sum(axis = 1) == 0
+            probs[no_weight] = legal[no_weight]
+        cumulative = np.cumsum(probs, axis = 1)
+        r = np.random.random_sample(self.n) * cumulative[:, -1]
+        choice = (cumulative <= r[:, None]).sum(axis = 1)
+        return np.minimum(choice, len(self.points) - 1)
+
+    def probe_endgames(self, endgame_db, legal, active):
+        """
+        Set the winner of the active rows whose position is in
+        endgame_db (see endgame_db.py), legal as in legal_moves_mask.
+        """
+        if endgame_db.size != self.size:
+            return
+        num_moves = legal.sum(axis = 1)
+        rows = np.nonzero(active & (num_moves <= endgame_db.max_moves))[0]
+        if len(rows) == 0:
+            return
+        color = self.current_player[rows]
+        found = endgame_db.lookup_many(position_keys(self.size,
+                                                     self.board[rows],
+                                                     color == WHITE))
+        hit = found >= 0
+        self.winner[rows[hit]] = np.where(found[hit] == 1, color[hit],
+                                          BLACK + WHITE - color[hit])
+
+    def playout(self, weights = None, endgame_db = None):
+        """
+        Play all games to the end, choosing moves as in select_moves.
+        Returns the array of winners: in NoGo, the player who has
+        no legal move loses.
+        With an endgame_db, games stop at the positions in it.
+        """
+        active = self.winner == EMPTY
+        while True:
+            legal = self.legal_moves_mask()
+            has_move = legal.any(axis = 1)
+            finished = active & ~has_move
+            self.winner[finished] = BLACK + WHITE \
+                                    - self.current_player[finished]
+            active &= has_move
+            if endgame_db is not None:
+                self.probe_endgames(endgame_db, legal, active)
+                active &= self.winner == EMPTY
+            if not active.any():
+                return self.winner
+            rows = np.nonzero(active)[0]
+            choice = self.select_moves(legal, weights)
+            self.play(self.points[choice[rows]], rows)
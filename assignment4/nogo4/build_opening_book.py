@@ -0,0 +1,92 @@
+#!/usr/local/bin/python3
+#/usr/bin/python3
+# Set the path to your python3 above
+
+"""
+Builds the opening book of a board size, see opening_book.py.
+Run it from the assignment4 directory, like nogo4.py.
+
+The book covers the positions of the first plies of the games of the
+player as Black and as White: where the player is to move, the move
+is found by a batch simulation search with sims simulations per legal
+move, much more than in a game, and the game goes on with that move.
+Where the opponent is to move, all its legal moves are followed.
+Positions which are the same up to symmetry are searched only once.
+
+Usage: python3 nogo4/build_opening_book.py plies sims [size]
+"""
+
+import sys
+import time
+import ucb
+from board_util import BLACK
+from simple_board import SimpleGoBoard
+from opening_book import book_path, book_entry, write_opening_book
+from endgame_db import canonical_key
+from nogo4 import Nogo
+
+def search(player, board, sims):
+    """ The best move of the player to move on board """
+    color = board.current_player
+    player.num_sim = sims
+    return ucb.runBatch(player, board, board.get_legal_moves(color), color,
+                        player.weight_table)
+
+class BookBuilder(object):
+
+    def __init__(self, size, plies, sims):
+        self.size = size
+        self.plies = plies
+        self.sims = sims
+        self.player = Nogo()
+        self.book = {}
+        self.start = time.time()
+
+    def expand(self, board, ply, player_to_move):
+        """
+        Add the positions from ply to self.plies after board
+        to the book.
+        """
+        if ply >= self.plies:
+            return
+        color = board.current_player
+        legalMoves = board.get_legal_moves(color)
+        if not legalMoves:
+            return
+        if player_to_move:
+            key, _ = canonical_key(board)
+            if key in self.book:
+                return
+            move = search(self.player, board, self.sims)
+            key, bookMove = book_entry(board, move)
+            self.book[key] = bookMove
+            print("ply {}: {} positions {:.1f}s".format(ply, len(self.book),
+                  time.time() - self.start), file = sys.stderr, flush = True)
+            board.push_move(move, color)
+            self.expand(board, ply + 1, False)
+            board.pop_move()
+            return
+        seen = set()
+        for move in legalMoves:
+            board.push_move(move, color)
+            key, _ = canonical_key(board)
+            if key not in seen:
+                seen.add(key)
+                self.expand(board, ply + 1, True)
+            board.pop_move()
+
+    def build(self):
+        board = SimpleGoBoard(self.size)
+        assert board.current_player == BLACK
+        # the player as Black, then as White
+        self.expand(board, 0, True)
+        self.expand(board, 0, False)
+        path = book_path('nogo4', self.size)
+        write_opening_book(path, self.size, self.book)
+        print("wrote {} positions to {}".format(len(self.book), path))
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        sys.exit(__doc__)
+    size = int(sys.argv[3]) if len(sys.argv) > 3 else 7
+    BookBuilder(size, int(sys.argv[1]), int(sys.argv[2])).build()
@@ -0,0 +1,176 @@
+"""
+endgame_db.py
+
+Database of solved NoGo endgames: positions in which the player to
+move has at most max_moves legal moves, with whether that player wins.
+It is built offline by assignment2/build_endgame_db.py, and probed by
+the minimax solver and by the playouts of the Monte Carlo player,
+which can stop with an exact result.
+
+Positions are keyed by a hash code which is the same for all 8
+symmetric positions: the smallest Zobrist hash code of the stones
+over the symmetries, with the key for the side to move. The Zobrist
+keys come from the same fixed seed as SimpleGoBoard.hash, so in
+assignment 2 the key is SimpleGoBoard.canonical_hash().
+
+There is one file per board size, see database_path. It has a header
+of HEADER_WORDS little endian uint64: MAGIC, board size, max_moves
+and the number of entries, followed by the entries in increasing
+order, one uint64 each. The lowest bit of an entry is 1 if the player
+to move wins, the other bits are those of the key.
+A lookup is a binary search of the memory-mapped entries.
+"""
+
+import os
+import random
+import numpy as np
+from board_util import BLACK, WHITE, ZOBRIST_SEED, get_symmetries
+
+MAGIC = 0x3142444f474f4e  # "NOGODB1"
+HEADER_WORDS = 4
+KEY_MASK = np.uint64(2 ** 64 - 2)
+
+_key_tables = {}
+
+def database_path(directory, size):
+    return os.path.join(directory, 'endgame_{0}x{0}.db'.format(size))
+
+def _key_table(size):
+    """
+    (keys, to_move): keys[s, point, color] is the Zobrist key of a
+    stone of color on the image of point under symmetry s, 0 for
+    EMPTY and BORDER. to_move is the key for white to play.
+    """
+    table = _key_tables.get(size)
+    if table is None:
+        maxpoint = size * size + 3 * (size + 1)
+        # same keys as get_zobrist_keys
+        rng = random.Random(ZOBRIST_SEED + size)
+        zobrist = [(0, rng.getrandbits(64), rng.getrandbits(64))
+                   for _ in range(maxpoint)]
+        to_move = np.uint64(rng.getrandbits(64))
+        symmetries = get_symmetries(size)
+        keys = np.zeros((len(symmetries), maxpoint, 4), dtype = np.uint64)
+        for s, image in enumerate(symmetries):
+            for point in range(maxpoint):
+                if image[point] != 0:
+                    keys[s, point, BLACK] = zobrist[image[point]][BLACK]
+                    keys[s, point, WHITE] = zobrist[image[point]][WHITE]
+        table = (keys, to_move)
+        _key_tables[size] = table
+    return table
+
+def position_keys(size, boards, white_to_move):
+    """
+    Keys of the positions in the rows of the 2-d array boards,
+    in the padded 1-d encoding of SimpleGoBoard.
+    white_to_move: boolean array, True for the rows with WHITE to play
+    """
+    keys, to_move = _key_table(size)
+    points = np.arange(boards.shape[1])
+    codes = np.bitwise_xor.reduce(keys[:, points, boards], axis = 2)
+    codes = codes.min(axis = 0)
+    return np.where(white_to_move, codes ^ to_move, codes)
+
+def position_key(board):
+    return int(position_keys(board.size, board.board[None, :],
+                             board.current_player == WHITE)[0])
+
+def canonical_key(board):
+    """
+    (position_key(board), s) with a symmetry s which gives the key:
+    the image of the position under s is its canonical orientation.
+    """
+    keys, to_move = _key_table(board.size)
+    points = np.arange(len(board.board))
+    codes = np.bitwise_xor.reduce(keys[:, points, board.board], axis = 1)
+    s = int(np.argmin(codes))
+    code = codes[s]
+    if board.current_player == WHITE:
+        code ^= to_move
+    return int(code), s
+
+def write_endgame_db(path, size, max_moves, keys, wins):
+    """
+    Write a database of the positions with the given keys, and
+    whether the player to move wins in each of them.
+    """
+    entries = (np.asarray(keys, dtype = np.uint64) & KEY_MASK) \
+              | np.asarray(wins, dtype = np.uint64)
+    entries = np.sort(entries)
+    # one entry per key
+    first = np.ones(len(entries), dtype = bool)
+    first[1:] = (entries[1:] & KEY_MASK) != (entries[:-1] & KEY_MASK)
+    entries = entries[first]
+    header = np.array([MAGIC, size, max_moves, len(entries)],
+                      dtype = '<u8')
+    with open(path, 'wb') as f:
+        f.write(header.tobytes())
+        f.write(entries.astype('<u8').tobytes())
+
+def load_endgame_db(path):
+    """
+    The database in the file path, None if there is no such file.
+    """
+    if not os.path.exists(path):
+        return None
+    return EndgameDB(path)
+
+class EndgameDB(object):
+
+    def __init__(self, path):
+        header = np.fromfile(path, dtype = '<u8', count = HEADER_WORDS)
+        if len(header) < HEADER_WORDS or header[0] != MAGIC:
+            raise ValueError("{} is not an endgame database".format(path))
+        self.path = path
+        self.size = int(header[1])
+        self.max_moves = int(header[2])
+        num_entries = int(header[3])
+        if num_entries > 0:
+            self.entries = np.memmap(path, dtype = '<u8', mode = 'r',
+                                     offset = HEADER_WORDS * 8,
+                                     shape = (num_entries,))
+        else:
+            self.entries = np.zeros(0, dtype = np.uint64)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        return "{}x{} max_moves {} positions {}".format(
+            self.size, self.size, self.max_moves, len(self))
+
+    def lookup(self, code):
+        """
+        Whether the player to move wins in the position with key code,
+        None if it is not in the database.
+        """
+        key = np.uint64(code) & KEY_MASK
+        i = int(np.searchsorted(self.entries, key))
+        if i == len(self.entries) or self.entries[i] & KEY_MASK != key:
+            return None
+        return bool(self.entries[i] & np.uint64(1))
+
+    def lookup_many(self, codes):
+        """
+        lookup for an array of keys. Returns an int8 array with
+        1 for a win, 0 for a loss and -1 if not found.
+        """
+        keys = np.asarray(codes, dtype = np.uint64) & KEY_MASK
+        if len(self.entries) == 0:
+            return np.full(len(keys), -1, dtype = np.int8)
+        i = np.minimum(np.searchsorted(self.entries, keys),
+                       len(self.entries) - 1)
+        entries = self.entries[i]
+        return np.where((entries & KEY_MASK) == keys,
+                        (entries & np.uint64(1)).astype(np.int8), -1)
+
+    def probe(self, board, num_moves):
+        """
+        Whether the player to move on board wins, if the position has
+        num_moves <= max_moves legal moves and is in the database,
+        else None.
+        """
+        if board.size != self.size or num_moves > self.max_moves:
+            return None
+        return self.lookup(position_key(board))
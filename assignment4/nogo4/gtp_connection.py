@@ -10,6 +10,7 @@ import traceback
 from sys import stdin, stdout, stderr
 from board_util import GoBoardUtil, BLACK, WHITE, EMPTY, BORDER, \
                        MAXSIZE, coord_to_point
+from legal_move_cache import LegalMoveCache
 import numpy as np
 import re
 import signal
@@ -30,6 +31,9 @@ class GtpConnection():
         self._debug_mode = debug_mode
         self.go_engine = go_engine
         self.board = board
+        # legal moves of the positions of this game, shared with the engine
+        self.legal_move_cache = LegalMoveCache()
+        go_engine.legal_move_cache = self.legal_move_cache
         signal.signal(signal.SIGALRM, self.handler)
         self.commands = {
             "protocol_version": self.protocol_version_cmd,
@@ -52,7 +56,8 @@ class GtpConnection():
             "gogui-rules_board": self.gogui_rules_board_cmd,
             "gogui-rules_final_result": self.gogui_rules_final_result_cmd,
             "gogui-analyze_commands": self.gogui_analyze_cmd,
-            "timelimit": self.timelimit_cmd
+            "timelimit": self.timelimit_cmd,
+            "legal_moves_cache": self.legal_moves_cache_cmd
         }
         self.timelimit = 25
 
@@ -154,6 +159,7 @@ class GtpConnection():
         Reset the board to empty board of given size
         """
         self.board.reset(size)
+        self.legal_move_cache.clear()
 
     def board2d(self):
         return str(GoBoardUtil.get_twoD_board(self.board))
@@ -216,7 +222,7 @@ class GtpConnection():
         """
         board_color = args[0].lower()
         color = color_to_int(board_color)
-        moves = GoBoardUtil.generate_legal_moves(self.board, color)
+        moves = self.legal_move_cache.get_legal_moves(self.board, color)
         gtp_moves = []
         for move in moves:
             coords = point_to_coord(move, self.board.size)
@@ -264,21 +270,23 @@ class GtpConnection():
         assert color == self.board.current_player
 
         # check if the game ends
-        legal_moves = GoBoardUtil.generate_legal_moves(self.board, self.board.current_player)
+        legal_moves = self.legal_move_cache.get_legal_moves(self.board, color)
         if not legal_moves:
             self.respond("resign")
             self.board.current_player = GoBoardUtil.opponent(self.board.current_player)
             return 
 
-        move = None
-        try:
-            signal.alarm(int(self.timelimit))
-            self.sboard = self.board.copy()
-            move = self.go_engine.get_move(self.board, color)
-            self.board=self.sboard
-            signal.alarm(0)
-        except Exception as e:
-            move = self.go_engine.best_move
+        # the first moves of a game come from the opening book
+        move = self.go_engine.get_book_move(self.board, legal_moves)
+        if move is None:
+            try:
+                signal.alarm(int(self.timelimit))
+                self.sboard = self.board.copy()
+                move = self.go_engine.get_move(self.board, color)
+                self.board=self.sboard
+                signal.alarm(0)
+            except Exception as e:
+                move = self.go_engine.best_move
 
 
         if move is None:
@@ -294,6 +302,10 @@ class GtpConnection():
         else:
             self.respond("resign")
 
+    def legal_moves_cache_cmd(self, args):
+        """ Hit and miss counts of the legal move cache """
+        self.respond(str(self.legal_move_cache))
+
     def gogui_rules_game_id_cmd(self, args):
         self.respond("NoGo")
     
@@ -306,7 +318,7 @@ class GtpConnection():
             """
         board_color = args[0].lower()
         color = color_to_int(board_color)
-        moves = GoBoardUtil.generate_legal_moves(self.board, color)
+        moves = self.legal_move_cache.get_legal_moves(self.board, color)
         gtp_moves = []
         for move in moves:
             coords = point_to_coord(move, self.board.size)
@@ -315,12 +327,8 @@ class GtpConnection():
         self.respond(sorted_moves)
 
     def gogui_rules_legal_moves_cmd(self, args):
-        empties = self.board.get_empty_points()
         color = self.board.current_player
-        legal_moves = []
-        for move in empties:
-            if self.board.is_legal(move, color):
-                legal_moves.append(move)
+        legal_moves = self.legal_move_cache.get_legal_moves(self.board, color)
 
         gtp_moves = []
         for move in legal_moves:
@@ -352,13 +360,8 @@ class GtpConnection():
         self.respond(str)
     
     def gogui_rules_final_result_cmd(self, args):
-        empties = self.board.get_empty_points()
         color = self.board.current_player
-        legal_moves = []
-        for move in empties:
-            if self.board.is_legal(move, color):
-                legal_moves.append(move)
-        if not legal_moves:
+        if not self.board.has_legal_move(color):
             result = "black" if self.board.current_player == WHITE else "white"
         else:
             result = "unknown"
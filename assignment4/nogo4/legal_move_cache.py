@@ -0,0 +1,50 @@
+"""
+legal_move_cache.py
+
+Bounded LRU cache of legal move lists, shared by the GTP commands
+and the engine, so repeated queries on the same position in one turn
+only compute the legal moves once.
+
+Entries are keyed by board size, the Zobrist hash code of the board
+(which includes the side to move) and the color, so playing or
+undoing a move changes the key, and going back to a position finds
+its entry again. clear() must be called when the board is reset.
+"""
+
+from collections import OrderedDict
+
+class LegalMoveCache(object):
+
+    def __init__(self, capacity = 256):
+        self.capacity = capacity
+        self.table = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return "hits {} misses {} size {}".format(self.hits, self.misses,
+                                                  len(self.table))
+
+    def clear(self):
+        """
+        Remove all entries. The counters are kept.
+        """
+        self.table.clear()
+
+    def get_legal_moves(self, board, color):
+        """
+        The legal moves of color on board, in increasing point order.
+        Returns a tuple, which is shared between callers.
+        """
+        key = (board.size, board.hash, color)
+        moves = self.table.get(key)
+        if moves is not None:
+            self.table.move_to_end(key)
+            self.hits += 1
+            return moves
+        self.misses += 1
+        moves = tuple(board.get_legal_moves(color))
+        self.table[key] = moves
+        if len(self.table) > self.capacity:
+            self.table.popitem(last = False)
+        return moves
@@ -1,6 +1,10 @@
 from gtp_connection import GtpConnection
 from board_util import GoBoardUtil, EMPTY, BLACK, WHITE
 from simple_board import SimpleGoBoard
+from board_batch import weight_table
+from legal_move_cache import LegalMoveCache
+from endgame_db import load_endgame_db, database_path
+from opening_book import load_opening_book, book_path
 import sys
 import ucb
 import numpy as np
@@ -9,15 +13,14 @@ from math import log, sqrt
 
 
 def undo(board, move):
-    board.board[move] = EMPTY
-    board.current_player = GoBoardUtil.opponent(board.current_player)
+    popped = board.pop_move()
+    assert popped == move
 
 def play_move(board, move, color):
-    board.play_move(move, color)
+    board.push_move(move, color)
 
 def game_result(board):    
-    legal_moves = GoBoardUtil.generate_legal_moves(board, board.current_player)
-    if not legal_moves:
+    if not board.has_legal_move(board.current_player):
         result = BLACK if board.current_player == WHITE else WHITE
     else:
         result = None
@@ -34,8 +37,22 @@ class Nogo():
         self.name = "NoGo Assignment 4"
         self.version = 1.0
         self.weights = self.openFile('nogo4/weights')
+        self.weight_table = weight_table(self.weights)
         self.UCB_ON = True
+        # replaced by the cache of the GtpConnection
+        self.legal_move_cache = LegalMoveCache()
+        # Play the simulations in lockstep with BoardBatch.
+        # They are much faster, so BATCH_FACTOR times more are played.
+        self.BATCH_ON = True
+        self.BATCH_FACTOR = 4
         self.best_move = None
+        # Endgame databases by board size, None if there is no file.
+        # They are built by assignment2/build_endgame_db.py and copied
+        # to nogo4/. Simulations stop at a position in the database.
+        self.endgame_dbs = {}
+        # Opening books by board size, None if there is no file.
+        # They are built by build_opening_book.py.
+        self.opening_books = {}
 
     def openFile(self, fileName):
         weights = {}
@@ -45,6 +62,30 @@ class Nogo():
                 weights[int(item[0])] = float(item[1])
         return weights
 
+    def get_endgame_db(self, size):
+        if size not in self.endgame_dbs:
+            self.endgame_dbs[size] = load_endgame_db(
+                database_path('nogo4', size))
+        return self.endgame_dbs[size]
+
+    def get_book_move(self, board, legalMoves):
+        """
+        The opening book move of the player to move on board,
+        None if the position is not in the book.
+        """
+        size = board.size
+        if size not in self.opening_books:
+            self.opening_books[size] = load_opening_book(
+                book_path('nogo4', size))
+        book = self.opening_books[size]
+        if book is None:
+            return None
+        move = book.lookup(board)
+        # a hash collision could give any move
+        if move not in legalMoves:
+            return None
+        return move
+
     def evaluate(self, cp):
         return BLACK + WHITE - cp
 
@@ -54,29 +95,16 @@ class Nogo():
         return False
     
     def undoMove(self, state, move):
-        state.board[move] == EMPTY
-        cp = state.current_player
-        state.current_player = WHITE + BLACK - cp
+        undo(state, move)
 
     def quickPlayMove(self, state, move, player):
-        state.board[move] = player
-        state.current_player = WHITE + BLACK - player
+        play_move(state, move, player)
 
     def generateLegalMoves(self, gameState, color):
-        ePts = gameState.get_empty_points()
-        moves = []
-        for pt in ePts:
-            if gameState.is_legal(pt, color):
-                moves.append(pt)
-        return moves
+        return gameState.get_legal_moves(color)
 
     def randomMoveGen(self, state, player):
-        moves = state.get_empty_points()
-        np.random.shuffle(moves)
-        for move in moves:
-            if state.is_legal(move, player):
-                return move
-        return None
+        return GoBoardUtil.generate_random_move(state, player)
 
     def getPatternMoves(self, state, cp, legalMoves):
         #<---generate a pattern move--->
@@ -97,7 +125,7 @@ class Nogo():
                    m-state.NS-1, m-state.NS, m-state.NS+1]
         addy = 0 
         for i in range(len(pattern)):
-            p = state.board[pattern[i]]
+            p = int(state.board[pattern[i]])
             if toplay == BLACK:
                 addy += p *(4**i)
             else:
@@ -108,7 +136,8 @@ class Nogo():
         
 
         tempState = original_board.copy()
-        legalMoves = self.generateLegalMoves(tempState, color)
+        legalMoves = self.legal_move_cache.get_legal_moves(original_board,
+                                                           color)
         
         lenLegal = len(legalMoves)
         if lenLegal > 30:
@@ -128,8 +157,16 @@ class Nogo():
 
         if len(legalMoves) == 0:
             return None
-        
-        if self.UCB_ON:
+
+        # played if the time limit stops the search before a result,
+        # the searches below update it
+        self.best_move = legalMoves[0]
+
+        if self.BATCH_ON:
+            self.num_sim *= self.BATCH_FACTOR
+            best = ucb.runBatch(self, tempState, legalMoves, color,
+                                self.weight_table)
+        elif self.UCB_ON:
             C = 0.4
             stats = [[0,0] for _ in legalMoves]
             num_simulation = len(legalMoves) * self.num_sim
@@ -151,16 +188,24 @@ class Nogo():
         return best
 
     def simulate(self, gameState, move, toplay):
-        tempState = gameState.copy()
-        tempState.play_move(move, toplay)
+        #<---plays the simulation on gameState itself and takes all moves back--->
+        numMoves = len(gameState.move_stack)
+        gameState.push_move(move, toplay)
+        endgameDB = self.get_endgame_db(gameState.size)
         
         while True:
 
-            cp = tempState.current_player
-            legalMoves = self.generateLegalMoves(tempState, cp)
+            cp = gameState.current_player
+            legalMoves = self.generateLegalMoves(gameState, cp)
             if self.isTerminal(legalMoves):
-                return self.evaluate(cp)
-            moves = self.getPatternMoves(tempState, cp, legalMoves)
+                winner = self.evaluate(cp)
+                break
+            if endgameDB is not None:
+                toPlayWins = endgameDB.probe(gameState, len(legalMoves))
+                if toPlayWins is not None:
+                    winner = cp if toPlayWins else self.evaluate(cp)
+                    break
+            moves = self.getPatternMoves(gameState, cp, legalMoves)
             playedMove = False
             if len(moves) != 0:
                 prob = random.uniform(0,1)
@@ -168,11 +213,15 @@ class Nogo():
                 for possibleMove in moves.keys():
                     vn += moves[possibleMove]
                     if prob <= vn:
-                        tempState.play_move(possibleMove, cp)
+                        gameState.push_move(possibleMove, cp)
                         playedMove = True
                         break
             if not playedMove:
-                tempState.playMove(self.randomMoveGen(tempState, cp), cp)
+                gameState.push_move(self.randomMoveGen(gameState, cp), cp)
+
+        while len(gameState.move_stack) > numMoves:
+            gameState.pop_move()
+        return winner
 
             
 
@@ -0,0 +1,102 @@
+"""
+opening_book.py
+
+Opening book of the NoGo player: the move to play in the positions of
+the first plies of a game, found offline by long searches
+(see build_opening_book.py). Book moves are played without a search.
+
+Positions are reduced by symmetry: each position is stored once,
+under its key from endgame_db.canonical_key, with the move in the
+canonical orientation of the position. A lookup maps the move back
+to the orientation of the board.
+
+There is one file per board size, see book_path. It has a header of
+HEADER_WORDS little endian uint64: MAGIC, board size and the number
+of entries, followed by the entries sorted by key, as RECORD.
+"""
+
+import os
+import numpy as np
+from board_util import get_symmetries
+from endgame_db import canonical_key
+
+MAGIC = 0x314b4f4f424f4e  # "NOBOOK1"
+HEADER_WORDS = 3
+RECORD = np.dtype([('key', '<u8'), ('move', '<u2')])
+
+_inverse_symmetries = {}
+
+def book_path(directory, size):
+    return os.path.join(directory, 'opening_{0}x{0}.book'.format(size))
+
+def _inverse(size):
+    """
+    inverse[s][image] is the point with that image under symmetry s.
+    """
+    inverse = _inverse_symmetries.get(size)
+    if inverse is None:
+        inverse = []
+        for image in get_symmetries(size):
+            points = [0] * len(image)
+            for point, p in enumerate(image):
+                points[p] = point
+            inverse.append(points)
+        _inverse_symmetries[size] = inverse
+    return inverse
+
+def book_entry(board, move):
+    """
+    (key, move in the canonical orientation) of move on board.
+    """
+    key, s = canonical_key(board)
+    return key, get_symmetries(board.size)[s][move]
+
+def write_opening_book(path, size, book):
+    """
+    Write the book given as a dict from key to move, as from book_entry.
+    """
+    records = np.zeros(len(book), dtype = RECORD)
+    records['key'] = list(book.keys())
+    records['move'] = list(book.values())
+    records.sort(order = 'key')
+    header = np.array([MAGIC, size, len(records)], dtype = '<u8')
+    with open(path, 'wb') as f:
+        f.write(header.tobytes())
+        f.write(records.tobytes())
+
+def load_opening_book(path):
+    """
+    The book in the file path, None if there is no such file.
+    """
+    if not os.path.exists(path):
+        return None
+    return OpeningBook(path)
+
+class OpeningBook(object):
+
+    def __init__(self, path):
+        header = np.fromfile(path, dtype = '<u8', count = HEADER_WORDS)
+        if len(header) < HEADER_WORDS or header[0] != MAGIC:
+            raise ValueError("{} is not an opening book".format(path))
+        self.path = path
+        self.size = int(header[1])
+        self.records = np.fromfile(path, dtype = RECORD,
+                                   offset = HEADER_WORDS * 8)
+        assert len(self.records) == int(header[2])
+
+    def __len__(self):
+        return len(self.records)
+
+    def lookup(self, board):
+        """
+        The book move of the player to move on board, None if the
+        position is not in the book.
+        """
+        if board.size != self.size or len(self.records) == 0:
+            return None
+        key, s = canonical_key(board)
+        keys = self.records['key']
+        i = int(np.searchsorted(keys, np.uint64(key)))
+        if i == len(keys) or keys[i] != np.uint64(key):
+            return None
+        return _inverse(board.size)[s][int(self.records['move'][i])]
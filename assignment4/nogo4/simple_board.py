@@ -12,9 +12,19 @@ The board uses a 1-dimensional representation with padding
 import numpy as np
 from board_util import GoBoardUtil, BLACK, WHITE, EMPTY, BORDER, \
                        is_black_white, coord_to_point, where1d, \
-                       MAXSIZE, NULLPOINT
+                       MAXSIZE, NULLPOINT, get_geometry, POINT_DTYPE
 
 class SimpleGoBoard(object):
+    """
+    The board arrays use the compact COLOR_DTYPE and POINT_DTYPE,
+    the geometry tables are shared between all boards of a size,
+    and __slots__ avoids a __dict__ per board, so that many boards
+    can be kept and copied cheaply.
+    """
+    __slots__ = ('geometry', 'size', 'NS', 'WE', '_current_player', 'hash',
+                 'maxpoint', 'board', 'neighbors', 'anchor', 'block_stones',
+                 'block_libs', 'move_stack', 'empty_points', 'empty_index',
+                 'num_empty', 'legal_points')
 
     def get_color(self, point):
         return self.board[point]
@@ -25,9 +35,10 @@ class SimpleGoBoard(object):
     def get_empty_points(self):
         """
         Return:
-            The empty points on the board
+            The empty points on the board, as a new array.
+            The order is arbitrary, it changes as moves are played.
         """
-        return where1d(self.board == EMPTY)
+        return self.empty_points[:self.num_empty].copy()
 
     def __init__(self, size):
         """
@@ -42,89 +53,155 @@ class SimpleGoBoard(object):
         The board is stored as a one-dimensional array
         See GoBoardUtil.coord_to_point for explanations of the array encoding
         """
+        self.geometry = get_geometry(size)
         self.size = size
         self.NS = size + 1
         self.WE = 1
-        self.current_player = BLACK
-        self.maxpoint = size * size + 3 * (size + 1)
-        self.board = np.full(self.maxpoint, BORDER, dtype = np.int32)
-        self.liberty_of = np.full(self.maxpoint, NULLPOINT, dtype = np.int32)
-        self._initialize_empty_points(self.board)
-        self._initialize_neighbors()
+        self._current_player = BLACK
+        # Zobrist hash code of the stones and the side to move,
+        # updated with every change. See BoardGeometry for the keys.
+        self.hash = 0
+        self.maxpoint = self.geometry.maxpoint
+        self.board = np.copy(self.geometry.empty_board)
+        self.neighbors = self.geometry.neighbors
+        self._initialize_blocks()
+        self._initialize_empty_points()
+        self._initialize_legal_points()
 
     def copy(self):
-        b = SimpleGoBoard(self.size)
-        assert b.NS == self.NS
-        assert b.WE == self.WE
-        b.current_player = self.current_player
-        assert b.maxpoint == self.maxpoint
+        """
+        Copy of the board. The geometry tables are shared,
+        only the position is copied. The move stack is not copied.
+        """
+        b = SimpleGoBoard.__new__(SimpleGoBoard)
+        b.geometry = self.geometry
+        b.size = self.size
+        b.NS = self.NS
+        b.WE = self.WE
+        b._current_player = self._current_player
+        b.hash = self.hash
+        b.maxpoint = self.maxpoint
         b.board = np.copy(self.board)
+        b.neighbors = self.neighbors
+        b.anchor = np.copy(self.anchor)
+        b.block_stones = {a: list(stones)
+                          for a, stones in self.block_stones.items()}
+        b.block_libs = {a: set(libs) for a, libs in self.block_libs.items()}
+        b.move_stack = []
+        b.empty_points = np.copy(self.empty_points)
+        b.empty_index = np.copy(self.empty_index)
+        b.num_empty = self.num_empty
+        b.legal_points = {BLACK: set(self.legal_points[BLACK]),
+                          WHITE: set(self.legal_points[WHITE])}
         return b
 
+    @property
+    def current_player(self):
+        return self._current_player
+
+    @current_player.setter
+    def current_player(self, color):
+        """
+        Changing the side to move updates the hash code
+        """
+        if color != self._current_player:
+            self.hash ^= self.geometry.zobrist_to_move
+            self._current_player = color
+
+    def _compute_hash(self):
+        """
+        Compute the hash code from scratch. self.hash must be equal to it.
+        """
+        code = 0
+        for point in where1d(self.board == BLACK):
+            code ^= self.geometry.zobrist[point][BLACK]
+        for point in where1d(self.board == WHITE):
+            code ^= self.geometry.zobrist[point][WHITE]
+        if self.current_player == WHITE:
+            code ^= self.geometry.zobrist_to_move
+        return code
+
     def row_start(self, row):
         assert row >= 1
         assert row <= self.size
         return row * self.NS + 1
         
-    def _initialize_empty_points(self, board):
-        """
-        Fills points on the board with EMPTY
-        Argument
-        ---------
-        board: numpy array, filled with BORDER
-        """
-        for row in range(1, self.size + 1):
-            start = self.row_start(row)
-            board[start : start + self.size] = EMPTY
-
-    def _on_board_neighbors(self, point):
-        nbs = []
-        for nb in self._neighbors(point):
-            if self.board[nb] != BORDER:
-                nbs.append(nb)
-        return nbs
-            
-    def _initialize_neighbors(self):
-        """
-        precompute neighbor array.
-        For each point on the board, store its list of on-the-board neighbors
-        """
-        self.neighbors = []
-        for point in range(self.maxpoint):
-            if self.board[point] == BORDER:
-                self.neighbors.append([])
-            else:
-                self.neighbors.append(self._on_board_neighbors(point))
-    
+    def _initialize_empty_points(self):
+        """
+        The empty points are kept in the first num_empty entries of
+        the empty_points array, in arbitrary order.
+        empty_index[point] is the position of point in empty_points.
+        Points are removed by moving the last empty point into their place,
+        so adding and removing an empty point is O(1).
+        """
+        self.empty_points = np.copy(self.geometry.points)
+        self.empty_index = np.copy(self.geometry.point_index)
+        self.num_empty = len(self.empty_points)
+
+    def _initialize_legal_points(self):
+        """
+        legal_points[color] is the set of legal moves of color.
+        It is updated locally by _update_legal_points after each move.
+        On the empty board all points are legal.
+        """
+        self.legal_points = {BLACK: set(int(p) for p in self.empty_points),
+                             WHITE: set(int(p) for p in self.empty_points)}
+
+    def _add_empty_point(self, point):
+        self.empty_points[self.num_empty] = point
+        self.empty_index[point] = self.num_empty
+        self.num_empty += 1
+
+    def _remove_empty_point(self, point):
+        self.num_empty -= 1
+        last = self.empty_points[self.num_empty]
+        i = self.empty_index[point]
+        self.empty_points[i] = last
+        self.empty_index[last] = i
+
+    def swap_empty_points(self, i, j):
+        """
+        Exchange entries i and j of empty_points.
+        Lets move generators shuffle the empty points in place.
+        """
+        p = self.empty_points[i]
+        q = self.empty_points[j]
+        self.empty_points[i] = q
+        self.empty_points[j] = p
+        self.empty_index[q] = i
+        self.empty_index[p] = j
+
+    def _initialize_blocks(self):
+        """
+        Block (string) information, kept up to date by _add_stone
+        and _remove_stone.
+        anchor[stone] is the representative point of the block of stone,
+        NULLPOINT for points without a stone.
+        block_stones[anchor] is the list of stones in the block,
+        block_libs[anchor] the set of its liberties.
+        """
+        self.anchor = np.full(self.maxpoint, NULLPOINT, dtype = POINT_DTYPE)
+        self.block_stones = {}
+        self.block_libs = {}
+        self.move_stack = []
+
     def _stone_has_liberty(self, stone):
         lib = self.find_neighbor_of_color(stone, EMPTY)
         return lib != None
 
-    def _get_liberty(self, block):
+    def _block_liberties(self, stone):
         """
-        Find any liberty of the given block.
-        Returns None in case there is no liberty.
-        block is a numpy boolean array
+        The set of liberties of the block containing stone.
+        Maintained incrementally by _add_stone, do not modify.
         """
-        for stone in where1d(block):
-            lib = self.find_neighbor_of_color(stone, EMPTY)
-            if lib != None:
-                return lib
-        return None
+        return self.block_libs[self.anchor[stone]]
 
-    def _has_liberty(self, block):
+    def _has_liberty(self, stone, point):
         """
-        Check if the given block has any liberty.
-        Also updates the liberty_of array.
-        block is a numpy boolean array
+        Check if the block of stone has a liberty other than point.
         """
-        lib = self._get_liberty(block)
-        if lib != None:
-            assert self.get_color(lib) == EMPTY
-            for stone in where1d(block):
-                self.liberty_of[stone] = lib
-            return True
-        return False
+        libs = self._block_liberties(stone)
+        return len(libs) > 1 or point not in libs
 
     def _block_of(self, stone):
         """
@@ -132,110 +209,215 @@ class SimpleGoBoard(object):
         Returns a board of boolean markers which are set for
         all the points in the block 
         """
-        marker = np.full(self.maxpoint, False, dtype = bool)
-        pointstack = [stone]
         color = self.get_color(stone)
         assert is_black_white(color)
-        marker[stone] = True
-        while pointstack:
-            p = pointstack.pop()
-            neighbors = self.neighbors_of_color(p, color)
-            for nb in neighbors:
-                if not marker[nb]:
-                    marker[nb] = True
-                    pointstack.append(nb)
+        marker = np.full(self.maxpoint, False, dtype = bool)
+        marker[self.block_stones[self.anchor[stone]]] = True
         return marker
 
-    def _fast_liberty_check(self, nb_point):
-        lib = self.liberty_of[nb_point]
-        if lib != NULLPOINT and self.get_color(lib) == EMPTY:
-            return True # quick exit, block has a liberty  
-        if self._stone_has_liberty(nb_point):
-            return True # quick exit, no need to look at whole block
-        return False
-        
-    def _detect_capture(self, nb_point):
+    def _detect_capture(self, nb_point, point):
         """
-        Check whether opponent block on nb_point is captured.
+        Check whether opponent block on nb_point would be captured
+        by a stone played on point.
         Returns boolean.
         """
-        if self._fast_liberty_check(nb_point):
-            return False
-        opp_block = self._block_of(nb_point)
-        return not self._has_liberty(opp_block)
-    
-    # def is_legal(self, point, color):
-    #     """
-    #     Check whether it is legal for color to play on point
-    #     """
-    #     board_copy = self.copy()
-    #     # Try to play the move on a temporary copy of board
-    #     # This prevents the board from being messed up by the move
-    #     try:
-    #         legal = board_copy.play_move(point, color)
-    #     except:
-    #         return False
-            
-    #     return legal
+        return not self._has_liberty(nb_point, point)
+
+    def _move_error(self, point, color):
+        """
+        Check the move of color on point against the NoGo rules.
+        Returns None if the move is legal, otherwise the reason
+        ("occupied", "capture" or "suicide").
+        """
+        if self.board[point] != EMPTY:
+            return "occupied"
+        opp_color = GoBoardUtil.opponent(color)
+        has_liberty = False
+        for nb in self.neighbors[point]:
+            nb_color = self.board[nb]
+            if nb_color == EMPTY:
+                has_liberty = True
+            elif nb_color == opp_color:
+                if self._detect_capture(nb, point):
+                    return "capture"
+            elif not has_liberty and self._has_liberty(nb, point):
+                has_liberty = True
+        if not has_liberty:
+            return "suicide"
+        return None
 
     def is_legal(self, point, color):
         """
         Check if the move is legal
         """
         assert is_black_white(color)
-        # Special cases
-        if self.board[point] != EMPTY:
-            return False 
-        
-        # General case: deal with captures, suicide
-        opp_color = GoBoardUtil.opponent(color)
-        self.board[point] = color
-        neighbors = self.neighbors[point]
-        # Captur 
-        for nb in neighbors:
-            if self.board[nb] == opp_color:
-                if self._detect_capture(nb):
-                    self.board[point] = EMPTY
-                    return False 
-        # Sucide
-        if not self._stone_has_liberty(point):
-            # check suicide of whole block
-            block = self._block_of(point)
-            if not self._has_liberty(block): # undo suicide move
-                self.board[point] = EMPTY
-                return False 
-        # Undo 
-        self.board[point] = EMPTY
-        return True
+        return point in self.legal_points[color]
+
+    def has_legal_move(self, color):
+        """
+        Check if color has any legal move.
+        The legal points are kept up to date after each move,
+        so this does not look at the board at all.
+        """
+        return len(self.legal_points[color]) > 0
+
+    def get_legal_moves(self, color):
+        """
+        Return:
+            The legal moves of color, in increasing point order
+        """
+        return sorted(self.legal_points[color])
+
+    def _check_move(self, point, color):
+        """
+        Raise ValueError with the reason if the move is illegal
+        """
+        assert is_black_white(color)
+        if point not in self.legal_points[color]:
+            raise ValueError(self._move_error(point, color))
 
     def play_move(self, point, color):
         """
         Play a move of color on point
         Returns boolean: whether move was legal
         """
-        assert is_black_white(color)
-        # Special cases
-        if self.board[point] != EMPTY:
-            raise ValueError("occupied")
-            
-        # General case: deal with captures, suicide
-        opp_color = GoBoardUtil.opponent(color)
-        self.board[point] = color
-        neighbors = self.neighbors[point]
-        for nb in neighbors:
-            if self.board[nb] == opp_color:
-                if self._detect_capture(nb):
-                    self.board[point] = EMPTY
-                    raise ValueError("capture")
-        if not self._stone_has_liberty(point):
-            # check suicide of whole block
-            block = self._block_of(point)
-            if not self._has_liberty(block): # undo suicide move
-                self.board[point] = EMPTY
-                raise ValueError("suicide")
+        self._check_move(point, color)
+        self._add_stone(point, color)
+        self._update_legal_points(point)
+        self.current_player = GoBoardUtil.opponent(color)
+        return True
+
+    def push_move(self, point, color):
+        """
+        Play a move of color on point like play_move, and record
+        the changes on the move stack so that pop_move can undo it.
+        Use this instead of copying the board in search and simulations.
+        """
+        self._check_move(point, color)
+        undo = self._add_stone(point, color, True)
+        self._update_legal_points(point)
+        self.move_stack.append((point, self.current_player, undo))
         self.current_player = GoBoardUtil.opponent(color)
         return True
 
+    def pop_move(self):
+        """
+        Undo the last move played by push_move.
+        Returns the point of that move.
+        """
+        point, player, undo = self.move_stack.pop()
+        self._remove_stone(point, undo)
+        self._update_legal_points(point)
+        self.current_player = player
+        return point
+
+    def _update_legal_points(self, point):
+        """
+        Update the legal moves of both colors after a stone was
+        added to or removed from point.
+        The legality of an empty point only depends on its neighbors
+        and the liberties of their blocks. So only point, its empty
+        neighbors and the liberties of the blocks next to point
+        need to be checked again.
+        """
+        points = [point]
+        for nb in self.neighbors[point]:
+            if self.board[nb] == EMPTY:
+                points.append(nb)
+            else:
+                points.extend(self.block_libs[self.anchor[nb]])
+        black_points = self.legal_points[BLACK]
+        white_points = self.legal_points[WHITE]
+        for p in points:
+            if self.board[p] != EMPTY:
+                black_points.discard(p)
+                white_points.discard(p)
+                continue
+            if self._move_error(p, BLACK) == None:
+                black_points.add(p)
+            else:
+                black_points.discard(p)
+            if self._move_error(p, WHITE) == None:
+                white_points.add(p)
+            else:
+                white_points.discard(p)
+
+    def _add_stone(self, point, color, keep_undo = False):
+        """
+        Put a stone of color on the empty point and update the blocks:
+        remove point from the liberties of all neighboring blocks and
+        merge the new stone with its neighboring blocks of the same color.
+        The move must be legal, NoGo never removes stones.
+        If keep_undo is True, returns the information _remove_stone
+        needs to restore the blocks, otherwise None.
+        """
+        self.board[point] = color
+        self.hash ^= self.geometry.zobrist[point][color]
+        self._remove_empty_point(point)
+        new_libs = []
+        nb_anchors = []
+        touched = []
+        for nb in self.neighbors[point]:
+            nb_color = self.board[nb]
+            if nb_color == EMPTY:
+                new_libs.append(nb)
+            else:
+                nb_anchor = self.anchor[nb]
+                if nb_anchor in touched:
+                    continue
+                touched.append(nb_anchor)
+                self.block_libs[nb_anchor].discard(point)
+                if nb_color == color:
+                    nb_anchors.append(nb_anchor)
+        if nb_anchors:
+            # merge into the largest neighboring block
+            anchor = max(nb_anchors, key = lambda a: len(self.block_stones[a]))
+        else:
+            anchor = point
+            self.block_stones[anchor] = []
+            self.block_libs[anchor] = set()
+        stones = self.block_stones[anchor]
+        libs = self.block_libs[anchor]
+        undo = None
+        if keep_undo:
+            undo = (anchor, len(stones), set(libs), [], touched)
+        for nb_anchor in nb_anchors:
+            if nb_anchor != anchor:
+                nb_stones = self.block_stones.pop(nb_anchor)
+                nb_libs = self.block_libs.pop(nb_anchor)
+                if keep_undo:
+                    undo[3].append((nb_anchor, nb_stones, nb_libs))
+                self.anchor[nb_stones] = anchor
+                stones.extend(nb_stones)
+                libs |= nb_libs
+        stones.append(point)
+        libs.update(new_libs)
+        self.anchor[point] = anchor
+        return undo
+
+    def _remove_stone(self, point, undo):
+        """
+        Take back the stone on point added by _add_stone,
+        restoring the blocks from the undo information.
+        """
+        anchor, num_stones, libs, merged, touched = undo
+        self.hash ^= self.geometry.zobrist[point][self.board[point]]
+        self.board[point] = EMPTY
+        self.anchor[point] = NULLPOINT
+        self._add_empty_point(point)
+        if num_stones == 0:
+            del self.block_stones[anchor]
+            del self.block_libs[anchor]
+        else:
+            del self.block_stones[anchor][num_stones:]
+            self.block_libs[anchor] = libs
+        for nb_anchor, nb_stones, nb_libs in merged:
+            self.anchor[nb_stones] = nb_anchor
+            self.block_stones[nb_anchor] = nb_stones
+            self.block_libs[nb_anchor] = nb_libs
+        for nb_anchor in touched:
+            self.block_libs[nb_anchor].add(point)
+
     def neighbors_of_color(self, point, color):
         """ List of neighbors of point of given color """
         nbc = []
@@ -0,0 +1,76 @@
+#!/usr/local/bin/python3
+#/usr/bin/python3
+# Set the path to your python3 above
+
+import unittest
+import random
+from board_util import BLACK, WHITE, EMPTY, BORDER, GoBoardUtil
+from simple_board import SimpleGoBoard
+from bit_board import BitBoard, bits_to_points
+
+class BitBoardTestCase(unittest.TestCase):
+    """Tests for bit_board.py"""
+
+    def test_empty_board(self):
+        bitboard = BitBoard(7)
+        goboard = SimpleGoBoard(7)
+        self.assertEqual(list(bitboard.get_empty_points()),
+                         list(goboard.get_empty_points()))
+        self.assertEqual(bitboard.get_color(0), BORDER)
+        self.assertEqual(bitboard.get_color(bitboard.pt(7, 7)), EMPTY)
+        self.assertEqual(bitboard.get_legal_moves(BLACK),
+                         sorted(goboard.get_empty_points()))
+
+    def test_capture_and_suicide_illegal(self):
+        bitboard = BitBoard(3)
+        bitboard.play_move(bitboard.pt(1, 2), BLACK)
+        bitboard.play_move(bitboard.pt(2, 2), WHITE)
+        bitboard.play_move(bitboard.pt(2, 1), BLACK)
+        self.assertFalse(bitboard.is_legal(bitboard.pt(1, 1), WHITE))
+        self.assertRaises(ValueError, bitboard.play_move,
+                          bitboard.pt(1, 1), WHITE)
+        bitboard.play_move(bitboard.pt(1, 1), BLACK)
+        bitboard.play_move(bitboard.pt(3, 1), WHITE)
+        bitboard.play_move(bitboard.pt(3, 3), BLACK)
+        self.assertFalse(bitboard.is_legal(bitboard.pt(1, 3), WHITE))
+        self.assertNotIn(bitboard.pt(1, 3), bitboard.get_legal_moves(WHITE))
+
+    def test_same_as_simple_board(self):
+        random.seed(1)
+        for size in (4, 7, 9):
+            for _ in range(5):
+                goboard = SimpleGoBoard(size)
+                bitboard = BitBoard(size)
+                while True:
+                    for color in (BLACK, WHITE):
+                        legal = GoBoardUtil.generate_legal_moves(goboard, color)
+                        self.assertEqual(bitboard.get_legal_moves(color),
+                                         sorted(int(p) for p in legal))
+                        for point in goboard.get_empty_points():
+                            self.assertEqual(bitboard.is_legal(point, color),
+                                             goboard.is_legal(point, color))
+                    color = goboard.current_player
+                    legal = bitboard.get_legal_moves(color)
+                    if not legal:
+                        break
+                    move = random.choice(legal)
+                    goboard.play_move(move, color)
+                    bitboard.push_move(move, color)
+                    self.assertTrue((bitboard.board == goboard.board).all())
+                self.assertEqual(BitBoard.from_board(goboard).black,
+                                 bitboard.black)
+
+    def test_push_pop_move(self):
+        bitboard = BitBoard(5)
+        bitboard.play_move(bitboard.pt(3, 3), BLACK)
+        black, white = bitboard.black, bitboard.white
+        bitboard.push_move(bitboard.pt(3, 4), WHITE)
+        self.assertEqual(bitboard.current_player, BLACK)
+        self.assertEqual(bitboard.pop_move(), bitboard.pt(3, 4))
+        self.assertEqual((bitboard.black, bitboard.white), (black, white))
+        self.assertEqual(bitboard.current_player, WHITE)
+        self.assertEqual(bits_to_points(bitboard.black), [bitboard.pt(3, 3)])
+
+"""Main"""
+if __name__ == '__main__':
+    unittest.main()
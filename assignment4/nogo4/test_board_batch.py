@@ -0,0 +1,82 @@
+#!/usr/local/bin/python3
+#/usr/bin/python3
+# Set the path to your python3 above
+
+import unittest
+import random
+import numpy as np
+from board_util import BLACK, WHITE, EMPTY
+from simple_board import SimpleGoBoard
+from board_batch import BoardBatch, weight_table, NUM_PATTERNS
+
+class BoardBatchTestCase(unittest.TestCase):
+    """Tests for board_batch.py"""
+
+    def test_legal_moves_same_as_simple_board(self):
+        random.seed(2)
+        for size in (3, 5, 7):
+            goboards = []
+            for _ in range(20):
+                goboard = SimpleGoBoard(size)
+                for _ in range(random.randrange(size * size)):
+                    legal = goboard.get_legal_moves(goboard.current_player)
+                    if not legal:
+                        break
+                    goboard.play_move(random.choice(legal),
+                                      goboard.current_player)
+                goboards.append(goboard)
+            batch = BoardBatch(goboards[0], len(goboards))
+            for i, goboard in enumerate(goboards):
+                batch.board[i] = goboard.board
+                batch.current_player[i] = goboard.current_player
+            legal = batch.legal_moves_mask()
+            for i, goboard in enumerate(goboards):
+                self.assertEqual(list(batch.points[legal[i]]),
+                        goboard.get_legal_moves(goboard.current_player))
+
+    def test_for_moves(self):
+        goboard = SimpleGoBoard(5)
+        moves = [goboard.pt(1, 1), goboard.pt(3, 3)]
+        batch = BoardBatch.for_moves(goboard, moves, BLACK, 3)
+        self.assertEqual(batch.n, 6)
+        self.assertTrue((batch.board[:3, moves[0]] == BLACK).all())
+        self.assertTrue((batch.board[3:, moves[1]] == BLACK).all())
+        self.assertTrue((batch.current_player == WHITE).all())
+        self.assertEqual(goboard.board[moves[0]], EMPTY)
+
+    def test_pattern_codes(self):
+        goboard = SimpleGoBoard(5)
+        goboard.play_move(goboard.pt(3, 3), BLACK)
+        goboard.play_move(goboard.pt(4, 3), WHITE)
+        for color in (BLACK, WHITE):
+            goboard.current_player = color
+            batch = BoardBatch(goboard, 1)
+            codes = batch.pattern_codes()[0]
+            for j, m in enumerate(batch.points):
+                NS = goboard.NS
+                pattern = [m+NS-1, m+NS, m+NS+1, m-1, m+1,
+                           m-NS-1, m-NS, m-NS+1]
+                code = 0
+                for i, p in enumerate(pattern):
+                    c = goboard.board[p]
+                    if color == WHITE and c in (BLACK, WHITE):
+                        c = BLACK + WHITE - c
+                    code += int(c) * 4 ** i
+                self.assertEqual(codes[j], code)
+
+    def test_playout(self):
+        np.random.seed(3)
+        goboard = SimpleGoBoard(4)
+        weights = weight_table({0: 1.0})
+        self.assertEqual(len(weights), NUM_PATTERNS)
+        for w in (None, weights):
+            batch = BoardBatch(goboard, 50)
+            winner = batch.playout(w)
+            self.assertTrue(((winner == BLACK) | (winner == WHITE)).all())
+            self.assertFalse(batch.legal_moves_mask().any())
+            # the loser is to play and has no legal move
+            self.assertTrue((batch.current_player != winner).all())
+
+"""Main"""
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+#!/usr/local/bin/python3
+#/usr/bin/python3
+# Set the path to your python3 above
+
+import unittest
+from board_util import BLACK, GoBoardUtil, get_geometry
+from simple_board import SimpleGoBoard
+
+class GoBoardUtilTestCase(unittest.TestCase):
+    """Tests for board_util.py"""
+    
+    def test_size_2_legal_moves(self):
+        size = 2
+        goboard = SimpleGoBoard(size)
+        moves = GoBoardUtil.generate_legal_moves(goboard, BLACK)
+        self.assertEqual(moves, [goboard.pt(1,1), goboard.pt(1,2), 
+                                 goboard.pt(2,1), goboard.pt(2,2)])
+
+    def test_geometry_shared(self):
+        goboard = SimpleGoBoard(7)
+        other = SimpleGoBoard(7)
+        self.assertIs(goboard.geometry, get_geometry(7))
+        self.assertIs(goboard.neighbors, other.neighbors)
+        self.assertIs(goboard.copy().neighbors, goboard.neighbors)
+        self.assertFalse(goboard.geometry.row.flags.writeable)
+
+    def test_geometry_tables(self):
+        geometry = get_geometry(3)
+        goboard = SimpleGoBoard(3)
+        self.assertEqual(list(geometry.points), 
+                         [goboard.pt(r, c) for r in range(1, 4)
+                                           for c in range(1, 4)])
+        center = goboard.pt(2, 2)
+        corner = goboard.pt(1, 3)
+        self.assertEqual(geometry.point_index[center], 4)
+        self.assertEqual(geometry.point_index[0], -1)
+        self.assertEqual((geometry.row[corner], geometry.col[corner]), (1, 3))
+        self.assertEqual(geometry.edge_distance[center], 1)
+        self.assertEqual(geometry.edge_distance[corner], 0)
+        self.assertEqual(sorted(geometry.neighbors[corner]),
+                         [goboard.pt(1, 2), goboard.pt(2, 3)])
+        self.assertEqual(list(geometry.window_33[center]),
+                         list(range(center - 5, center - 2)) +
+                         list(range(center - 1, center + 2)) +
+                         list(range(center + 3, center + 6)))
+
+"""Main"""
+if __name__ == '__main__':
+    unittest.main()
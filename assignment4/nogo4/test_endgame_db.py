@@ -0,0 +1,86 @@
+#!/usr/local/bin/python3
+#/usr/bin/python3
+# Set the path to your python3 above
+
+import unittest
+import os
+import tempfile
+import numpy as np
+from board_util import BLACK, WHITE
+from simple_board import SimpleGoBoard
+from board_batch import BoardBatch
+from endgame_db import position_key, position_keys, write_endgame_db, \
+                       EndgameDB, load_endgame_db
+
+class EndgameDBTestCase(unittest.TestCase):
+    """Tests for endgame_db.py"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'endgame.db')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_symmetric_positions_same_key(self):
+        goboard = SimpleGoBoard(5)
+        goboard.play_move(goboard.pt(1, 2), BLACK)
+        goboard.play_move(goboard.pt(3, 4), WHITE)
+        mirrored = SimpleGoBoard(5)
+        mirrored.play_move(mirrored.pt(5, 2), BLACK)
+        mirrored.play_move(mirrored.pt(3, 4), WHITE)
+        self.assertEqual(position_key(goboard), position_key(mirrored))
+        other = SimpleGoBoard(5)
+        other.play_move(other.pt(1, 2), WHITE)
+        other.play_move(other.pt(3, 4), BLACK)
+        self.assertNotEqual(position_key(goboard), position_key(other))
+        goboard.current_player = WHITE
+        self.assertNotEqual(position_key(goboard), position_key(mirrored))
+
+    def test_position_keys_of_rows(self):
+        goboard = SimpleGoBoard(5)
+        goboard.play_move(goboard.pt(2, 2), BLACK)
+        empty = SimpleGoBoard(5)
+        keys = position_keys(5, np.array([goboard.board, empty.board]),
+                             np.array([True, False]))
+        self.assertEqual(list(keys), [position_key(goboard),
+                                      position_key(empty)])
+
+    def test_write_and_lookup(self):
+        keys = np.array([10, 7, 2 ** 63 + 5, 1000], dtype = np.uint64)
+        wins = np.array([True, False, True, False])
+        write_endgame_db(self.path, 7, 6, keys, wins)
+        db = EndgameDB(self.path)
+        self.assertEqual((db.size, db.max_moves, len(db)), (7, 6, 4))
+        for key, win in zip(keys, wins):
+            self.assertEqual(db.lookup(int(key)), win)
+        self.assertIsNone(db.lookup(12))
+        self.assertEqual(list(db.lookup_many(np.array([7, 12, 10],
+                                                      dtype = np.uint64))),
+                         [0, -1, 1])
+        self.assertIsNone(load_endgame_db(self.path + '.missing'))
+
+    def test_probe(self):
+        goboard = SimpleGoBoard(5)
+        goboard.play_move(goboard.pt(3, 3), BLACK)
+        write_endgame_db(self.path, 5, 4, [position_key(goboard)], [True])
+        db = EndgameDB(self.path)
+        self.assertTrue(db.probe(goboard, 4))
+        self.assertIsNone(db.probe(goboard, 5))
+        self.assertIsNone(db.probe(SimpleGoBoard(7), 4))
+
+    def test_playout_stops_in_database(self):
+        # the position after BLACK plays the center is stored as a win
+        # for WHITE, so all playouts from it end there
+        goboard = SimpleGoBoard(3)
+        center = goboard.pt(2, 2)
+        goboard.play_move(center, BLACK)
+        write_endgame_db(self.path, 3, 8, [position_key(goboard)], [True])
+        batch = BoardBatch.for_moves(SimpleGoBoard(3), [center], BLACK, 10)
+        winners = batch.playout(endgame_db = EndgameDB(self.path))
+        self.assertTrue((winners == WHITE).all())
+        self.assertTrue((batch.board == goboard.board).all())
+
+"""Main"""
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+#!/usr/local/bin/python3
+#/usr/bin/python3
+# Set the path to your python3 above
+
+import unittest
+from board_util import BLACK, WHITE
+from simple_board import SimpleGoBoard
+from legal_move_cache import LegalMoveCache
+
+class LegalMoveCacheTestCase(unittest.TestCase):
+    """Tests for legal_move_cache.py"""
+
+    def test_hits_and_misses(self):
+        goboard = SimpleGoBoard(3)
+        cache = LegalMoveCache()
+        moves = cache.get_legal_moves(goboard, BLACK)
+        self.assertEqual(list(moves), goboard.get_legal_moves(BLACK))
+        self.assertIs(cache.get_legal_moves(goboard, BLACK), moves)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        goboard.push_move(goboard.pt(2, 2), BLACK)
+        self.assertNotIn(goboard.pt(2, 2), cache.get_legal_moves(goboard, BLACK))
+        goboard.pop_move()
+        self.assertIs(cache.get_legal_moves(goboard, BLACK), moves)
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def test_size_and_capacity(self):
+        cache = LegalMoveCache(capacity = 2)
+        small = cache.get_legal_moves(SimpleGoBoard(2), BLACK)
+        self.assertEqual(len(small), 4)
+        self.assertEqual(len(cache.get_legal_moves(SimpleGoBoard(3), BLACK)), 9)
+        cache.get_legal_moves(SimpleGoBoard(3), WHITE)
+        self.assertEqual(len(cache.table), 2)
+        cache.get_legal_moves(SimpleGoBoard(2), BLACK)
+        self.assertEqual(cache.misses, 4)
+        cache.clear()
+        self.assertEqual(len(cache.table), 0)
+
+"""Main"""
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+#!/usr/local/bin/python3
+#/usr/bin/python3
+# Set the path to your python3 above
+
+import unittest
+import os
+import tempfile
+from board_util import BLACK, WHITE
+from simple_board import SimpleGoBoard
+from opening_book import book_entry, write_opening_book, OpeningBook, \
+                         load_opening_book
+
+class OpeningBookTestCase(unittest.TestCase):
+    """Tests for opening_book.py"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'opening.book')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_lookup_symmetric_positions(self):
+        goboard = SimpleGoBoard(7)
+        goboard.play_move(goboard.pt(1, 2), BLACK)
+        key, move = book_entry(goboard, goboard.pt(3, 5))
+        write_opening_book(self.path, 7, {key: move})
+        book = OpeningBook(self.path)
+        self.assertEqual(len(book), 1)
+        self.assertEqual(book.lookup(goboard), goboard.pt(3, 5))
+        # the same position reflected top to bottom
+        reflected = SimpleGoBoard(7)
+        reflected.play_move(reflected.pt(7, 2), BLACK)
+        self.assertEqual(book.lookup(reflected), reflected.pt(5, 5))
+        # and transposed
+        transposed = SimpleGoBoard(7)
+        transposed.play_move(transposed.pt(2, 1), BLACK)
+        self.assertEqual(book.lookup(transposed), transposed.pt(5, 3))
+
+    def test_positions_not_in_book(self):
+        goboard = SimpleGoBoard(7)
+        key, move = book_entry(goboard, goboard.pt(4, 4))
+        write_opening_book(self.path, 7, {key: move})
+        book = OpeningBook(self.path)
+        self.assertEqual(book.lookup(goboard), goboard.pt(4, 4))
+        goboard.current_player = WHITE
+        self.assertIsNone(book.lookup(goboard))
+        self.assertIsNone(book.lookup(SimpleGoBoard(5)))
+        self.assertIsNone(load_opening_book(self.path + '.missing'))
+
+"""Main"""
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+#!/usr/local/bin/python3
+#/usr/bin/python3
+# Set the path to your python3 above
+
+import unittest
+import numpy as np
+from board_util import BLACK, WHITE, EMPTY, BORDER, where1d
+from simple_board import SimpleGoBoard
+
+class SimpleGoBoardTestCase(unittest.TestCase):
+    """Tests for simple_board.py"""
+
+    def test_size_2(self):
+        goboard = SimpleGoBoard(2)
+        self.assertEqual(goboard.size, 2)
+        self.assertEqual(goboard.NS, 3)
+        self.assertEqual(goboard.current_player, BLACK)
+        self.assertEqual(goboard.maxpoint, 13)
+        self.assertEqual(goboard.board[0], BORDER)
+        self.assertEqual(len(goboard.get_empty_points()), 4)
+
+    def test_blocks_merge(self):
+        goboard = SimpleGoBoard(5)
+        goboard.play_move(goboard.pt(1, 1), BLACK)
+        goboard.play_move(goboard.pt(5, 5), WHITE)
+        goboard.play_move(goboard.pt(1, 3), BLACK)
+        goboard.play_move(goboard.pt(4, 5), WHITE)
+        goboard.play_move(goboard.pt(1, 2), BLACK)
+        stones = goboard.block_stones[goboard.anchor[goboard.pt(1, 1)]]
+        self.assertEqual(sorted(stones),
+                         [goboard.pt(1, 1), goboard.pt(1, 2), goboard.pt(1, 3)])
+        self.assertEqual(goboard._block_liberties(goboard.pt(1, 3)),
+                         {goboard.pt(2, 1), goboard.pt(2, 2),
+                          goboard.pt(2, 3), goboard.pt(1, 4)})
+        self.assertEqual(goboard._block_liberties(goboard.pt(5, 5)),
+                         {goboard.pt(5, 4), goboard.pt(4, 4), goboard.pt(3, 5)})
+
+    def test_capture_and_suicide_illegal(self):
+        goboard = SimpleGoBoard(3)
+        goboard.play_move(goboard.pt(1, 2), BLACK)
+        goboard.play_move(goboard.pt(2, 2), WHITE)
+        goboard.play_move(goboard.pt(2, 1), BLACK)
+        # white on a1 is suicide
+        self.assertFalse(goboard.is_legal(goboard.pt(1, 1), WHITE))
+        self.assertRaises(ValueError, goboard.play_move,
+                          goboard.pt(1, 1), WHITE)
+        # black on a1 is fine, the black block keeps c1 and a3
+        self.assertTrue(goboard.is_legal(goboard.pt(1, 1), BLACK))
+        goboard.play_move(goboard.pt(1, 1), BLACK)
+        self.assertTrue(goboard.is_legal(goboard.pt(1, 3), WHITE))
+        goboard.play_move(goboard.pt(3, 1), WHITE)
+        goboard.play_move(goboard.pt(3, 3), BLACK)
+        # now white c1 would capture the black block
+        self.assertFalse(goboard.is_legal(goboard.pt(1, 3), WHITE))
+        self.assertTrue(goboard.is_legal(goboard.pt(1, 3), BLACK))
+
+    def test_copy_is_independent(self):
+        goboard = SimpleGoBoard(4)
+        goboard.play_move(goboard.pt(2, 2), BLACK)
+        board_copy = goboard.copy()
+        board_copy.play_move(goboard.pt(2, 3), WHITE)
+        self.assertEqual(goboard.get_color(goboard.pt(2, 3)), EMPTY)
+        self.assertIn(goboard.pt(2, 3),
+                      goboard._block_liberties(goboard.pt(2, 2)))
+        self.assertNotIn(goboard.pt(2, 3),
+                         board_copy._block_liberties(goboard.pt(2, 2)))
+
+    def test_compact_board(self):
+        goboard = SimpleGoBoard(7)
+        self.assertFalse(hasattr(goboard, '__dict__'))
+        board_copy = goboard.copy()
+        self.assertEqual(board_copy.board.dtype, np.int8)
+        self.assertEqual(board_copy.anchor.dtype, np.int16)
+        self.assertEqual(board_copy.empty_points.dtype, np.int16)
+        self.assertIs(board_copy.neighbors, goboard.neighbors)
+
+    def test_push_pop_move(self):
+        goboard = SimpleGoBoard(4)
+        goboard.play_move(goboard.pt(2, 2), BLACK)
+        goboard.play_move(goboard.pt(3, 3), WHITE)
+        board_before = np.copy(goboard.board)
+        libs_before = set(goboard._block_liberties(goboard.pt(2, 2)))
+        goboard.push_move(goboard.pt(3, 2), BLACK)
+        goboard.push_move(goboard.pt(2, 3), WHITE)
+        goboard.push_move(goboard.pt(2, 1), BLACK)
+        self.assertEqual(len(goboard.move_stack), 3)
+        self.assertEqual(goboard.pop_move(), goboard.pt(2, 1))
+        self.assertEqual(goboard.pop_move(), goboard.pt(2, 3))
+        self.assertEqual(goboard.pop_move(), goboard.pt(3, 2))
+        self.assertTrue((goboard.board == board_before).all())
+        self.assertEqual(goboard.current_player, BLACK)
+        self.assertEqual(goboard._block_liberties(goboard.pt(2, 2)),
+                         libs_before)
+        self.assertNotIn(goboard.pt(3, 2), goboard.block_stones)
+
+    def test_empty_points_tracked(self):
+        goboard = SimpleGoBoard(3)
+        goboard.push_move(goboard.pt(2, 2), BLACK)
+        goboard.push_move(goboard.pt(1, 1), WHITE)
+        self.assertEqual(goboard.num_empty, 7)
+        self.assertEqual(sorted(goboard.get_empty_points()),
+                         list(where1d(goboard.board == EMPTY)))
+        goboard.swap_empty_points(0, 6)
+        goboard.pop_move()
+        self.assertEqual(sorted(goboard.get_empty_points()),
+                         list(where1d(goboard.board == EMPTY)))
+        for i in range(goboard.num_empty):
+            point = goboard.empty_points[i]
+            self.assertEqual(goboard.empty_index[point], i)
+
+    def test_legal_points_updated(self):
+        goboard = SimpleGoBoard(3)
+        self.assertEqual(len(goboard.get_legal_moves(WHITE)), 9)
+        goboard.push_move(goboard.pt(1, 2), BLACK)
+        goboard.push_move(goboard.pt(2, 2), WHITE)
+        goboard.push_move(goboard.pt(2, 1), BLACK)
+        self.assertNotIn(goboard.pt(1, 1), goboard.get_legal_moves(WHITE))
+        self.assertIn(goboard.pt(1, 1), goboard.get_legal_moves(BLACK))
+        goboard.pop_move()
+        self.assertIn(goboard.pt(1, 1), goboard.get_legal_moves(WHITE))
+        self.assertEqual(goboard.get_legal_moves(WHITE),
+                         [p for p in sorted(goboard.get_empty_points())
+                          if goboard._move_error(p, WHITE) == None])
+
+    def test_has_legal_move(self):
+        goboard = SimpleGoBoard(2)
+        self.assertTrue(goboard.has_legal_move(BLACK))
+        goboard.push_move(goboard.pt(1, 1), BLACK)
+        goboard.push_move(goboard.pt(1, 2), WHITE)
+        goboard.push_move(goboard.pt(2, 1), BLACK)
+        # the last point captures for both colors
+        self.assertFalse(goboard.has_legal_move(BLACK))
+        self.assertFalse(goboard.has_legal_move(WHITE))
+        goboard.pop_move()
+        self.assertTrue(goboard.has_legal_move(BLACK))
+
+    def test_hash(self):
+        goboard = SimpleGoBoard(5)
+        self.assertEqual(goboard.hash, 0)
+        goboard.push_move(goboard.pt(3, 3), BLACK)
+        self.assertNotEqual(goboard.hash, 0)
+        self.assertEqual(goboard.hash, goboard._compute_hash())
+        goboard.push_move(goboard.pt(3, 4), WHITE)
+        goboard.current_player = WHITE
+        self.assertEqual(goboard.hash, goboard._compute_hash())
+        other = SimpleGoBoard(5)
+        other.play_move(goboard.pt(3, 4), WHITE)
+        other.play_move(goboard.pt(3, 3), BLACK)
+        self.assertEqual(other.hash, goboard.hash)
+        self.assertEqual(goboard.copy().hash, goboard.hash)
+        goboard.current_player = BLACK
+        goboard.pop_move()
+        goboard.pop_move()
+        self.assertEqual(goboard.hash, 0)
+
+"""Main"""
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+#!/usr/local/bin/python3
+#/usr/bin/python3
+# Set the path to your python3 above
+
+import unittest
+import numpy as np
+import ucb
+from board_util import BLACK
+from simple_board import SimpleGoBoard
+from board_batch import BoardBatch
+
+class Player(object):
+    """ What runBatch needs of a player """
+    def __init__(self, num_sim):
+        self.num_sim = num_sim
+        self.best_move = None
+
+    def get_endgame_db(self, size):
+        return None
+
+class RunBatchTestCase(unittest.TestCase):
+    """Tests for ucb.runBatch"""
+
+    def test_best_move(self):
+        goboard = SimpleGoBoard(5)
+        moves = goboard.get_legal_moves(BLACK)
+        player = Player(10)
+        best = ucb.runBatch(player, goboard, moves, BLACK)
+        self.assertIn(best, moves)
+        self.assertEqual(player.best_move, best)
+
+    def test_best_move_after_each_round(self):
+        # a time limit stopping the search in the second round
+        # leaves the best move of the first round
+        goboard = SimpleGoBoard(3)
+        moves = goboard.get_legal_moves(BLACK)
+        player = Player(8)
+        playout = BoardBatch.playout
+        calls = []
+        def first_round_only(batch, weights = None, endgame_db = None):
+            calls.append(batch.n)
+            if len(calls) > 1:
+                raise Exception("unknown")
+            # only the last move wins
+            winners = np.full(batch.n, BLACK + 1, dtype = np.int8)
+            winners[-batch.n // len(moves):] = BLACK
+            return winners
+        BoardBatch.playout = first_round_only
+        try:
+            with self.assertRaises(Exception):
+                ucb.runBatch(player, goboard, moves, BLACK, rounds = 4)
+        finally:
+            BoardBatch.playout = playout
+        self.assertEqual(calls[0], 2 * len(moves))
+        self.assertEqual(player.best_move, moves[-1])
+
+"""Main"""
+if __name__ == '__main__':
+    unittest.main()
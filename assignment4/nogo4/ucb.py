@@ -5,9 +5,13 @@
 from math import log,sqrt
 import sys
 from gtp_connection import point_to_coord, format_point
+from board_batch import BoardBatch
 
 INFINITY = float('inf')
 
+# Number of rounds of simulations in runBatch
+BATCH_ROUNDS = 4
+
 def mean(stats, i):
     return stats[i][0] / stats[i][1]
     
@@ -82,3 +86,39 @@ def runUcb(player, board, C, moves, toplay):
     writeMoves(board, moves, stats)
     return best
 
+
+def bestMean(stats): # Highest win rate
+    best = -1
+    bestScore = -INFINITY
+    for i in range(len(stats)):
+        if stats[i][1] > 0 and mean(stats, i) > bestScore:
+            bestScore = mean(stats, i)
+            best = i
+    assert best != -1
+    return best
+
+def runBatch(player, board, moves, toplay, weights = None,
+             rounds = BATCH_ROUNDS):
+    # player.num_sim simulations of each move are played in rounds,
+    # all moves of a round together in one BoardBatch, so there is
+    # no UCB selection between the arms.
+    # After each round player.best_move is the best move so far,
+    # for a search stopped by the time limit.
+    player.best_move = moves[0]
+    endgame_db = player.get_endgame_db(board.size)
+    stats = [[0, 0] for _ in moves]
+    done = 0
+    for r in range(rounds):
+        num_sim = player.num_sim * (r + 1) // rounds - done
+        if num_sim == 0:
+            continue
+        batch = BoardBatch.for_moves(board, moves, toplay, num_sim)
+        winners = batch.playout(weights, endgame_db)
+        wins = (winners == toplay).reshape(len(moves), num_sim)
+        for i, w in enumerate(wins.sum(axis = 1)):
+            stats[i][0] += int(w)
+            stats[i][1] += num_sim
+        done += num_sim
+        player.best_move = moves[bestMean(stats)]
+    writeMoves(board, moves, stats)
+    return player.best_move
@@ -58,16 +58,17 @@ class Go3():
         """
         Run a simulate game for a given move.
         """
-        cboard = board.copy()
-        cboard.play_move(move, toplay)
+        board.push_move(move, toplay)
         opp = GoBoardUtil.opponent(toplay)
-        return PatternUtil.playGame(cboard,
-                                    opp,
-                                    komi=self.komi,
-                                    limit=self.limit,
-                                    random_simulation = self.random_simulation,
-                                    use_pattern = self.use_pattern,
-                                    check_selfatari = self.check_selfatari)
+        winner = PatternUtil.playGame(board,
+                                      opp,
+                                      komi=self.komi,
+                                      limit=self.limit,
+                                      random_simulation = self.random_simulation,
+                                      use_pattern = self.use_pattern,
+                                      check_selfatari = self.check_selfatari)
+        board.pop_move()
+        return winner
     
     def simulateMove(self, board, move, toplay):
         """
@@ -103,11 +103,11 @@ class PatternUtil(object):
         max_old_liberty = PatternUtil.blocks_max_liberty(board, move, color, 2)
         if max_old_liberty > 2:
             return False
-        cboard = board.copy()
-        # swap out true board for simulation board, and try to play the move
-        isLegal = cboard.play_move(move, color)
+        # try the move on the board and take it back
+        isLegal = board.push_move(move, color)
         if isLegal:
-            new_liberty = cboard._liberty(move, color)
+            new_liberty = board._liberty(move, color)
+            board.pop_move()
             if new_liberty==1:
                 return True
         return False
@@ -163,6 +163,8 @@ class PatternUtil(object):
     def playGame(board, color, **kwargs):
         """
         Run a simulation game according to give parameters.
+        The moves are played with push_move and taken back before
+        returning, so board is unchanged.
         """
         komi = kwargs.pop('komi', 0)
         limit = kwargs.pop('limit', 1000)
@@ -172,13 +174,17 @@ class PatternUtil(object):
         if kwargs:
             raise TypeError('Unexpected **kwargs: %r' % kwargs)
         nuPasses = 0
+        numMoves = 0
         for _ in range(limit):
             color = board.current_player
             if random_simulation:
                 move = GoBoardUtil.generate_random_move(board,color,True)
             else:
                 move = PatternUtil.generate_move_with_filter(board,use_pattern,check_selfatari)
-            board.play_move(move, color)
+            if not board.push_move(move, color):
+                # not played, nothing to take back
+                continue
+            numMoves += 1
             if move == PASS:
                 nuPasses += 1
             else:
@@ -187,4 +193,6 @@ class PatternUtil(object):
                 break
         print('limit:', limit, 'random:', random_simulation,'\nuse_pattern:', use_pattern, 'check_selfatari:', check_selfatari, 'nuPasses:', nuPasses)
         winner,_ = board.score(komi)
+        for _ in range(numMoves):
+            board.pop_move()
         return winner
@@ -0,0 +1,102 @@
+#!/usr/local/bin/python3
+#/usr/bin/python3
+# Set the path to your python3 above
+
+"""
+Benchmark for the end of a playout: SimpleGoBoard.score on the final
+positions of random games, compared with the old scorer which did a
+full-board connected_component call for each empty region and
+checked "point in counted" on a Python list.
+"""
+
+import time
+import numpy as np
+import random
+from board_util import BLACK, WHITE, BORDER, PASS, GoBoardUtil, \
+                       coord_to_point, where1d
+from simple_board import SimpleGoBoard
+
+def old_score(board, komi):
+    """ The previous SimpleGoBoard.score, for comparison """
+    black_score = 0
+    white_score = komi
+    counted = []
+    for x in range(1, board.size+1):
+        for y in range(1, board.size+1):
+            point = coord_to_point(x,y, board.size)
+            if point in counted:
+                continue
+            color = board.get_color(point)
+            assert color != BORDER
+            if color == BLACK:
+                black_score += 1
+                continue
+            if color == WHITE:
+                white_score += 1
+                continue
+            empty_block = where1d(board.connected_component(point))
+            black_flag = False
+            white_flag = False
+            for p in empty_block:
+                counted.append(p)
+                p_neighbors = board._neighbors(p)
+                found_black = board.board[p_neighbors]==BLACK
+                found_white = board.board[p_neighbors]==WHITE
+                if found_black.any():
+                    black_flag = True
+                if found_white.any():
+                    white_flag = True
+                if black_flag and white_flag:
+                    break
+            if black_flag and not white_flag:
+                black_score += len(empty_block)
+            if white_flag and not black_flag:
+                white_score += len(empty_block)
+
+    if black_score > white_score:
+        return BLACK, black_score-white_score
+    if white_score > black_score:
+        return WHITE, white_score-black_score
+    return None, 0
+
+def final_positions(size, num_games, limit = 100):
+    """
+    Final positions of random games, played as in PatternUtil.playGame.
+    Positions are taken after 0, limit/4, limit/2 and limit moves,
+    so the benchmark also covers boards with large empty regions.
+    """
+    positions = []
+    for _ in range(num_games):
+        board = SimpleGoBoard(size)
+        nuPasses = 0
+        for i in range(limit + 1):
+            if i in (0, limit // 4, limit // 2, limit) or nuPasses >= 2:
+                positions.append(board.copy())
+                if nuPasses >= 2:
+                    break
+            color = board.current_player
+            move = GoBoardUtil.generate_random_move(board, color, True)
+            board.play_move(move, color)
+            nuPasses = nuPasses + 1 if move == PASS else 0
+    return positions
+
+def time_per_call(score, positions, komi):
+    start = time.time()
+    for board in positions:
+        score(board, komi)
+    return (time.time() - start) / len(positions)
+
+def benchmark(size = 7, num_games = 50, komi = 6.5):
+    positions = final_positions(size, num_games)
+    for board in positions:
+        assert board.score(komi) == old_score(board, komi)
+    old = time_per_call(old_score, positions, komi)
+    new = time_per_call(SimpleGoBoard.score, positions, komi)
+    print("{}x{}, {} positions: old score {:.1f}us, score {:.1f}us, "
+          "{:.1f}x faster".format(size, size, len(positions),
+                                  old * 1e6, new * 1e6, old / new))
+
+random.seed(1)
+np.random.seed(1)
+for size in (5, 7, 9):
+    benchmark(size)
@@ -12,7 +12,7 @@ The board uses a 1-dimensional representation with padding
 import numpy as np
 from board_util import GoBoardUtil, BLACK, WHITE, EMPTY, BORDER, \
                        PASS, is_black_white, is_black_white_empty, coord_to_point, where1d, \
-                       MAXSIZE, NULLPOINT
+                       MAXSIZE, NULLPOINT, get_geometry
 
 class SimpleGoBoard(object):
 
@@ -35,34 +35,28 @@ class SimpleGoBoard(object):
         if point == self.ko_recapture:
             return False
             
-        # General case: detect captures, suicide
+        # General case: a move is legal if the new stone has a liberty,
+        # captures an opponent block, or connects to a block of its own
+        # color which keeps a liberty. No stone is placed on the board.
         opp_color = GoBoardUtil.opponent(color)
-        self.board[point] = color
-        legal = True
-        has_capture = self._detect_captures(point, opp_color)
-        if not has_capture and not self._stone_has_liberty(point):
-            block = self._block_of(point)
-            if not self._has_liberty(block): # suicide
-                legal = False
-        self.board[point] = EMPTY
-        return legal
-
-    def _detect_captures(self, point, opp_color):
-        """
-        Did move on point capture something?
-        """
-        neighbors = self._neighbors(point)
-        for nb in self.neighbors_of_color(point, opp_color):
-            if self._detect_capture(nb):
+        for nb in self.neighbors[point]:
+            nb_color = self.board[nb]
+            if nb_color == EMPTY:
+                return True
+            elif nb_color == opp_color:
+                if self._detect_capture(nb, point):
+                    return True
+            elif self._has_liberty(nb, point):
                 return True
-        return False
+        return False # suicide
 
     def get_empty_points(self):
         """
         Return:
-            The empty points on the board
+            The empty points on the board, as a new array.
+            The order is arbitrary, it changes as moves are played.
         """
-        return where1d(self.board == EMPTY)
+        return self.empty_points[:self.num_empty].copy()
 
     def __init__(self, size):
         """
@@ -77,27 +71,45 @@ class SimpleGoBoard(object):
         The board is stored as a one-dimensional array
         See GoBoardUtil.coord_to_point for explanations of the array encoding
         """
+        self.geometry = get_geometry(size)
         self.size = size
         self.NS = size + 1
         self.WE = 1
         self.ko_recapture = None
         self.current_player = BLACK
-        self.maxpoint = size * size + 3 * (size + 1)
-        self.board = np.full(self.maxpoint, BORDER, dtype = np.int32)
-        self.liberty_of = np.full(self.maxpoint, NULLPOINT, dtype = np.int32)
-        self._initialize_empty_points(self.board)
-        self._initialize_neighbors()
+        self.maxpoint = self.geometry.maxpoint
+        self.board = np.copy(self.geometry.empty_board)
+        self.neighbors = self.geometry.neighbors
+        self._initialize_blocks()
+        self._initialize_empty_points()
         self.last_move = None
         self.last2_move = None
 
     def copy(self):
-        b = SimpleGoBoard(self.size)
-        assert b.NS == self.NS
-        assert b.WE == self.WE
+        """
+        Copy of the board. The geometry tables are shared,
+        only the position is copied. The move stack is not copied.
+        """
+        b = SimpleGoBoard.__new__(SimpleGoBoard)
+        b.geometry = self.geometry
+        b.size = self.size
+        b.NS = self.NS
+        b.WE = self.WE
         b.ko_recapture = self.ko_recapture
         b.current_player = self.current_player
-        assert b.maxpoint == self.maxpoint
+        b.maxpoint = self.maxpoint
         b.board = np.copy(self.board)
+        b.neighbors = self.neighbors
+        b.anchor = np.copy(self.anchor)
+        b.block_stones = {a: list(stones)
+                          for a, stones in self.block_stones.items()}
+        b.block_libs = {a: set(libs) for a, libs in self.block_libs.items()}
+        b.move_stack = []
+        b.empty_points = np.copy(self.empty_points)
+        b.empty_index = np.copy(self.empty_index)
+        b.num_empty = self.num_empty
+        b.last_move = None
+        b.last2_move = None
         return b
 
     def row_start(self, row):
@@ -105,36 +117,56 @@ class SimpleGoBoard(object):
         assert row <= self.size
         return row * self.NS + 1
         
-    def _initialize_empty_points(self, board):
+    def _initialize_empty_points(self):
         """
-        Fills points on the board with EMPTY
-        Argument
-        ---------
-        board: numpy array, filled with BORDER
-        """
-        for row in range(1, self.size + 1):
-            start = self.row_start(row)
-            board[start : start + self.size] = EMPTY
-
-    def _on_board_neighbors(self, point):
-        nbs = []
-        for nb in self._neighbors(point):
-            if self.board[nb] != BORDER:
-                nbs.append(nb)
-        return nbs
-            
-    def _initialize_neighbors(self):
+        The empty points are kept in the first num_empty entries of
+        the empty_points array, in arbitrary order.
+        empty_index[point] is the position of point in empty_points.
+        Points are removed by moving the last empty point into their place,
+        so adding and removing an empty point is O(1).
         """
-        precompute neighbor array.
-        For each point on the board, store its list of on-the-board neighbors
+        self.empty_points = np.copy(self.geometry.points)
+        self.empty_index = np.copy(self.geometry.point_index)
+        self.num_empty = len(self.empty_points)
+
+    def _add_empty_point(self, point):
+        self.empty_points[self.num_empty] = point
+        self.empty_index[point] = self.num_empty
+        self.num_empty += 1
+
+    def _remove_empty_point(self, point):
+        self.num_empty -= 1
+        last = self.empty_points[self.num_empty]
+        i = self.empty_index[point]
+        self.empty_points[i] = last
+        self.empty_index[last] = i
+
+    def swap_empty_points(self, i, j):
         """
-        self.neighbors = []
-        for point in range(self.maxpoint):
-            if self.board[point] == BORDER:
-                self.neighbors.append([])
-            else:
-                self.neighbors.append(self._on_board_neighbors(point))
-        
+        Exchange entries i and j of empty_points.
+        Lets move generators shuffle the empty points in place.
+        """
+        p = self.empty_points[i]
+        q = self.empty_points[j]
+        self.empty_points[i] = q
+        self.empty_points[j] = p
+        self.empty_index[q] = i
+        self.empty_index[p] = j
+
+    def _initialize_blocks(self):
+        """
+        Block (string) information, kept up to date by _add_stone,
+        _remove_block and their inverses used by pop_move.
+        anchor[stone] is the representative point of the block of stone,
+        NULLPOINT for points without a stone.
+        block_stones[anchor] is the list of stones in the block,
+        block_libs[anchor] the set of its liberties.
+        """
+        self.anchor = np.full(self.maxpoint, NULLPOINT, dtype = np.int32)
+        self.block_stones = {}
+        self.block_libs = {}
+        self.move_stack = []
+
     def is_eye(self, point, color):
         """
         Check if point is a simple eye for color
@@ -166,31 +198,19 @@ class SimpleGoBoard(object):
         lib = self.find_neighbor_of_color(stone, EMPTY)
         return lib != None
 
-    def _get_liberty(self, block):
+    def _block_liberties(self, stone):
         """
-        Find any liberty of the given block.
-        Returns None in case there is no liberty.
-        block is a numpy boolean array
+        The set of liberties of the block containing stone.
+        Maintained incrementally, do not modify.
         """
-        for stone in where1d(block):
-            lib = self.find_neighbor_of_color(stone, EMPTY)
-            if lib != None:
-                return lib
-        return None
-    
-    def _has_liberty(self, block):
+        return self.block_libs[self.anchor[stone]]
+
+    def _has_liberty(self, stone, point):
         """
-        Check if the given block has any liberty.
-        Also updates the liberty_of array.
-        block is a numpy boolean array
+        Check if the block of stone has a liberty other than point.
         """
-        lib = self._get_liberty(block)
-        if lib != None:
-            assert self.get_color(lib) == EMPTY
-            for stone in where1d(block):
-                self.liberty_of[stone] = lib
-            return True
-        return False
+        libs = self._block_liberties(stone)
+        return len(libs) > 1 or point not in libs
 
     def _block_of(self, stone):
         """
@@ -200,7 +220,9 @@ class SimpleGoBoard(object):
         """
         color = self.get_color(stone)
         assert is_black_white(color)
-        return self.connected_component(stone)
+        marker = np.full(self.maxpoint, False, dtype = bool)
+        marker[self.block_stones[self.anchor[stone]]] = True
+        return marker
     
     def connected_component(self, point):
         """
@@ -237,78 +259,184 @@ class SimpleGoBoard(object):
         last liberty for the point
         """
         assert color == self.get_color(point)
-        group_points = [point]
-        liberty = 0
-        met_points = [point]
-        while group_points:
-            p=group_points.pop()
-            met_points.append(p)
-            neighbors = self.neighbors[p]
-            for n in neighbors:
-                if n not in met_points:
-                    assert self.board[n] != BORDER
-                    if self.board[n] == color:
-                        group_points.append(n)
-                    elif self.board[n]==EMPTY:
-                        liberty += 1
-                        single_lib_point = n
-                    met_points.append(n)
-        if liberty == 1:
-            return liberty, single_lib_point
-        return liberty, None
-
-    def _fast_liberty_check(self, nb_point):
-        lib = self.liberty_of[nb_point]
-        if lib != NULLPOINT and self.get_color(lib) == EMPTY:
-            return True # quick exit, block has a liberty  
-        if self._stone_has_liberty(nb_point):
-            return True # quick exit, no need to look at whole block
-        return False
-        
-    def _detect_capture(self, nb_point):
+        libs = self._block_liberties(point)
+        if len(libs) == 1:
+            return 1, next(iter(libs))
+        return len(libs), None
+
+    def _detect_capture(self, nb_point, point):
         """
-        Check whether opponent block on nb_point is captured.
-        If no, return None.
-        If yes, return the captured block
+        Check whether opponent block on nb_point would be captured
+        by a stone played on point.
+        Returns boolean.
         """
-        if self._fast_liberty_check(nb_point):
-            return False
-        opp_block = self._block_of(nb_point)
-        return not self._has_liberty(opp_block)
-    
-    def _detect_and_process_capture(self, nb_point):
-        """
-        Check whether opponent block on nb_point is captured.
-        If yes, remove the stones.
-        Returns the stone if only a single stone was captured,
-            and returns None otherwise.
-        This result is used in play_move to check for possible ko
-        """
-        if self._fast_liberty_check(nb_point):
-            return None
-        opp_block = self._block_of(nb_point)
-        if self._has_liberty(opp_block):
-            return None
-        captures = list(where1d(opp_block))
-        self.board[captures] = EMPTY
-        self.liberty_of[captures] = NULLPOINT
-        single_capture = None 
-        if len(captures) == 1:
-            single_capture = nb_point
-        return single_capture
+        return not self._has_liberty(nb_point, point)
+
+    def _add_stone(self, point, color, keep_undo = False):
+        """
+        Put a stone of color on the empty point and update the blocks:
+        remove point from the liberties of all neighboring blocks and
+        merge the new stone with its neighboring blocks of the same color.
+        Returns a pair (captured, undo). captured is the list of anchors
+        of opponent blocks left without liberties, which the caller must
+        remove. If keep_undo is True, undo is the information
+        _remove_stone needs to restore the blocks, otherwise None.
+        """
+        self.board[point] = color
+        self._remove_empty_point(point)
+        new_libs = []
+        nb_anchors = []
+        touched = []
+        captured = []
+        for nb in self.neighbors[point]:
+            nb_color = self.board[nb]
+            if nb_color == EMPTY:
+                new_libs.append(nb)
+            else:
+                nb_anchor = self.anchor[nb]
+                if nb_anchor in touched:
+                    continue
+                touched.append(nb_anchor)
+                libs = self.block_libs[nb_anchor]
+                libs.discard(point)
+                if nb_color == color:
+                    nb_anchors.append(nb_anchor)
+                elif not libs:
+                    captured.append(nb_anchor)
+        if nb_anchors:
+            # merge into the largest neighboring block
+            anchor = max(nb_anchors, key = lambda a: len(self.block_stones[a]))
+        else:
+            anchor = point
+            self.block_stones[anchor] = []
+            self.block_libs[anchor] = set()
+        stones = self.block_stones[anchor]
+        libs = self.block_libs[anchor]
+        undo = None
+        if keep_undo:
+            undo = (anchor, len(stones), set(libs), [], touched)
+        for nb_anchor in nb_anchors:
+            if nb_anchor != anchor:
+                nb_stones = self.block_stones.pop(nb_anchor)
+                nb_libs = self.block_libs.pop(nb_anchor)
+                if keep_undo:
+                    undo[3].append((nb_anchor, nb_stones, nb_libs))
+                self.anchor[nb_stones] = anchor
+                stones.extend(nb_stones)
+                libs |= nb_libs
+        stones.append(point)
+        libs.update(new_libs)
+        self.anchor[point] = anchor
+        return captured, undo
+
+    def _remove_stone(self, point, undo):
+        """
+        Take back the stone on point added by _add_stone,
+        restoring the blocks from the undo information.
+        Captured blocks must have been restored before.
+        """
+        anchor, num_stones, libs, merged, touched = undo
+        self.board[point] = EMPTY
+        self.anchor[point] = NULLPOINT
+        self._add_empty_point(point)
+        if num_stones == 0:
+            del self.block_stones[anchor]
+            del self.block_libs[anchor]
+        else:
+            del self.block_stones[anchor][num_stones:]
+            self.block_libs[anchor] = libs
+        for nb_anchor, nb_stones, nb_libs in merged:
+            self.anchor[nb_stones] = nb_anchor
+            self.block_stones[nb_anchor] = nb_stones
+            self.block_libs[nb_anchor] = nb_libs
+        for nb_anchor in touched:
+            self.block_libs[nb_anchor].add(point)
+
+    def _remove_block(self, anchor):
+        """
+        Remove the captured block with the given anchor from the board.
+        Its stones become liberties of the neighboring blocks.
+        Returns the list of removed stones.
+        """
+        stones = self.block_stones.pop(anchor)
+        del self.block_libs[anchor]
+        self.board[stones] = EMPTY
+        self.anchor[stones] = NULLPOINT
+        for stone in stones:
+            self._add_empty_point(stone)
+            for nb in self.neighbors[stone]:
+                nb_anchor = self.anchor[nb]
+                if nb_anchor != NULLPOINT:
+                    self.block_libs[nb_anchor].add(stone)
+        return stones
+
+    def _restore_block(self, anchor, stones, color):
+        """
+        Put a block removed by _remove_block back on the board,
+        without liberties.
+        """
+        self.board[stones] = color
+        self.anchor[stones] = anchor
+        self.block_stones[anchor] = stones
+        self.block_libs[anchor] = set()
+        for stone in stones:
+            self._remove_empty_point(stone)
+            for nb in self.neighbors[stone]:
+                nb_anchor = self.anchor[nb]
+                if nb_anchor != NULLPOINT and nb_anchor != anchor:
+                    self.block_libs[nb_anchor].discard(stone)
 
     def play_move(self, point, color):
         """
         Play a move of color on point
         Returns boolean: whether move was legal
         """
+        return self._play_move(point, color, False)
+
+    def push_move(self, point, color):
+        """
+        Play a move of color on point like play_move, and record
+        the changes on the move stack so that pop_move can undo it.
+        Use this instead of copying the board in search and simulations.
+        Returns boolean: whether move was legal.
+        Illegal moves are not recorded.
+        """
+        return self._play_move(point, color, True)
+
+    def pop_move(self):
+        """
+        Undo the last move played by push_move, including its captures.
+        Returns the point of that move.
+        """
+        point, player, ko_recapture, last_move, last2_move, \
+            undo, captured = self.move_stack.pop()
+        if point != PASS:
+            opp_color = GoBoardUtil.opponent(self.board[point])
+            for anchor, stones in captured:
+                self._restore_block(anchor, stones, opp_color)
+            self._remove_stone(point, undo)
+        self.current_player = player
+        self.ko_recapture = ko_recapture
+        self.last_move = last_move
+        self.last2_move = last2_move
+        return point
+
+    def _play_move(self, point, color, keep_undo):
+        """
+        Implementation of play_move and push_move.
+        If keep_undo is True, a legal move is recorded on the move stack.
+        """
         assert is_black_white(color)
+        record = (point, self.current_player, self.ko_recapture,
+                  self.last_move, self.last2_move)
         # Special cases
         if point == PASS:
             self.ko_recapture = None
             self.current_player = GoBoardUtil.opponent(color)
             self.last2_move = self.last_move
             self.last_move = point
+            if keep_undo:
+                self.move_stack.append(record + (None, []))
             return True
         elif self.board[point] != EMPTY:
             return False
@@ -316,28 +444,26 @@ class SimpleGoBoard(object):
             return False
             
         # General case: deal with captures, suicide, and next ko point
+        if not self.is_legal(point, color): # suicide
+            return False
         opp_color = GoBoardUtil.opponent(color)
         in_enemy_eye = self._is_surrounded(point, opp_color)
-        self.board[point] = color
         single_captures = []
-        neighbors = self.neighbors[point]
-        for nb in neighbors:
-            if self.board[nb] == opp_color:
-                single_capture = self._detect_and_process_capture(nb)
-                if single_capture != None:
-                    single_captures.append(single_capture)
-        if not self._stone_has_liberty(point):
-            # check suicide of whole block
-            block = self._block_of(point)
-            if not self._has_liberty(block): # undo suicide move
-                self.board[point] = EMPTY
-                return False
+        captured_blocks = []
+        captured, undo = self._add_stone(point, color, keep_undo)
+        for anchor in captured:
+            captures = self._remove_block(anchor)
+            captured_blocks.append((anchor, captures))
+            if len(captures) == 1:
+                single_captures.append(captures[0])
         self.ko_recapture = None
         if in_enemy_eye and len(single_captures) == 1:
             self.ko_recapture = single_captures[0]
         self.current_player = GoBoardUtil.opponent(color)
         self.last2_move = self.last_move
         self.last_move = point
+        if keep_undo:
+            self.move_stack.append(record + (undo, captured_blocks))
         return True
 
     def neighbors_of_color(self, point, color):
@@ -383,41 +509,39 @@ class SimpleGoBoard(object):
         return nb_list
 
     def score(self, komi):
-        """ Score """
-        black_score = 0
-        white_score = komi
-        counted = []
-        for x in range(1, self.size+1):
-            for y in range(1, self.size+1):
-                point = coord_to_point(x,y, self.size)
-                if point in counted:
-                    continue
-                color = self.get_color(point)
-                assert color != BORDER
-                if color == BLACK:
-                    black_score += 1
-                    continue
-                if color == WHITE:
-                    white_score += 1
-                    continue
-                empty_block = where1d(self.connected_component(point))
-                black_flag = False
-                white_flag = False
-                for p in empty_block:
-                    counted.append(p)
-                    p_neighbors = self._neighbors(p)
-                    found_black = self.board[p_neighbors]==BLACK
-                    found_white = self.board[p_neighbors]==WHITE
-                    if found_black.any():
-                        black_flag = True
-                    if found_white.any():
-                        white_flag = True
-                    if black_flag and white_flag:
-                        break
-                if black_flag and not white_flag:
-                    black_score += len(empty_block)
-                if white_flag and not black_flag:
-                    white_score += len(empty_block)
+        """
+        Area score: stones, plus empty regions that touch
+        stones of only one color.
+        Each empty region is found once by a flood fill over the
+        neighbor lists, so the cost is linear in the board size.
+        Returns (winner, margin), winner is None for a tie.
+        """
+        colors = self.board.tolist()
+        neighbors = self.neighbors
+        black_score = colors.count(BLACK)
+        white_score = komi + colors.count(WHITE)
+        visited = bytearray(self.maxpoint)
+        for point in self.empty_points[:self.num_empty].tolist():
+            if visited[point]:
+                continue
+            visited[point] = 1
+            region = [point]
+            border = EMPTY # BLACK | WHITE once both colors are reached
+            i = 0
+            while i < len(region):
+                for nb in neighbors[region[i]]:
+                    color = colors[nb]
+                    if color == EMPTY:
+                        if not visited[nb]:
+                            visited[nb] = 1
+                            region.append(nb)
+                    else:
+                        border |= color
+                i += 1
+            if border == BLACK:
+                black_score += len(region)
+            elif border == WHITE:
+                white_score += len(region)
 
         if black_score > white_score:
             return BLACK, black_score-white_score
@@ -425,5 +549,4 @@ class SimpleGoBoard(object):
         if white_score > black_score:
             return WHITE, white_score-black_score
 
-        if black_score == white_score:
-            return None, 0
+        return None, 0
@@ -0,0 +1,33 @@
+#!/usr/local/bin/python3
+#/usr/bin/python3
+# Set the path to your python3 above
+
+import unittest
+from board_util import GoBoardUtil, BLACK, WHITE, PASS
+from simple_board import SimpleGoBoard
+from pattern_util import PatternUtil
+
+class PatternUtilTestCase(unittest.TestCase):
+    """Tests for pattern_util.py"""
+
+    def test_play_game_restores_board(self):
+        goboard = SimpleGoBoard(3)
+        goboard.push_move(goboard.pt(2, 2), BLACK)
+        before = goboard.board.copy()
+        # an illegal move on the occupied b2, then passes
+        moves = [goboard.pt(2, 2)]
+        generate = GoBoardUtil.__dict__['generate_random_move']
+        GoBoardUtil.generate_random_move = staticmethod(
+            lambda board, color, use_eye_filter:
+                moves.pop() if moves else PASS)
+        try:
+            PatternUtil.playGame(goboard, WHITE, komi = 0.5)
+        finally:
+            GoBoardUtil.generate_random_move = generate
+        self.assertEqual(list(goboard.board), list(before))
+        self.assertEqual(len(goboard.move_stack), 1)
+        self.assertEqual(goboard.current_player, WHITE)
+
+"""Main"""
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/local/bin/python3
+#/usr/bin/python3
+# Set the path to your python3 above
+
+import unittest
+from board_util import BLACK, WHITE, EMPTY, PASS
+from simple_board import SimpleGoBoard
+
+class SimpleGoBoardTestCase(unittest.TestCase):
+    """Tests for simple_board.py"""
+
+    def test_capture_updates_liberties(self):
+        goboard = SimpleGoBoard(3)
+        goboard.play_move(goboard.pt(1, 2), BLACK)
+        goboard.play_move(goboard.pt(1, 1), WHITE)
+        self.assertEqual(goboard._liberty(goboard.pt(1, 1), WHITE), 1)
+        goboard.play_move(goboard.pt(2, 1), BLACK)
+        self.assertEqual(goboard.get_color(goboard.pt(1, 1)), EMPTY)
+        self.assertEqual(goboard._liberty(goboard.pt(1, 2), BLACK), 3)
+        self.assertEqual(goboard._liberty(goboard.pt(2, 1), BLACK), 3)
+
+    def test_ko(self):
+        goboard = SimpleGoBoard(4)
+        for move, color in [((1, 2), BLACK), ((1, 3), WHITE),
+                            ((2, 1), BLACK), ((2, 4), WHITE),
+                            ((3, 2), BLACK), ((3, 3), WHITE),
+                            ((2, 3), BLACK), ((2, 2), WHITE)]:
+            self.assertTrue(goboard.play_move(goboard.pt(*move), color))
+        # white captured the black stone on c2, black cannot retake
+        self.assertEqual(goboard.get_color(goboard.pt(2, 3)), EMPTY)
+        self.assertEqual(goboard.ko_recapture, goboard.pt(2, 3))
+        self.assertFalse(goboard.is_legal(goboard.pt(2, 3), BLACK))
+        goboard.play_move(PASS, BLACK)
+        self.assertTrue(goboard.is_legal(goboard.pt(2, 3), BLACK))
+
+    def test_suicide(self):
+        goboard = SimpleGoBoard(3)
+        goboard.play_move(goboard.pt(1, 2), BLACK)
+        goboard.play_move(goboard.pt(3, 3), WHITE)
+        goboard.play_move(goboard.pt(2, 1), BLACK)
+        self.assertFalse(goboard.is_legal(goboard.pt(1, 1), WHITE))
+        self.assertFalse(goboard.play_move(goboard.pt(1, 1), WHITE))
+
+    def test_pop_move_restores_capture(self):
+        goboard = SimpleGoBoard(3)
+        goboard.play_move(goboard.pt(1, 2), BLACK)
+        goboard.play_move(goboard.pt(1, 1), WHITE)
+        board_before = goboard.board.copy()
+        self.assertTrue(goboard.push_move(goboard.pt(2, 1), BLACK))
+        self.assertEqual(goboard.get_color(goboard.pt(1, 1)), EMPTY)
+        self.assertTrue(goboard.push_move(PASS, WHITE))
+        self.assertEqual(goboard.pop_move(), PASS)
+        self.assertEqual(goboard.pop_move(), goboard.pt(2, 1))
+        self.assertTrue((goboard.board == board_before).all())
+        self.assertEqual(goboard.current_player, BLACK)
+        self.assertEqual(goboard.last_move, goboard.pt(1, 1))
+        self.assertEqual(goboard._liberty(goboard.pt(1, 1), WHITE), 1)
+        self.assertEqual(goboard._liberty(goboard.pt(1, 2), BLACK), 2)
+
+    def test_score(self):
+        goboard = SimpleGoBoard(4)
+        self.assertEqual(goboard.score(0), (None, 0))
+        self.assertEqual(goboard.score(0.5), (WHITE, 0.5))
+        # black wall on column 2, white stone on d4
+        for row in range(1, 5):
+            goboard.play_move(goboard.pt(row, 2), BLACK)
+        goboard.play_move(goboard.pt(4, 4), WHITE)
+        # black: 4 stones and the 4 points of column 1,
+        # the 7 points on the right are shared
+        self.assertEqual(goboard.score(6.5), (BLACK, 0.5))
+        self.assertEqual(goboard.score(7), (None, 0))
+        self.assertEqual(goboard.score(7.5), (WHITE, 0.5))
+
+"""Main"""
+if __name__ == '__main__':
+    unittest.main()